@@ -1,3 +1,3 @@
 """Module exposure."""
 
-__all__ = ["churchtools_api"]
+__all__ = ["churchtools_api", "churchtools_api_async"]
@@ -0,0 +1,254 @@
+"""module containing execution of many ChurchToolsApi calls at once.
+
+Usage:
+    with api.batch(max_workers=4) as batch:
+        for song_id in song_ids:
+            batch.add_tag("song", song_id, "imported", retry=True)
+    failed = batch.failed
+"""
+
+import logging
+from dataclasses import dataclass
+from time import sleep
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+import requests
+
+if TYPE_CHECKING:
+    from churchtools_api.churchtools_api import ChurchToolsApi
+
+logger = logging.getLogger(__name__)
+
+# errors which are usually resolved by repeating the request
+TRANSIENT_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+# status codes of server errors which are usually resolved by repeating the request
+TRANSIENT_STATUS_CODES = (
+    requests.codes.bad_gateway,
+    requests.codes.service_unavailable,
+    requests.codes.gateway_timeout,
+)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one queued operation."""
+
+    index: int
+    method: str
+    args: tuple
+    kwargs: dict
+    result: object = None
+    error: Exception | None = None
+    attempts: int = 0
+    retry: bool | None = None
+
+    @property
+    def ok(self) -> bool:
+        """If the operation succeeded - failed requests return None or False."""
+        if self.error is not None:
+            return False
+        return self.result is not None and self.result is not False
+
+
+class Batch:
+    """Queue of ChurchToolsApi calls which are executed together.
+
+    Every public method of ChurchToolsApi can be queued by calling it on the batch
+    e.g. batch.add_group_member(group_id=1, person_id=2).
+    Operations are executed in no specific order using max_workers concurrent
+    requests which share the rate limit of the session.
+    Transient network errors and operations failing because of a server error
+    (502, 503, 504) are retried, any other exception is recorded
+    for the operation without stopping the others.
+    Operations which sent non idempotent requests e.g. POST are only retried
+    if queued with retry=True because the first attempt might have succeeded.
+    """
+
+    def __init__(
+        self,
+        api: "ChurchToolsApi",
+        *,
+        max_workers: int | None = None,
+        max_attempts: int = 3,
+        backoff_base: float = 1.0,
+    ) -> None:
+        """Init of an empty batch.
+
+        Args:
+            api: the logged in ChurchToolsApi used for all operations
+            max_workers: number of concurrent requests. Defaults to api.max_workers
+            max_attempts: number of executions of an operation with transient errors
+            backoff_base: seconds waited before the first repetition - doubled
+                for each further repetition
+        """
+        self.api = api
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.results: list[BatchResult] = []
+        self._executed = False
+
+    def add(
+        self, method: str, *args: list, retry: bool | None = None, **kwargs: dict
+    ) -> BatchResult:
+        """Queues a call of a ChurchToolsApi method.
+
+        Args:
+            method: name of the method e.g. "add_tag"
+            args: positional arguments passthrough
+            retry: repeat on transient errors. Defaults to None which only repeats
+                operations without non idempotent requests e.g. POST
+            kwargs: keyword arguments passthrough
+
+        Returns:
+            result which is filled once executed
+        """
+        if method.startswith("_") or not callable(getattr(self.api, method, None)):
+            msg = f"ChurchToolsApi has no method {method}"
+            raise AttributeError(msg)
+        if self._executed:
+            msg = "batch was already executed"
+            raise RuntimeError(msg)
+        batch_result = BatchResult(
+            index=len(self.results),
+            method=method,
+            args=args,
+            kwargs=kwargs,
+            retry=retry,
+        )
+        self.results.append(batch_result)
+        return batch_result
+
+    def __getattr__(self, name: str) -> object:
+        """Queues calls of ChurchToolsApi methods e.g. batch.add_tag(...)."""
+        if name.startswith("_") or not callable(getattr(self.api, name, None)):
+            msg = f"{type(self).__name__} has no attribute {name}"
+            raise AttributeError(msg)
+        return lambda *args, **kwargs: self.add(name, *args, **kwargs)
+
+    def __enter__(self) -> "Batch":
+        """Returns the batch used to queue operations."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Executes all queued operations unless an exception occurred."""
+        if exc_type is None:
+            self.execute()
+
+    def execute(self) -> list[BatchResult]:
+        """Executes all queued operations.
+
+        Returns:
+            one result per queued operation in queued order
+        """
+        self._executed = True
+        self.api._map_concurrently(  # noqa: SLF001
+            self._execute_operation, self.results, max_workers=self.max_workers
+        )
+        logger.info(
+            "batch executed %s operations - %s failed",
+            len(self.results),
+            len(self.failed),
+        )
+        return self.results
+
+    @property
+    def failed(self) -> list[BatchResult]:
+        """Results of all operations which did not succeed."""
+        return [result for result in self.results if not result.ok]
+
+    def _execute_operation(self, batch_result: BatchResult) -> BatchResult:
+        """Helper which executes one operation and retries transient errors.
+
+        Args:
+            batch_result: queued operation which is updated with the outcome
+
+        Returns:
+            the updated batch_result
+        """
+        method = getattr(self.api, batch_result.method)
+        while True:
+            batch_result.attempts += 1
+            response_count = getattr(self.api.session, "response_count", 0)
+            non_idempotent_count = getattr(self.api.session, "non_idempotent_count", 0)
+            try:
+                batch_result.result = method(*batch_result.args, **batch_result.kwargs)
+                batch_result.error = None
+            except Exception as error:  # noqa: BLE001 - recorded for the operation
+                batch_result.error = error
+
+            reason = self._get_transient_failure(batch_result, response_count)
+            if reason is None:
+                if batch_result.error is not None:
+                    logger.error(
+                        "%s failed", batch_result.method, exc_info=batch_result.error
+                    )
+                break
+            if not self._may_repeat(batch_result, non_idempotent_count):
+                logger.warning(
+                    "%s failed with %s - not repeated", batch_result.method, reason
+                )
+                break
+            if batch_result.attempts >= self.max_attempts:
+                break
+            delay = self.backoff_base * 2 ** (batch_result.attempts - 1)
+            logger.info(
+                "%s failed with %s - repeating in %.1f sec",
+                batch_result.method,
+                reason,
+                delay,
+            )
+            sleep(delay)
+        return batch_result
+
+    def _get_transient_failure(
+        self, batch_result: BatchResult, response_count: int
+    ) -> str | None:
+        """Helper which checks if repeating a failed operation might succeed.
+
+        Args:
+            batch_result: outcome of the latest attempt
+            response_count: responses received by the current thread before it
+
+        Returns:
+            the network error or server error status - None if not transient
+        """
+        if isinstance(batch_result.error, TRANSIENT_ERRORS):
+            return str(batch_result.error)
+        if batch_result.ok:
+            return None
+        session = self.api.session
+        if (
+            getattr(session, "response_count", 0) > response_count
+            and session.last_status_code in TRANSIENT_STATUS_CODES
+        ):
+            return f"status {session.last_status_code}"
+        return None
+
+    def _may_repeat(self, batch_result: BatchResult, non_idempotent_count: int) -> bool:
+        """Helper which checks if a failed operation may be executed again.
+
+        Args:
+            batch_result: outcome of the latest attempt
+            non_idempotent_count: non idempotent requests sent by the current thread
+                before it
+
+        Returns:
+            retry of the operation if specified - otherwise if the latest attempt
+                did not send any non idempotent request
+        """
+        if batch_result.retry is not None:
+            return batch_result.retry
+        return (
+            getattr(self.api.session, "non_idempotent_count", 0) == non_idempotent_count
+        )
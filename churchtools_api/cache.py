@@ -0,0 +1,160 @@
+"""module containing caches used for rarely changing data like masterdata."""
+
+import copy
+import functools
+import logging
+import shelve
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from time import time
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """In memory least recently used cache with a time to live for each entry.
+
+    Keys are strings starting with the name of the cached method
+    which allows invalidation of all entries of one method by prefix.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300) -> None:
+        """Init of an empty cache.
+
+        Args:
+            maxsize: maximum number of entries. Defaults to 256
+            ttl: seconds an entry is valid. Defaults to 300
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+
+    def get(self, key: str, default: object = None) -> object:
+        """Retrieve an entry if not expired.
+
+        Args:
+            key: identifier of the entry
+            default: value returned if not available. Defaults to None
+
+        Returns:
+            cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires < time():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: object, ttl: float | None = None) -> None:
+        """Store an entry and evict the least recently used ones if full.
+
+        Args:
+            key: identifier of the entry
+            value: the value to store
+            ttl: seconds the entry is valid. Defaults to ttl of the cache
+        """
+        with self._lock:
+            self._entries[key] = (time() + (ttl or self.ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str | None = None) -> None:
+        """Removes entries from the cache.
+
+        Args:
+            prefix: only remove keys starting with prefix e.g. a method name.
+                Defaults to all
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if prefix is None or key.startswith(prefix):
+                    del self._entries[key]
+
+
+class DiskTTLCache(TTLCache):
+    """Cache with a time to live which is persisted to disk.
+
+    Entries are kept in memory and written to a shelve file
+    so that they can be reused by the next execution of a script.
+    """
+
+    def __init__(
+        self, filename: str | Path, maxsize: int = 256, ttl: float = 3600
+    ) -> None:
+        """Init of a cache loading all valid entries from filename.
+
+        Args:
+            filename: path of the shelve file used for storage
+            maxsize: maximum number of entries. Defaults to 256
+            ttl: seconds an entry is valid. Defaults to 3600
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.filename = str(filename)
+        with shelve.open(self.filename) as storage:  # noqa: S301
+            for key, (expires, value) in sorted(
+                storage.items(), key=lambda item: item[1][0]
+            ):
+                if expires >= time():
+                    self._entries[key] = (expires, value)
+        logger.debug("loaded %s cached entries from %s", len(self._entries), filename)
+
+    def set(self, key: str, value: object, ttl: float | None = None) -> None:
+        """See TTLCache.set - additionally persists the cache."""
+        with self._lock:
+            super().set(key=key, value=value, ttl=ttl)
+            self._persist()
+
+    def invalidate(self, prefix: str | None = None) -> None:
+        """See TTLCache.invalidate - additionally persists the cache."""
+        with self._lock:
+            super().invalidate(prefix=prefix)
+            self._persist()
+
+    def _persist(self) -> None:
+        """Writes all entries to disk replacing the previous content."""
+        with shelve.open(self.filename, flag="n") as storage:  # noqa: S301
+            storage.update(self._entries)
+
+
+def cached(method: Callable) -> Callable:
+    """Decorator which caches the result of a ChurchToolsApi method in self.cache.
+
+    Results are stored per domain and arguments. None is never cached
+    because it indicates a failed request. Copies are returned in order to
+    protect the cached values from modification by the caller.
+
+    Args:
+        method: the method to cache
+
+    Returns:
+        wrapped method
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: object, *args: list, **kwargs: dict) -> object:
+        cache = getattr(self, "cache", None)
+        if cache is None:
+            return method(self, *args, **kwargs)
+
+        key = f"{method.__name__}:{self.domain}:{args!r}:{sorted(kwargs.items())!r}"
+        if (result := cache.get(key, _MISSING)) is not _MISSING:
+            logger.debug("using cached result for %s", key)
+            return copy.deepcopy(result)
+
+        result = method(self, *args, **kwargs)
+        if result is not None:
+            cache.set(key, copy.deepcopy(result))
+        return result
+
+    return wrapper
@@ -1,7 +1,7 @@
 """module containing parts used for calendar handling."""
 
-import json
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
@@ -38,8 +38,8 @@ class ChurchToolsApiCalendar(ChurchToolsApiAbstract):
         response = self.session.get(url=url, params=params, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            return response_content["data"].copy()
+            response_content = self._decode_response(response)
+            return response_content["data"]
         logger.warning(
             "%s Something went wrong fetching events: %s",
             response.status_code,
@@ -74,16 +74,10 @@ class ChurchToolsApiCalendar(ChurchToolsApiAbstract):
                 calculated date of series is unambiguous
             Nothing in case something is off or nothing exists
         """
-        url = self.domain + "/api/calendars"
         params = {}
-
-        if len(calendar_ids) > 1:
-            url += "/appointments"
-            params["calendar_ids[]"] = calendar_ids
-        elif kwargs.get("appointment_id"):
-            url += f"/{calendar_ids[0]}/appointments/{kwargs['appointment_id']}"
-        else:
-            url += f"/{calendar_ids[0]}/appointments"
+        url = self._get_calendar_appointments_url(
+            calendar_ids=calendar_ids, params=params, **kwargs
+        )
 
         headers = {"accept": "application/json"}
 
@@ -92,7 +86,7 @@ class ChurchToolsApiCalendar(ChurchToolsApiAbstract):
         response = self.session.get(url=url, params=params, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
             response_data = self.combine_paginated_response_data(
                 response_content,
                 url=url,
@@ -138,6 +132,82 @@ class ChurchToolsApiCalendar(ChurchToolsApiAbstract):
         )
         return None
 
+    def iter_calendar_appointments(
+        self, calendar_ids: list, **kwargs: dict
+    ) -> Iterator[dict]:
+        """Generator variant of get_calendar_appointments yielding page by page.
+
+        Appointments are simplified individually in the same way
+        as get_calendar_appointments does for the complete list.
+
+        Arguments:
+            calendar_ids: list of calendar ids to be checked
+            kwargs: see get_calendar_appointments
+
+        Yields:
+            calendar appointment dicts
+        """
+        params = {}
+        url = self._get_calendar_appointments_url(
+            calendar_ids=calendar_ids, params=params, **kwargs
+        )
+        headers = {"accept": "application/json"}
+        params = self._get_calendar_appointments_params(params=params, **kwargs)
+
+        response = self.session.get(url=url, params=params, headers=headers)
+
+        if response.status_code != requests.codes.ok:
+            logger.warning(
+                "%s Something went wrong fetching calendar appointments:  %s",
+                response.status_code,
+                response.content,
+            )
+            return
+
+        response_content = self._decode_response(response)
+        for appointment in self.iterate_paginated_response_data(
+            response_content,
+            url=url,
+            headers=headers,
+            params=params,
+        ):
+            if "base" in appointment:
+                appointment["base"]["startDate"] = appointment["calculated"][
+                    "startDate"
+                ]
+                appointment["base"]["endDate"] = appointment["calculated"]["endDate"]
+                yield appointment["base"]
+            elif (
+                "appointment" in appointment
+                and len(appointment["calculatedDates"]) <= 1
+            ):
+                yield appointment["appointment"]
+            else:
+                yield appointment
+
+    def _get_calendar_appointments_url(
+        self, calendar_ids: list, params: dict, **kwargs: dict
+    ) -> str:
+        """Helper function which generates the url for calendar appointments.
+
+        Args:
+            calendar_ids: list of calendar ids to be checked
+            params: existing pre-set params - extended by calendar_ids if required
+            kwargs: which should be considered
+
+        Returns:
+            url which should be used for request
+        """
+        url = self.domain + "/api/calendars"
+        if len(calendar_ids) > 1:
+            url += "/appointments"
+            params["calendar_ids[]"] = calendar_ids
+        elif kwargs.get("appointment_id"):
+            url += f"/{calendar_ids[0]}/appointments/{kwargs['appointment_id']}"
+        else:
+            url += f"/{calendar_ids[0]}/appointments"
+        return url
+
     def _get_calendar_appointments_params(self, params: dict, **kwargs: dict) -> dict:
         """Helper function which generates params from kwargs.
 
@@ -235,10 +305,10 @@ class ChurchToolsApiCalendar(ChurchToolsApiAbstract):
         response = self.session.post(url=url, json=data, headers=headers)
 
         if response.status_code != requests.codes.created:
-            logger.warning(json.loads(response.content).get("errors"))
+            logger.warning(self._decode_response(response).get("errors"))
             return None
 
-        result_data = json.loads(response.content)["data"]
+        result_data = self._decode_response(response)["data"]
 
         self._handle_calendar_image(
             appointment_id=result_data["id"], image=image, image_options=image_options
@@ -334,7 +404,7 @@ class ChurchToolsApiCalendar(ChurchToolsApiAbstract):
         )
 
         if response.status_code != requests.codes.ok:
-            logger.warning(json.loads(response.content).get("errors"))
+            logger.warning(self._decode_response(response).get("errors"))
             return None
 
         self._handle_calendar_image(
@@ -343,7 +413,7 @@ class ChurchToolsApiCalendar(ChurchToolsApiAbstract):
             image_options=kwargs.get("image_options"),
         )
 
-        return json.loads(response.content)["data"]
+        return self._decode_response(response)["data"]
 
     def delete_calender_appointment(
         self, calendar_id: int, appointment_id: int
@@ -366,7 +436,7 @@ class ChurchToolsApiCalendar(ChurchToolsApiAbstract):
         response = self.session.delete(url=url, headers=headers)
 
         if response.status_code != requests.codes.no_content:
-            logger.warning(json.loads(response.content).get("errors"))
+            logger.warning(self._decode_response(response).get("errors"))
             return False
 
         return True
@@ -5,14 +5,18 @@ import logging
 
 import requests
 
+from churchtools_api.batch import Batch
+from churchtools_api.cache import TTLCache, cached
 from churchtools_api.calendar import ChurchToolsApiCalendar
 from churchtools_api.events import ChurchToolsApiEvents
 from churchtools_api.files import ChurchToolsApiFiles
 from churchtools_api.groups import ChurchToolsApiGroups
+from churchtools_api.loginstore import LoginStore
 from churchtools_api.persons import ChurchToolsApiPersons
 from churchtools_api.posts import ChurchToolsApiPosts
 from churchtools_api.ratelimitedsession import RateLimitedSession
 from churchtools_api.resources import ChurchToolsApiResources
+from churchtools_api.sessionpool import SessionPool
 from churchtools_api.songs import ChurchToolsApiSongs
 
 # from churchtools_api.tags import ChurchToolsApiTags # already part of songs  # noqa: ERA001 E501
@@ -43,12 +47,18 @@ class ChurchToolsApi(
         ChurchToolsApiTags: all functions used for tags
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         domain: str,
         ct_token: str | None = None,
         ct_user: str | None = None,
         ct_password: str | None = None,
+        *,
+        max_workers: int = 1,
+        session_options: dict | None = None,
+        cache: TTLCache | bool = False,
+        login_store: LoginStore | None = None,
+        lazy_login: bool = False,
     ) -> None:
         """Setup of a ChurchToolsApi object.
 
@@ -59,11 +69,31 @@ class ChurchToolsApi(
             ct_token: direct access using a user token
             ct_user: indirect login using user and password combination
             ct_password: indirect login using user and password combination
+            max_workers: number of concurrent requests used for pagination.
+                Defaults to 1 which requests all pages one after another
+            session_options: keyword arguments used for the RateLimitedSession
+                e.g. {"requests_per_second": 5, "metrics": InMemoryMetrics()}
+            cache: cache used for masterdata e.g. DiskTTLCache.
+                Defaults to False which disables it, True uses an in memory TTLCache
+            login_store: storage used to reuse the login of previous executions.
+                Defaults to None
+            lazy_login: token login without any request - the token is
+                only validated by the first request. Defaults to False
 
         """
         super().__init__()
-        self.session : None | RateLimitedSession = None
+        self.session : None | RateLimitedSession | SessionPool = None
         self.domain : str = domain
+        self.max_workers : int = max_workers
+        self.session_options : dict = session_options or {}
+        self._tag_indexes : dict = {}
+        self.login_store : LoginStore | None = login_store
+        self.lazy_login : bool = lazy_login
+        self._credentials : dict = {}
+        if isinstance(cache, TTLCache):
+            self.cache : TTLCache | None = cache
+        else:
+            self.cache = TTLCache() if cache else None
 
         if ct_token is not None:
             self.login_ct_rest_api(ct_token=ct_token)
@@ -87,16 +117,55 @@ class ChurchToolsApi(
         Login Tokens are generated in "Berechtigungen" of User Settings
         using REST API login as opposed to AJAX login will also save a cookie.
 
+        If a login_store is used a stored login is reused without any request.
+        With lazy_login a token is used without any request. In both cases
+        the session logs in again once a request is rejected as unauthorized.
+        Lazy token logins do not request a CSRF token which is only required
+        for legacy AJAX requests.
+
         Arguments:
             ct_token: token to be used for login into CT
             ct_user: the username to be used in case of unknown login token
             ct_password: the password to be used in case of unknown login token
 
         Returns:
-            personId if login successful otherwise False
+            personId if login successful otherwise False - True for lazy_login
         """
-        self.session = RateLimitedSession()
+        self.session = RateLimitedSession(**self.session_options)
+        self._credentials = {
+            "ct_token": ct_token,
+            "ct_user": ct_user,
+            "ct_password": ct_password,
+        }
+
+        if not (person_id := self._restore_login()):
+            if ct_token and self.lazy_login:
+                logger.info("Lazy Login with token - validated on first request")
+                self.session.headers["Authorization"] = "Login " + ct_token
+                person_id = True
+            else:
+                person_id = self._login(**self._credentials)
+
+        if person_id:
+            self.session.on_unauthorized = self._repeat_login
+        return person_id
+
+    def _login(
+        self,
+        ct_token: str | None = None,
+        ct_user: str | None = None,
+        ct_password: str | None = None,
+    ) -> int | bool:
+        """Helper which logs in the current session - see login_ct_rest_api.
+
+        Arguments:
+            ct_token: token to be used for login into CT
+            ct_user: the username to be used in case of unknown login token
+            ct_password: the password to be used in case of unknown login token
 
+        Returns:
+            personId if login successful otherwise False
+        """
         if ct_token:
             logger.info("Trying Login with token")
             url = self.domain + "/api/whoami"
@@ -104,13 +173,13 @@ class ChurchToolsApi(
             response = self.session.get(url=url, headers=headers)
 
             if response.status_code == requests.codes.ok:
-                response_content = json.loads(response.content)
+                response_content = self._decode_response(response)
                 logger.info(
                     "Token Login Successful as %s",
                     response_content["data"]["email"],
                 )
                 self.session.headers["CSRF-Token"] = self.get_ct_csrf_token()
-                return json.loads(response.content)["data"]["id"]
+                return self._store_login(response_content["data"]["id"])
             logger.warning(
                 "Token Login failed with %s",
                 response.content.decode(),
@@ -124,10 +193,10 @@ class ChurchToolsApi(
             response = self.session.post(url=url, data=data)
 
             if response.status_code == requests.codes.ok:
-                response_content = json.loads(response.content)
+                response_content = self._decode_response(response)
                 person = self.who_am_i()
                 logger.info("User/Password Login Successful as %s", person["email"])
-                return person["id"]
+                return self._store_login(person["id"])
             logger.warning(
                 "User/Password Login failed with %s",
                 response.content.decode(),
@@ -135,6 +204,109 @@ class ChurchToolsApi(
             return False
         return None
 
+    def _repeat_login(self) -> bool:
+        """Helper used by the session to login again after a 401 response.
+
+        Returns:
+            if successful
+        """
+        if self.login_store:
+            self.login_store.delete(self._get_login_key())
+        self.session.headers.pop("Authorization", None)
+        return bool(self._login(**self._credentials))
+
+    def _get_login_key(self) -> str:
+        """Helper which returns the key of the current credentials in login_store.
+
+        Returns:
+            key used for login_store
+        """
+        return LoginStore.get_key(
+            domain=self.domain,
+            ct_token=self._credentials["ct_token"],
+            ct_user=self._credentials["ct_user"],
+        )
+
+    def _restore_login(self) -> int | None:
+        """Helper which applies a login stored by a previous execution.
+
+        The login is not validated - an outdated login is renewed
+        by the first request which is rejected.
+
+        Returns:
+            personId if a stored login was applied otherwise None
+        """
+        if not self.login_store or not any(self._credentials.values()):
+            return None
+        state = self.login_store.load(self._get_login_key())
+        if state is None:
+            return None
+        LoginStore.apply(state=state, session=self.session)
+        logger.info("Reusing stored login of person %s", state["person_id"])
+        return state["person_id"]
+
+    def _store_login(self, person_id: int) -> int:
+        """Helper which keeps a successful login in login_store if used.
+
+        Arguments:
+            person_id: id of the logged in person
+
+        Returns:
+            person_id
+        """
+        if self.login_store:
+            self.login_store.save(
+                self._get_login_key(), session=self.session, person_id=person_id
+            )
+        return person_id
+
+    def enable_session_pool(
+        self, pool_connections: int = 1, pool_maxsize: int = 1
+    ) -> SessionPool:
+        """Shares the current login with multiple threads.
+
+        Replaces the session by a SessionPool which provides a clone of the
+        logged in session for each thread without repeating the login.
+        All clones share one rate limit.
+        Must be called after login and again after each new login.
+
+        Arguments:
+            pool_connections: number of hosts to keep connections for per thread
+            pool_maxsize: number of connections per host and thread. Defaults to 1
+
+        Returns:
+            the pool used as session
+        """
+        if isinstance(self.session, SessionPool):
+            return self.session
+        self.session = SessionPool(
+            self.session,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+        return self.session
+
+    def batch(
+        self, *, max_workers: int | None = None, max_attempts: int = 3
+    ) -> Batch:
+        """Creates a queue of operations which are executed together.
+
+        Usage:
+            with api.batch(max_workers=4) as batch:
+                for person_id in person_ids:
+                    batch.add_group_member(group_id=1, person_id=person_id)
+            failed = batch.failed
+
+        Arguments:
+            max_workers: number of concurrent requests. Defaults to max_workers
+            max_attempts: number of executions of an operation with transient errors.
+                Operations sending e.g. POST are only repeated if queued with retry=True
+
+        Returns:
+            batch executed when leaving the context or by batch.execute()
+        """
+        return Batch(self, max_workers=max_workers, max_attempts=max_attempts)
+
     def get_ct_csrf_token(self) -> str:
         """Requests CSRF Token https://hilfe.church.tools/wiki/0/API-CSRF.
 
@@ -148,7 +320,7 @@ class ChurchToolsApi(
         url = self.domain + "/api/csrftoken"
         response = self.session.get(url=url)
         if response.status_code == requests.codes.ok:
-            csrf_token = json.loads(response.content)["data"]
+            csrf_token = self._decode_response(response)["data"]
             logger.debug("CSRF Token erfolgreich abgerufen %s", csrf_token)
             return csrf_token
         logger.warning(
@@ -167,7 +339,7 @@ class ChurchToolsApi(
         response = self.session.get(url=url)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
             if "email" in response_content["data"]:
                 logger.info("Who am I as %s", response_content["data"]["email"])
                 return response_content["data"]
@@ -222,8 +394,8 @@ class ChurchToolsApi(
         headers = {"accept": "application/json"}
         response = self.session.get(url=url, headers=headers)
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
             logger.debug(
                 "First response of Global Permissions successful len=%s",
                 len(response_content),
@@ -237,6 +409,7 @@ class ChurchToolsApi(
         )
         return None
 
+    @cached
     def get_services(self, **kwargs: dict) -> list[dict]:
         """Function to get list of all or a single services configuration item from CT.
 
@@ -259,8 +432,8 @@ class ChurchToolsApi(
         response = self.session.get(url=url, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
 
             if kwargs.get("returnAsDict", False) and "serviceId" not in kwargs:
                 result = {}
@@ -276,6 +449,7 @@ class ChurchToolsApi(
         logger.info("Services requested failed: %s", response.status_code)
         return None
 
+    @cached
     def get_options(self) -> dict:
         """Helper function which returns all configurable option fields from CT.
 
@@ -292,8 +466,8 @@ class ChurchToolsApi(
         response = self.session.get(url=url, params=params, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
             logger.debug("Options load successful len=%s", len(response_content))
             return {item["name"]: item for item in response_data}
         logger.warning(
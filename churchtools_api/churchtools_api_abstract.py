@@ -3,10 +3,22 @@
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, ClassVar
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # optional dependency - pip install churchtools-api[orjson]
+    orjson = None
 
 if TYPE_CHECKING:
-    import requests
+    from churchtools_api.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -18,16 +30,53 @@ class ChurchToolsApiAbstract(ABC):
         ABC: python default abstract
     """
 
+    # decoder used for all responses - can be replaced e.g. by another json library
+    json_loads: ClassVar[Callable[[bytes], object]] = staticmethod(
+        orjson.loads if orjson else json.loads
+    )
+    # max number of ids in one ids[] style filter - longer lists are split into
+    # several requests because servers reject urls longer than a few kB
+    id_chunk_size: ClassVar[int] = 100
+
     @abstractmethod
     def __init__(self) -> None:
         """Preparing base variables."""
         self.session:requests.Session |None = None
         self.domain:str|None = None
+        self.max_workers: int = 1
+        self.cache: TTLCache | None = None
+        self._tag_indexes: dict = {}
+
+    def _decode_response(self, response: "requests.Response") -> dict:
+        """Decodes the json content of a response.
+
+        The bytes of the response are decoded directly without an intermediate str
+        using json_loads which defaults to orjson if installed.
+        Callers own the result - it is not copied.
+
+        Args:
+            response: response with json content
+
+        Returns:
+            decoded content usually containing "data" and "meta"
+        """
+        return self.json_loads(response.content)
+
+    def invalidate_cache(self, method_name: str | None = None) -> None:
+        """Removes cached results e.g. after masterdata was changed.
+
+        Args:
+            method_name: name of the cached method e.g. "get_tags". Defaults to all
+        """
+        if self.cache is not None:
+            self.cache.invalidate(prefix=f"{method_name}:" if method_name else None)
 
     def combine_paginated_response_data(
         self,
         response_content: dict,
         url: str,
+        *,
+        convert: Callable[[dict], object] | None = None,
         **kwargs: dict,
     ) -> dict:
         """Helper function which combines data for requests for pagination.
@@ -36,27 +85,287 @@ class ChurchToolsApiAbstract(ABC):
             response_content: the original response form ChurchTools
                 which either has meta/pagination or not
             url: the url used for the original request in order to repear it
+            convert: applied to each item as soon as its page arrives
+                e.g. PersonRecord.from_dict. Defaults to None
             kwargs: can contain headers and params passthrough
+                and max_workers used for further pages
 
         Returns:
             response 'data' without pagination
         """
-        response_data = response_content["data"].copy()
+        if not response_content.get("meta", {}).get("pagination"):
+            response_data = response_content["data"]
+            if convert is None:
+                return response_data
+            if isinstance(response_data, dict):
+                return convert(response_data)
+            return [convert(item) for item in response_data]
+
+        pages = self._iterate_pages(response_content, url=url, **kwargs)
+        if convert is not None:  # pages of dicts are released once converted
+            pages = ([convert(item) for item in page_data] for page_data in pages)
+        response_data = next(pages)  # extended in place instead of copied
+        for page_data in pages:
+            response_data.extend(page_data)
+        return response_data
+
+    def iterate_paginated_response_data(
+        self,
+        response_content: dict,
+        url: str,
+        **kwargs: dict,
+    ) -> Iterator[dict]:
+        """Generator variant of combine_paginated_response_data.
+
+        Items are yielded page by page as they arrive.
+        If max_workers is greater than 1 further pages are already requested
+        while the current one is processed.
+
+        Args:
+            response_content: the original response form ChurchTools
+                which either has meta/pagination or not
+            url: the url used for the original request in order to repeat it
+            kwargs: can contain headers and params passthrough
+
+        Yields:
+            single items of response 'data'
+        """
+        if isinstance(response_content["data"], dict):
+            yield response_content["data"]
+            return
+
+        for page_data in self._iterate_pages(response_content, url=url, **kwargs):
+            yield from page_data
+
+    def _iterate_pages(
+        self,
+        response_content: dict,
+        url: str,
+        *,
+        max_workers: int | None = None,
+        **kwargs: dict,
+    ) -> Iterator[list]:
+        """Helper which yields the first response and requests all further pages.
+
+        If max_workers is greater than 1 the pages are requested concurrently
+        using a bounded thread pool which shares the session.
+        Pages are always returned in page order.
+
+        Args:
+            response_content: the original response form ChurchTools
+            url: the url used for the original request in order to repeat it
+            max_workers: number of pages in flight. Defaults to self.max_workers
+            kwargs: can contain headers and params passthrough
+
+        Yields:
+            response 'data' of the first and each additional page
+        """
+        pagination = response_content.get("meta", {}).get("pagination")
+        if not pagination:
+            yield response_content["data"]
+            return
+
+        pages = range(pagination["current"] + 1, pagination["lastPage"] + 1)
+        max_workers = min(max_workers or self.max_workers, len(pages))
+
+        if max_workers <= 1:
+            yield response_content["data"]
+            for page in pages:
+                yield self._get_paginated_page(
+                    page=page, last_page=pagination["lastPage"], url=url, **kwargs
+                )
+            return
+
+        request_page = partial(
+            self._get_paginated_page,
+            last_page=pagination["lastPage"],
+            url=url,
+            **kwargs,
+        )
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ct_pagination"
+        ) as executor:
+            page_iterator = iter(pages)
+            pending = deque(
+                executor.submit(request_page, page=page)
+                for page in islice(page_iterator, max_workers)
+            )
+            yield response_content["data"]
+            while pending:
+                page_data = pending.popleft().result()
+                if (page := next(page_iterator, None)) is not None:
+                    pending.append(executor.submit(request_page, page=page))
+                yield page_data
+
+    def _get_paginated_page(
+        self,
+        page: int,
+        last_page: int,
+        url: str,
+        **kwargs: dict,
+    ) -> list:
+        """Requests one single page of a paginated request.
+
+        Args:
+            page: number of the page to request
+            last_page: number of the last page used for logging
+            url: the url used for the original request in order to repeat it
+            kwargs: can contain headers and params passthrough
+
+        Returns:
+            response 'data' of the requested page
+            - raises requests.HTTPError if the page could not be requested
+        """
+        logger.debug("running paginated request for page %s of %s", page, last_page)
+        kwargs["params"] = {**(kwargs.get("params") or {}), "page": page}
+
+        response = self.session.get(url=url, **kwargs)
+        response.raise_for_status()
+        return self._decode_response(response)["data"]
+
+    def _get_chunked_data(
+        self,
+        url: str,
+        chunked_param: str,
+        *,
+        params: dict,
+        get_id: Callable | None = None,
+        convert: Callable[[dict], object] | None = None,
+        **kwargs: dict,
+    ) -> list | None:
+        """Requests all pages of url splitting a long list param into chunks.
+
+        params[chunked_param] is split into chunks of id_chunk_size ids
+        which are requested concurrently and combined.
+        Pages of a chunk are requested concurrently only if there is one chunk.
+
+        Args:
+            url: the url to request
+            chunked_param: name of the list param e.g. "ids[]"
+            params: params of the request including the full list
+            get_id: returns the identity of an item used to remove duplicates
+                across chunks. Defaults to None which keeps all items
+            convert: applied to each item e.g. PersonRecord.from_dict.
+                Defaults to None
+            kwargs: can contain headers passthrough
+
+        Returns:
+            combined response 'data' as list or None if any request failed
+        """
+        ids = params.get(chunked_param)
+        if ids and len(ids) > self.id_chunk_size:
+            ids = list(dict.fromkeys(ids))
+            chunks = [
+                {**params, chunked_param: ids[start : start + self.id_chunk_size]}
+                for start in range(0, len(ids), self.id_chunk_size)
+            ]
+            logger.debug("splitting %s %s into %s requests", len(ids), url, len(chunks))
+        else:
+            chunks = [params]
+
+        # chunks are requested concurrently - their pages one after another
+        # in order to keep the number of requests in flight at max_workers
+        page_workers = 1 if len(chunks) > 1 else None
 
-        if pagination := response_content.get("meta", {}).get("pagination"):
-            for page in range(pagination["current"], pagination["lastPage"]):
-                logger.debug(
-                    "running paginated request for page %s of %s",
-                    page + 1,
-                    pagination["lastPage"],
+        def request_chunk(chunk_params: dict) -> list | None:
+            response = self.session.get(url=url, params=chunk_params, **kwargs)
+            if response.status_code != requests.codes.ok:
+                logger.warning(
+                    "%s Something went wrong fetching %s: %s",
+                    response.status_code,
+                    url,
+                    response.content,
                 )
-                new_param = {"page": page + 1}
-                if kwargs.get("params"):
-                    kwargs["params"].update(new_param)
+                return None
+            response_data = self.combine_paginated_response_data(
+                self._decode_response(response),
+                url=url,
+                convert=convert,
+                params=chunk_params,
+                max_workers=page_workers,
+                **kwargs,
+            )
+            return response_data if isinstance(response_data, list) else [response_data]
+
+        results = self._map_concurrently(request_chunk, chunks)
+        if any(result is None for result in results):
+            return None
+        if len(results) == 1:
+            return results[0]
+
+        combined = []
+        seen = set()
+        for result in results:
+            for item in result:
+                if get_id is not None:
+                    if (item_id := get_id(item)) in seen:
+                        continue
+                    seen.add(item_id)
+                combined.append(item)
+        return combined
+
+    @staticmethod
+    def _create_projection(
+        fields: list[str], convert: Callable[[dict], object] | None = None
+    ) -> Callable[[dict], object]:
+        """Helper which creates a function reducing an item to the given fields.
+
+        Used as convert of combine_paginated_response_data so that unused
+        fields of each page are released as soon as the page arrives.
+
+        Args:
+            fields: keys to keep - nested keys are separated by dots
+                e.g. "person.domainAttributes.firstName"
+            convert: applied to the reduced item e.g. PersonRecord.from_dict.
+                Defaults to None
+
+        Returns:
+            function returning a new dict with all available fields
+        """
+        paths = [field.split(".") for field in fields]
+
+        def project(item: dict) -> object:
+            result = {}
+            for path in paths:
+                value = item
+                for key in path:
+                    if not isinstance(value, dict) or key not in value:
+                        break
+                    value = value[key]
                 else:
-                    kwargs["params"] = new_param
+                    target = result
+                    for key in path[:-1]:
+                        target = target.setdefault(key, {})
+                    target[path[-1]] = value
+            return result if convert is None else convert(result)
 
-                response = self.session.get(url=url, **kwargs)
-                response_content = json.loads(response.content)
-                response_data.extend(response_content["data"])
-        return response_data
+        return project
+
+    def _map_concurrently(
+        self,
+        function: Callable,
+        items: Iterable,
+        max_workers: int | None = None,
+    ) -> list:
+        """Helper which applies a function to all items.
+
+        Uses a bounded thread pool which shares the session
+        if max_workers is greater than 1.
+
+        Args:
+            function: function which is called with each item as only argument
+            items: the arguments to process
+            max_workers: number of concurrent calls. Defaults to self.max_workers
+
+        Returns:
+            results of the function in order of the items
+        """
+        items = list(items)
+        max_workers = min(max_workers or self.max_workers, len(items))
+        if max_workers <= 1:
+            return [function(item) for item in items]
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ct_concurrent"
+        ) as executor:
+            return list(executor.map(function, items))
@@ -0,0 +1,185 @@
+"""module containing an asyncio variant of ChurchToolsApi."""
+
+import asyncio
+import functools
+import inspect
+import logging
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+
+from requests.adapters import HTTPAdapter
+
+from churchtools_api.churchtools_api import ChurchToolsApi
+
+logger = logging.getLogger(__name__)
+
+_STOP_ITERATION = object()
+
+
+class AsyncChurchToolsApi:
+    """asyncio variant of ChurchToolsApi.
+
+    Every public method of ChurchToolsApi is available as coroutine
+    with the same arguments, iter_* methods are available as async generators.
+    All calls share one authenticated RateLimitedSession and its connection pool.
+    Blocking requests are executed by a bounded pool of max_connections workers,
+    so any number of coroutines can be awaited at once without a thread each.
+
+    Usage:
+        async with AsyncChurchToolsApi(domain, ct_token=token) as api:
+            persons, groups = await asyncio.gather(
+                api.get_persons(ids=[1]), api.get_groups()
+            )
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        domain: str,
+        ct_token: str | None = None,
+        ct_user: str | None = None,
+        ct_password: str | None = None,
+        *,
+        max_connections: int = 10,
+        max_workers: int = 1,
+        session_options: dict | None = None,
+    ) -> None:
+        """Setup of a AsyncChurchToolsApi object.
+
+        Login is executed when entering the async context
+        or by awaiting login_ct_rest_api.
+
+        Arguments:
+            domain: including https:// ending on e.g. .de
+            ct_token: direct access using a user token
+            ct_user: indirect login using user and password combination
+            ct_password: indirect login using user and password combination
+            max_connections: number of requests which are executed at once
+            max_workers: number of concurrent requests used for pagination
+            session_options: keyword arguments used for the RateLimitedSession
+        """
+        self.api = ChurchToolsApi(
+            domain=domain,
+            max_workers=max_workers,
+            session_options=session_options,
+        )
+        self.max_connections = max_connections
+        self._credentials = {
+            "ct_token": ct_token,
+            "ct_user": ct_user,
+            "ct_password": ct_password,
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections, thread_name_prefix="ct_async"
+        )
+
+    async def __aenter__(self) -> "AsyncChurchToolsApi":
+        """Login with the credentials passed on init if any."""
+        if any(self._credentials.values()):
+            await self.login_ct_rest_api(**self._credentials)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Closes the session and the worker pool."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the session and the worker pool."""
+        self._executor.shutdown(wait=False)
+        if self.api.session:
+            self.api.session.close()
+
+    async def _run(self, function: Callable, *args: list, **kwargs: dict) -> object:
+        """Executes a blocking function in the worker pool.
+
+        Args:
+            function: the function to execute
+            args: positional arguments passthrough
+            kwargs: keyword arguments passthrough
+
+        Returns:
+            result of the function
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(function, *args, **kwargs)
+        )
+
+    async def login_ct_rest_api(self, **kwargs: dict) -> int | bool:
+        """See ChurchToolsApi.login_ct_rest_api.
+
+        Additionally sizes the connection pool of the new session
+        to match max_connections.
+
+        Arguments:
+            kwargs: see ChurchToolsApi.login_ct_rest_api
+
+        Returns:
+            personId if login successful otherwise False
+        """
+        result = await self._run(self.api.login_ct_rest_api, **kwargs)
+        adapter = HTTPAdapter(
+            pool_connections=self.max_connections,
+            pool_maxsize=self.max_connections,
+        )
+        self.api.session.mount("https://", adapter)
+        self.api.session.mount("http://", adapter)
+        return result
+
+
+def _create_coroutine(name: str, method: Callable) -> Callable:
+    """Creates a coroutine method which runs the ChurchToolsApi method in the pool.
+
+    Args:
+        name: name of the method of ChurchToolsApi
+        method: the method itself used for docs and signature
+
+    Returns:
+        coroutine function
+    """
+
+    @functools.wraps(method)
+    async def coroutine(
+        self: AsyncChurchToolsApi, *args: list, **kwargs: dict
+    ) -> object:
+        return await self._run(getattr(self.api, name), *args, **kwargs)
+
+    return coroutine
+
+
+def _create_async_generator(name: str, method: Callable) -> Callable:
+    """Creates an async generator which advances the ChurchToolsApi generator.
+
+    Args:
+        name: name of the generator method of ChurchToolsApi
+        method: the method itself used for docs and signature
+
+    Returns:
+        async generator function
+    """
+
+    @functools.wraps(method)
+    async def async_generator(
+        self: AsyncChurchToolsApi, *args: list, **kwargs: dict
+    ) -> AsyncIterator:
+        iterator = getattr(self.api, name)(*args, **kwargs)
+        while (
+            item := await self._run(next, iterator, _STOP_ITERATION)
+        ) is not _STOP_ITERATION:
+            yield item
+
+    return async_generator
+
+
+for _name, _method in inspect.getmembers(ChurchToolsApi, inspect.isfunction):
+    if _name.startswith("_") or hasattr(AsyncChurchToolsApi, _name):
+        continue
+    if inspect.isgeneratorfunction(_method):
+        setattr(AsyncChurchToolsApi, _name, _create_async_generator(_name, _method))
+    else:
+        setattr(AsyncChurchToolsApi, _name, _create_coroutine(_name, _method))
@@ -1,16 +1,18 @@
 """module containing parts used for events handling."""
 
-import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import docx
 import requests
-from tzlocal import get_localzone
 
+from churchtools_api.cache import cached
 from churchtools_api.churchtools_api_abstract import ChurchToolsApiAbstract
 
+if TYPE_CHECKING:
+    import docx
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,7 +67,7 @@ class ChurchToolsApiEvents(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers, params=params)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
             response_data = self.combine_paginated_response_data(
                 response_content,
                 url=url,
@@ -154,6 +156,8 @@ class ChurchToolsApiEvents(ChurchToolsApiAbstract):
             event dict with event servics
         """
         if not isinstance(start_date, datetime):
+            from tzlocal import get_localzone  # imported on first use only
+
             formats = {"iso": "%Y-%m-%dT%H:%M:%SZ", "date": "%Y-%m-%d"}
             for date_formats in formats.values():
                 try:
@@ -214,7 +218,7 @@ class ChurchToolsApiEvents(ChurchToolsApiAbstract):
                 "%s Something went wrong updating event %s: %s",
                 response.status_code,
                 event_id,
-                json.loads(response.content).get("errors"),
+                self._decode_response(response).get("errors"),
             )
             return False
 
@@ -306,7 +310,7 @@ class ChurchToolsApiEvents(ChurchToolsApiAbstract):
         response = self.session.post(url=url, headers=headers, params=params, data=data)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
             response_success = response_content["status"] == "success"
 
             number_match = (
@@ -342,8 +346,8 @@ class ChurchToolsApiEvents(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
             logger.debug("Agenda load successful %s items", len(response_content))
 
             return response_data
@@ -432,8 +436,8 @@ class ChurchToolsApiEvents(ChurchToolsApiAbstract):
         )
         result_ok = False
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            agenda_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            agenda_data = response_content["data"]
             logger.debug("Agenda package found %s", response_content)
             result_ok = self.file_download_from_url(
                 "{}/{}".format(self.domain, agenda_data["url"]),
@@ -446,7 +450,7 @@ class ChurchToolsApiEvents(ChurchToolsApiAbstract):
 
         return result_ok
 
-    def get_event_agenda_docx(self, agenda: dict, **kwargs: dict) -> docx.Document:
+    def get_event_agenda_docx(self, agenda: dict, **kwargs: dict) -> "docx.Document":
         """Generates custom docx document.
 
         Function to generate a custom docx document
@@ -468,6 +472,8 @@ class ChurchToolsApiEvents(ChurchToolsApiAbstract):
 
         logger.debug("Trying to get agenda for: %s", agenda["name"])
 
+        import docx  # imported on first use only because it is slow to load
+
         document = docx.Document()
         heading = agenda["name"]
         heading += "- Draft" if not agenda["isFinal"] else ""
@@ -556,7 +562,7 @@ class ChurchToolsApiEvents(ChurchToolsApiAbstract):
         return responsible_list
 
     def _add_service_group_notes(
-        self, document: docx.Document, service_group_notes: list, service_groups: dict
+        self, document: "docx.Document", service_group_notes: list, service_groups: dict
     ) -> None:
         """Subfunction which genereates service group note paragaphs.
 
@@ -598,6 +604,7 @@ class ChurchToolsApiEvents(ChurchToolsApiAbstract):
             service for service in eventServices if service["serviceId"] == serviceId
         ]
 
+    @cached
     def get_event_masterdata(
         self, **kwargs: dict
     ) -> list | list[list] | dict | list[dict]:
@@ -624,14 +631,13 @@ class ChurchToolsApiEvents(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
 
             if "resultClass" in kwargs:
                 response_data = response_data[kwargs["resultClass"]]
                 if kwargs.get("returnAsDict"):
-                    response_data2 = response_data.copy()
-                    response_data = {item["id"]: item for item in response_data2}
+                    response_data = {item["id"]: item for item in response_data}
             logger.debug("Event Masterdata load successful len=%s", len(response_data))
 
             return response_data
@@ -100,7 +100,7 @@ class ChurchToolsApiFiles(ChurchToolsApiAbstract):
             logger.warning(response.content.decode())
             return False
         try:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
             file_id = response_content["data"][0]["id"]
             logger.debug("Upload successful len=%s", response_content)
 
@@ -139,7 +139,7 @@ class ChurchToolsApiFiles(ChurchToolsApiAbstract):
 
         if filename_for_selective_delete is not None:
             response = self.session.get(url=url)
-            files = json.loads(response.content)["data"]
+            files = self._decode_response(response)["data"]
             selective_file_ids = [
                 item["id"]
                 for item in files
@@ -191,8 +191,8 @@ class ChurchToolsApiFiles(ChurchToolsApiAbstract):
         response = self.session.get(url=url)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            arrangement_files = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            arrangement_files = response_content["data"]
             logger.debug(
                 "SongArrangement-Files load successful len=%s",
                 len(response_content),
@@ -0,0 +1,144 @@
+"""module containing a graph of the group hierarchy for transitive queries.
+
+Usage:
+    hierarchy = api.get_group_hierarchy()
+    sub_group_ids = hierarchy.descendants(group_id)
+    members = api.get_transitive_members(group_id)
+"""
+
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class GroupHierarchy:
+    """Parent and child relations of all groups with precomputed closures.
+
+    The hierarchy is immutable - it is therefore shared instead of copied
+    e.g. when returned from a cache.
+    """
+
+    def __init__(self, hierarchies: dict) -> None:
+        """Init of a hierarchy computing all ancestors and descendants.
+
+        Args:
+            hierarchies: dict as returned by get_groups_hierarchies
+                {groupId: {"groupId": int, "parents": list, "children": list}}
+        """
+        parents = {group_id: set() for group_id in hierarchies}
+        children = {group_id: set() for group_id in hierarchies}
+        for group_id, hierarchy in hierarchies.items():
+            for parent_id in hierarchy.get("parents") or []:
+                parents[group_id].add(parent_id)
+                children.setdefault(parent_id, set()).add(group_id)
+                parents.setdefault(parent_id, set())
+            for child_id in hierarchy.get("children") or []:
+                children[group_id].add(child_id)
+                parents.setdefault(child_id, set()).add(group_id)
+                children.setdefault(child_id, set())
+
+        self._parents = {key: frozenset(value) for key, value in parents.items()}
+        self._children = {key: frozenset(value) for key, value in children.items()}
+        self.topological_order = self._sort_topological()
+        self._ancestors = self._get_closures(self._parents, self.topological_order)
+        self._descendants = self._get_closures(
+            self._children, self.topological_order[::-1]
+        )
+
+    def _sort_topological(self) -> tuple[int, ...]:
+        """Helper which orders all groups with parents before their children.
+
+        Groups which are part of a cycle are appended at the end.
+
+        Returns:
+            group ids in topological order
+        """
+        missing_parents = {
+            group_id: len(parents) for group_id, parents in self._parents.items()
+        }
+        pending = deque(
+            sorted(group_id for group_id, count in missing_parents.items() if not count)
+        )
+        order = []
+        while pending:
+            group_id = pending.popleft()
+            order.append(group_id)
+            for child_id in sorted(self._children[group_id]):
+                missing_parents[child_id] -= 1
+                if not missing_parents[child_id]:
+                    pending.append(child_id)
+
+        if len(order) < len(self._parents):
+            cyclic = sorted(set(self._parents) - set(order))
+            logger.warning("group hierarchy contains a cycle with groups %s", cyclic)
+            order.extend(cyclic)
+        return tuple(order)
+
+    @staticmethod
+    def _get_closures(
+        edges: dict[int, frozenset], order: tuple[int, ...]
+    ) -> dict[int, frozenset]:
+        """Helper which computes all groups reachable from each group.
+
+        Args:
+            edges: parents or children of each group
+            order: groups ordered so that the targets of edges come first
+
+        Returns:
+            reachable groups of each group
+        """
+        closures = {}
+        for group_id in order:
+            if all(target in closures for target in edges[group_id]):
+                closures[group_id] = edges[group_id].union(
+                    *(closures[target] for target in edges[group_id])
+                )
+                continue
+            # part of a cycle - closures of other groups are not known yet
+            reachable = set()
+            pending = deque(edges[group_id])
+            while pending:
+                target = pending.popleft()
+                if target not in reachable:
+                    reachable.add(target)
+                    pending.extend(edges[target])
+            closures[group_id] = frozenset(reachable)
+        return closures
+
+    def __deepcopy__(self, memo: dict) -> "GroupHierarchy":
+        """Returns the hierarchy itself because it is immutable."""
+        return self
+
+    def __contains__(self, group_id: int) -> bool:
+        """Checks if a group is part of the hierarchy."""
+        return group_id in self._parents
+
+    def __len__(self) -> int:
+        """Number of groups in the hierarchy."""
+        return len(self._parents)
+
+    @property
+    def roots(self) -> list[int]:
+        """Groups without parent groups."""
+        return [
+            group_id
+            for group_id in self.topological_order
+            if not self._parents[group_id]
+        ]
+
+    def parents(self, group_id: int) -> frozenset[int]:
+        """Direct parent groups of a group - empty if unknown."""
+        return self._parents.get(group_id, frozenset())
+
+    def children(self, group_id: int) -> frozenset[int]:
+        """Direct child groups of a group - empty if unknown."""
+        return self._children.get(group_id, frozenset())
+
+    def ancestors(self, group_id: int) -> frozenset[int]:
+        """All groups above a group - empty if unknown."""
+        return self._ancestors.get(group_id, frozenset())
+
+    def descendants(self, group_id: int) -> frozenset[int]:
+        """All groups below a group - empty if unknown."""
+        return self._descendants.get(group_id, frozenset())
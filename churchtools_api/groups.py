@@ -2,10 +2,15 @@
 
 import json
 import logging
+from collections.abc import Iterator
 
 import requests
 
+from churchtools_api.batch import Batch
+from churchtools_api.cache import cached
 from churchtools_api.churchtools_api_abstract import ChurchToolsApiAbstract
+from churchtools_api.grouphierarchy import GroupHierarchy
+from churchtools_api.records import GroupMemberRecord
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +54,7 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers, params=params)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
 
             response_data = self.combine_paginated_response_data(
                 response_content,
@@ -74,8 +79,8 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         headers = {"accept": "application/json"}
         response = self.session.get(url=url, headers=headers)
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
             logger.debug(
                 "First response of Groups Hierarchies successful len=%s",
                 len(response_content),
@@ -90,6 +95,49 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         )
         return None
 
+    @cached
+    def get_group_hierarchy(self) -> GroupHierarchy:
+        """Get the hierarchy of all groups as graph.
+
+        In contrast to get_groups_hierarchies ancestors and descendants
+        of each group are precomputed.
+        The result is kept in self.cache if available.
+
+        Returns:
+            hierarchy of all groups
+        """
+        hierarchies = self.get_groups_hierarchies()
+        if hierarchies is None:
+            return None
+        return GroupHierarchy(hierarchies)
+
+    def get_transitive_members(
+        self, group_id: int, *, include_group: bool = True, **kwargs: dict
+    ) -> list[dict]:
+        """Get the memberships of a group and all groups below it.
+
+        All memberships are requested concurrently using get_groups_members.
+        A person which is member of several of the groups is listed once per group.
+
+        Args:
+            group_id: id of the top most group e.g. youth ministry
+            include_group: include the members of group_id itself. Defaults to True
+            kwargs: passthrough to get_groups_members e.g. grouptype_role_ids
+
+        Returns:
+            list of person to group assignments
+        """
+        hierarchy = self.get_group_hierarchy()
+        if hierarchy is None:
+            return None
+
+        group_ids = sorted(hierarchy.descendants(group_id))
+        if include_group:
+            group_ids.insert(0, group_id)
+        if not group_ids:
+            return []
+        return self.get_groups_members(group_ids=group_ids, **kwargs)
+
     def get_group_statistics(self, group_id: int) -> dict:
         """Get statistics for the given group.
 
@@ -104,8 +152,8 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
+            response_content = self._decode_response(response)
 
             response_data = self.combine_paginated_response_data(
                 response_content,
@@ -171,10 +219,11 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.post(url=url, headers=headers, data=data)
 
         if response.status_code != requests.codes.created:
-            logger.warning(json.loads(response.content)["translatedMessage"])
+            logger.warning(self._decode_response(response)["translatedMessage"])
             return None
 
-        response_content = json.loads(response.content)
+        self.invalidate_cache("get_group_hierarchy")
+        response_content = self._decode_response(response)
         response_data = self.combine_paginated_response_data(
             response_content,
             url=url,
@@ -207,8 +256,8 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.patch(url=url, headers=headers, data=json.dumps(data))
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
             logger.debug(
                 "First response of Update Group successful len=%s",
                 len(response_content),
@@ -243,8 +292,8 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.patch(url=url, headers=headers, data=json.dumps(data))
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
             logger.debug(
                 "First response of Update Group Member successful len=%s",
                 len(response_content),
@@ -279,8 +328,8 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.patch(url=url, headers=headers, json=data)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
             logger.debug(
                 "First response of Update Group Member successful len=%s",
                 len(response_content),
@@ -294,6 +343,104 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         )
         return None
 
+    def sync_group_member_fields(  # noqa: PLR0913
+        self,
+        source_group_id: int,
+        target_group_id: int,
+        field_mapping: dict[int, int | str],
+        *,
+        person_ids: list[int] | None = None,
+        source_members: list[dict] | None = None,
+        data: dict | None = None,
+    ) -> dict[int, dict | None]:
+        """Copies group member field values of one group to another group.
+
+        Only persons which are member of both groups are considered.
+        Members are only updated if at least one mapped field value differs.
+        Updates are sent using max_workers concurrent requests.
+
+        Arguments:
+            source_group_id: group to read the field values from
+            target_group_id: group to write the field values to
+            field_mapping: {source field id: target field id}
+            person_ids: optional filter of persons to consider
+            source_members: members of the source group if already retrieved
+            data: additional group member fields sent with each update
+                e.g. {"comment": "Updated over API"}
+
+        Returns:
+            dict with personId and updated group member (None if failed)
+                only for members which required an update
+        """
+        if source_members is None:
+            source_members = self.get_group_members(group_id=source_group_id)
+        target_members = {
+            member["personId"]: member
+            for member in self.get_group_members(group_id=target_group_id)
+        }
+
+        changes = {}
+        for source_member in source_members:
+            person_id = source_member["personId"]
+            if person_id not in target_members:
+                continue
+            if person_ids is not None and person_id not in person_ids:
+                continue
+            if changed_fields := self._get_group_member_field_changes(
+                source_member=source_member,
+                target_member=target_members[person_id],
+                field_mapping=field_mapping,
+            ):
+                changes[person_id] = changed_fields
+
+        logger.info(
+            "syncing group member fields from group %s to %s requires %s updates",
+            source_group_id,
+            target_group_id,
+            len(changes),
+        )
+        results = self._map_concurrently(
+            lambda person_id: self.update_group_member(
+                group_id=target_group_id,
+                person_id=person_id,
+                data={**(data or {}), "fields": changes[person_id]},
+            ),
+            changes,
+        )
+        return dict(zip(changes, results, strict=True))
+
+    def _get_group_member_field_changes(
+        self,
+        source_member: dict,
+        target_member: dict,
+        field_mapping: dict[int, int | str],
+    ) -> dict[str, object]:
+        """Helper which compares mapped group member field values.
+
+        Arguments:
+            source_member: group member with fields to read from
+            target_member: group member with fields to compare with
+            field_mapping: {source field id: target field id}
+
+        Returns:
+            {target field id: new value} for all fields with different values
+        """
+        source_values = {
+            str(field["id"]): field["value"]
+            for field in source_member.get("fields", [])
+        }
+        target_values = {
+            str(field["id"]): field["value"]
+            for field in target_member.get("fields", [])
+        }
+        return {
+            str(target_field_id): source_values[str(source_field_id)]
+            for source_field_id, target_field_id in field_mapping.items()
+            if str(source_field_id) in source_values
+            and source_values[str(source_field_id)]
+            != target_values.get(str(target_field_id))
+        }
+
     def delete_group(self, group_id: int) -> bool:
         """Delete the given group.
 
@@ -311,6 +458,7 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
 
         if response.status_code == requests.codes.no_content:
             logger.debug("First response of Delete Group successful")
+            self.invalidate_cache("get_group_hierarchy")
             return True
         logger.warning(
             "%s Something went wrong deleting group: %s",
@@ -319,6 +467,7 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         )
         return None
 
+    @cached
     def get_grouptypes(self, **kwargs: dict) -> dict:
         """Get list of all grouptypes.
 
@@ -336,8 +485,8 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
             logger.debug(
                 "First response of Grouptypes successful len=%s",
                 len(response_content),
@@ -367,8 +516,8 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
             logger.debug(
                 "First response of Group Permissions successful len=%s",
                 len(response_content),
@@ -391,6 +540,9 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         Kwargs:
             role_ids: list[int]: optional filter list of role ids
             person_ids: list[int]: optional filter by person_id
+            fields: list[str]: only keep these keys of each member
+                e.g. personId, nested keys separated by dots
+                e.g. person.domainAttributes.firstName
 
         Returns:
             list of group member dicts
@@ -407,14 +559,17 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers, params=params)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
 
+            fields = kwargs.get("fields")
             response_data = self.combine_paginated_response_data(
                 response_content,
                 url=url,
+                convert=self._create_projection(fields) if fields else None,
                 headers=headers,
+                params=params,
             )
-            return [response_data] if isinstance(response_data, dict) else response_data
+            return response_data if isinstance(response_data, list) else [response_data]
 
         logger.warning(
             "%s Something went wrong fetching group members: %s",
@@ -439,7 +594,7 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers, params=params)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
 
             response_data = self.combine_paginated_response_data(
                 response_content,
@@ -471,7 +626,7 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers, params=params)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
 
             response_data = self.combine_paginated_response_data(
                 response_content,
@@ -500,12 +655,13 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
 
         Args:
             group_ids: list of group ids to look for. Defaults to Any
-            with_deleted: If true return also delted group members. Defaults to True
+            with_deleted: If true return also deleted group members. Defaults to False
             kwargs: see below
 
         Keywords:
             grouptype_role_ids: list[int] of grouptype_role_ids to consider
             person_ids: list[int]: person to consider for result
+            as_records: bool: return compact GroupMemberRecord instead of dicts
 
         Permissions:
             requires "administer persons"
@@ -515,42 +671,123 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         """
         url = self.domain + "/api/groups/members"
         headers = {"accept": "application/json"}
-        params = {"ids[]": group_ids, with_deleted: with_deleted}
+        params, chunked_param = self._get_groups_members_params(
+            group_ids, with_deleted=with_deleted, **kwargs
+        )
 
-        response = self.session.get(url=url, headers=headers, params=params)
+        result_list = self._get_chunked_data(
+            url,
+            chunked_param,
+            headers=headers,
+            params=params,
+            convert=GroupMemberRecord.from_dict if kwargs.get("as_records") else None,
+        )
+        if result_list is None:
+            return None
 
-        if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+        # filters are repeated in case they could not be passed to ChurchTools
+        if grouptype_role_ids := kwargs.get("grouptype_role_ids"):
+            result_list = [
+                group
+                for group in result_list
+                if group["groupTypeRoleId"] in grouptype_role_ids
+            ]
+        if person_ids := kwargs.get("person_ids"):
+            result_list = [
+                group for group in result_list if group["personId"] in person_ids
+            ]
+
+        return result_list
+
+    def iter_groups_members(
+        self,
+        group_ids: list[int] | None = None,
+        *,
+        with_deleted: bool = False,
+        **kwargs: dict,
+    ) -> Iterator[dict]:
+        """Generator variant of get_groups_members which yields page by page.
 
-            response_data = self.combine_paginated_response_data(
-                response_content,
-                url=url,
-                headers=headers,
-                params=params,
-            )
-            result_list = (
-                [response_data] if isinstance(response_data, dict) else response_data
+        Args:
+            group_ids: list of group ids to look for. Defaults to Any
+            with_deleted: If true return also deleted group members. Defaults to False
+            kwargs: see get_groups_members
+
+        Yields:
+            person to group assignments
+        """
+        url = self.domain + "/api/groups/members"
+        headers = {"accept": "application/json"}
+        params, _chunked_param = self._get_groups_members_params(
+            group_ids, with_deleted=with_deleted, **kwargs
+        )
+
+        response = self.session.get(url=url, headers=headers, params=params)
+
+        if response.status_code != requests.codes.ok:
+            logger.warning(
+                "%s Something went wrong fetching group members: %s",
+                response.status_code,
+                response.content,
             )
-            if grouptype_role_ids := kwargs.get("grouptype_role_ids"):
-                result_list = [
-                    group
-                    for group in result_list
-                    if group["groupTypeRoleId"] in grouptype_role_ids
-                ]
-            if person_ids := kwargs.get("person_ids"):
-                result_list = [
-                    group for group in result_list if group["personId"] in person_ids
-                ]
+            return
 
-            return result_list
+        response_content = self._decode_response(response)
+        grouptype_role_ids = kwargs.get("grouptype_role_ids")
+        person_ids = kwargs.get("person_ids")
+        for member in self.iterate_paginated_response_data(
+            response_content,
+            url=url,
+            headers=headers,
+            params=params,
+        ):
+            if grouptype_role_ids and member["groupTypeRoleId"] not in (
+                grouptype_role_ids
+            ):
+                continue
+            if person_ids and member["personId"] not in person_ids:
+                continue
+            yield member
+
+    def _get_groups_members_params(
+        self, group_ids: list[int] | None, *, with_deleted: bool, **kwargs: dict
+    ) -> tuple[dict, str]:
+        """Helper function for get groups members that prepares params.
+
+        Filters by person and role are passed to ChurchTools in order to
+        reduce the number of members and pages transferred.
+        The longest list is split into chunks by _get_chunked_data.
+        Other lists longer than id_chunk_size are only applied client side.
 
-            return result_list
-        logger.warning(
-            "%s Something went wrong fetching group members: %s",
-            response.status_code,
-            response.content,
-        )
-        return None
+        Arguments:
+            group_ids: list of group ids to look for
+            with_deleted: If true return also deleted group members
+            kwargs: see get_groups_members
+
+        Returns:
+            params dict which can be used for request and name of the chunked param
+        """
+        filters = {
+            "ids[]": group_ids,
+            "person_ids[]": kwargs.get("person_ids"),
+            "grouptype_role_ids[]": kwargs.get("grouptype_role_ids"),
+        }
+        filters = {key: ids for key, ids in filters.items() if ids}
+        if group_ids and len(group_ids) > self.id_chunk_size:
+            chunked_param = "ids[]"  # groups are never filtered client side
+        else:
+            chunked_param = max(
+                filters, key=lambda key: len(filters[key]), default="ids[]"
+            )
+
+        params = {
+            key: ids
+            for key, ids in filters.items()
+            if key in ("ids[]", chunked_param) or len(ids) <= self.id_chunk_size
+        }
+        if with_deleted:
+            params["with_deleted"] = "true"
+        return params, chunked_param
 
     def add_group_member(self, group_id: int, person_id: int, **kwargs: dict) -> dict:
         """Add a member to a group.
@@ -584,10 +821,10 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.put(url=url, json=data, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
             # For unknown reasons the endpoint returns a list of items instead
             # of a single item as specified in the API documentation.
-            return response_content["data"][0].copy()
+            return response_content["data"][0]
 
         logger.warning(
             "%s Something went wrong adding group member: %s",
@@ -620,6 +857,135 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         )
         return None
 
+    def reconcile_group_members(
+        self,
+        group_id: int,
+        desired: dict[int, dict] | list[int],
+        *,
+        remove: bool = True,
+        dry_run: bool = False,
+    ) -> dict:
+        """Changes the members of a group to match the desired state.
+
+        Current members are retrieved once and only the differences are applied
+        using max_workers concurrent requests.
+        Role, status and fields are only compared if part of the desired state.
+
+        Arguments:
+            group_id: group to change
+            desired: {person_id: {"grouptype_role_id": int,
+                "group_member_status": str, "fields": {field id: value}}}
+                all inner keys are optional - a list of person ids
+                only adds and removes members
+            remove: remove members which are not desired. Defaults to True
+            dry_run: only report the required changes. Defaults to False
+
+        Returns:
+            dict with person ids which were added, updated and removed,
+                the number of unchanged members and person ids which failed
+        """
+        if not isinstance(desired, dict):
+            desired = {person_id: {} for person_id in desired}
+        current_members = self.get_group_members(group_id=group_id)
+        if current_members is None:
+            return None
+
+        batch, summary = self._plan_group_member_changes(
+            group_id=group_id,
+            current={member["personId"]: member for member in current_members},
+            desired=desired,
+            remove=remove,
+        )
+        logger.info(
+            "reconciling group %s requires %s additions, %s updates and %s removals",
+            group_id,
+            len(summary["added"]),
+            len(summary["updated"]),
+            len(summary["removed"]),
+        )
+        if dry_run:
+            return summary
+
+        batch.execute()
+        failed = {batch_result.kwargs["person_id"] for batch_result in batch.failed}
+        for key in ("added", "updated", "removed"):
+            summary[key] = [
+                person_id for person_id in summary[key] if person_id not in failed
+            ]
+        summary["failed"] = sorted(failed)
+        return summary
+
+    def _plan_group_member_changes(
+        self, group_id: int, current: dict, desired: dict, *, remove: bool
+    ) -> tuple[Batch, dict]:
+        """Helper which queues all changes required to reach the desired members.
+
+        Arguments:
+            group_id: group to change
+            current: {person_id: current group member}
+            desired: {person_id: desired state} see reconcile_group_members
+            remove: remove members which are not desired
+
+        Returns:
+            batch of queued changes and summary of planned changes
+        """
+        batch = Batch(self)
+        summary = {
+            "added": [],
+            "updated": [],
+            "removed": [],
+            "unchanged": 0,
+            "failed": [],
+        }
+        for person_id, spec in desired.items():
+            if person_id not in current:
+                summary["added"].append(person_id)
+                batch.add_group_member(group_id=group_id, person_id=person_id, **spec)
+            elif changes := self._get_group_member_changes(current[person_id], spec):
+                summary["updated"].append(person_id)
+                batch.update_group_member(
+                    group_id=group_id, person_id=person_id, data=changes
+                )
+            else:
+                summary["unchanged"] += 1
+        if remove:
+            for person_id in sorted(current.keys() - desired.keys()):
+                summary["removed"].append(person_id)
+                batch.remove_group_member(group_id=group_id, person_id=person_id)
+        return batch, summary
+
+    def _get_group_member_changes(self, member: dict, spec: dict) -> dict:
+        """Helper which compares a group member with its desired state.
+
+        Arguments:
+            member: current group member
+            spec: desired state see reconcile_group_members
+
+        Returns:
+            data for update_group_member - empty if nothing changed
+        """
+        changes = {}
+        for key, member_key in (
+            ("grouptype_role_id", "groupTypeRoleId"),
+            ("group_member_status", "groupMemberStatus"),
+        ):
+            if key in spec and spec[key] != member.get(member_key):
+                changes[member_key] = spec[key]
+
+        desired_fields = spec.get("fields", {})
+        if changed_fields := self._get_group_member_field_changes(
+            source_member={
+                "fields": [
+                    {"id": field_id, "value": value}
+                    for field_id, value in desired_fields.items()
+                ]
+            },
+            target_member=member,
+            field_mapping={field_id: field_id for field_id in desired_fields},
+        ):
+            changes["fields"] = changed_fields
+        return changes
+
     def get_group_roles(self, group_id: int) -> list[dict]:
         """Get list of all roles for the given group.
 
@@ -633,7 +999,7 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
 
             response_data = self.combine_paginated_response_data(
                 response_content,
@@ -666,6 +1032,7 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
 
         if response.status_code == requests.codes.created:
             logger.debug("First response of Add Parent Group successful")
+            self.invalidate_cache("get_group_hierarchy")
             return True
         logger.warning(
             "%s Something went wrong adding parent group: %s",
@@ -689,6 +1056,7 @@ class ChurchToolsApiGroups(ChurchToolsApiAbstract):
 
         if response.status_code == requests.codes.no_content:
             logger.debug("First response of Remove Parent Group successful")
+            self.invalidate_cache("get_group_hierarchy")
             return True
         logger.warning(
             "%s Something went wrong removing parent group: %s",
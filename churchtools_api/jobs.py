@@ -0,0 +1,257 @@
+"""module containing long running jobs which can be resumed after an interruption.
+
+Progress is stored in a JSON checkpoint file - a job which is started again
+with the same checkpoint skips everything which was processed before.
+
+Usage:
+    job = CheckpointedJob(api, checkpoint_file="tag_songs.json")
+    job.run_paginated(
+        "/api/songs", lambda song: api.add_tag("song", song["id"], "sample")
+    )
+"""
+
+import json
+import logging
+import os
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import requests
+
+if TYPE_CHECKING:
+    from churchtools_api.churchtools_api import ChurchToolsApi
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """Progress of a job persisted as JSON.
+
+    processed: ids of items which were processed successfully
+    failed: ids of items which could not be processed - kept for inspection,
+        run repeats them as long as they are part of items
+    cursor: position of the job e.g. {"page": 3} for paginated requests
+    state: any additional json compatible information of the job itself
+    """
+
+    def __init__(self, filename: str | Path) -> None:
+        """Init loading an existing checkpoint if available.
+
+        Args:
+            filename: path of the json file
+        """
+        self.filename = Path(filename)
+        try:
+            content = json.loads(self.filename.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            content = {}
+        self.processed: set = set(content.get("processed", []))
+        self.failed: set = set(content.get("failed", []))
+        self.cursor: dict = content.get("cursor", {})
+        self.state: dict = content.get("state", {})
+        if content:
+            logger.info(
+                "resuming from checkpoint %s with %s processed items",
+                self.filename,
+                len(self.processed),
+            )
+
+    def save(self) -> None:
+        """Writes the current progress replacing the file at once."""
+        temp_file = self.filename.with_suffix(".tmp")
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        content = {
+            "processed": sorted(self.processed),
+            "failed": sorted(self.failed),
+            "cursor": self.cursor,
+            "state": self.state,
+        }
+        with temp_file.open("w", encoding="utf-8") as file:
+            json.dump(content, file)
+            file.flush()
+            os.fsync(file.fileno())
+        temp_file.replace(self.filename)
+
+    def clear(self) -> None:
+        """Removes all progress including the file."""
+        self.processed.clear()
+        self.failed.clear()
+        self.cursor.clear()
+        self.state.clear()
+        self.filename.unlink(missing_ok=True)
+
+
+class CheckpointedJob:
+    """Applies a function to many items and records the progress after each chunk.
+
+    Items are processed with max_workers concurrent workers.
+    An item counts as processed unless the function returns None or False.
+    Exceptions stop the job after storing the progress of the current chunk
+    so that the next run continues with the remaining items.
+    """
+
+    def __init__(
+        self,
+        api: "ChurchToolsApi",
+        checkpoint_file: str | Path,
+        *,
+        chunk_size: int = 50,
+        max_workers: int | None = None,
+    ) -> None:
+        """Init of a job.
+
+        Args:
+            api: logged in ChurchToolsApi
+            checkpoint_file: json file used to store progress
+            chunk_size: number of items processed between checkpoints
+            max_workers: number of concurrent workers. Defaults to api.max_workers
+        """
+        self.api = api
+        self.checkpoint = Checkpoint(checkpoint_file)
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        items: Iterable,
+        function: Callable,
+        *,
+        get_id: Callable = lambda item: item["id"],
+        finish: bool = True,
+    ) -> dict:
+        """Applies function to all items which were not processed before.
+
+        Args:
+            items: items to process e.g. songs - may be a generator
+            function: called with each item
+            get_id: returns the json compatible id of an item. Defaults to item["id"]
+            finish: remove the checkpoint once all items are processed
+                without failures. Defaults to True
+
+        Returns:
+            dict with number of processed and skipped items and failed ids
+        """
+        summary = {"processed": 0, "skipped": 0, "failed": []}
+
+        def get_pending() -> Iterator:
+            for item in items:
+                if get_id(item) in self.checkpoint.processed:
+                    summary["skipped"] += 1
+                else:
+                    yield item
+
+        pending = get_pending()
+        while chunk := list(islice(pending, self.chunk_size)):
+            self._run_chunk(chunk, function=function, get_id=get_id, summary=summary)
+
+        logger.info("job finished %s", summary)
+        if finish and not self.checkpoint.failed:
+            self.checkpoint.clear()
+        return summary
+
+    def _run_chunk(
+        self, chunk: list, function: Callable, get_id: Callable, summary: dict
+    ) -> None:
+        """Helper which processes one chunk and stores the progress.
+
+        Args:
+            chunk: items to process
+            function: called with each item
+            get_id: returns the id of an item
+            summary: counters updated with the results
+        """
+
+        def process(item: object) -> object:
+            try:
+                return function(item)
+            except Exception as error:  # noqa: BLE001 - re-raised after saving
+                return error
+
+        results = self.api._map_concurrently(  # noqa: SLF001
+            process, chunk, max_workers=self.max_workers
+        )
+
+        errors = []
+        for item, result in zip(chunk, results, strict=True):
+            item_id = get_id(item)
+            if isinstance(result, Exception):
+                errors.append(result)
+            elif result is None or result is False:
+                self.checkpoint.failed.add(item_id)
+                summary["failed"].append(item_id)
+            else:
+                self.checkpoint.processed.add(item_id)
+                self.checkpoint.failed.discard(item_id)
+                summary["processed"] += 1
+        self.checkpoint.save()
+        if errors:
+            raise errors[0]
+
+    def run_paginated(
+        self,
+        url: str,
+        function: Callable,
+        *,
+        params: dict | None = None,
+        get_id: Callable = lambda item: item["id"],
+        limit: int = 50,
+    ) -> dict:
+        """Applies function to all items of a paginated endpoint.
+
+        The current page is stored as cursor - pages which were completed
+        by a previous run are not requested again.
+        Failed ids of completed pages remain in checkpoint.failed
+        and can be repeated using run.
+
+        Args:
+            url: endpoint relative to the domain e.g. "/api/songs"
+            function: called with each item
+            params: additional params of the request. Defaults to None
+            get_id: returns the json compatible id of an item. Defaults to item["id"]
+            limit: number of items per page. Defaults to 50
+
+        Returns:
+            dict with number of processed and skipped items and failed ids
+        """
+        summary = {"processed": 0, "skipped": 0, "failed": []}
+        page = self.checkpoint.cursor.get("page", 1)
+        while True:
+            response = self.api.session.get(
+                url=self.api.domain + url,
+                headers={"accept": "application/json"},
+                params={**(params or {}), "limit": limit, "page": page},
+            )
+            if response.status_code != requests.codes.ok:
+                logger.warning(
+                    "%s Something went wrong fetching page %s of %s: %s",
+                    response.status_code,
+                    page,
+                    url,
+                    response.content,
+                )
+                summary["completed"] = False
+                return summary
+
+            response_content = self.api._decode_response(response)  # noqa: SLF001
+            page_summary = self.run(
+                response_content["data"], function, get_id=get_id, finish=False
+            )
+            summary["processed"] += page_summary["processed"]
+            summary["skipped"] += page_summary["skipped"]
+            summary["failed"].extend(page_summary["failed"])
+
+            pagination = response_content.get("meta", {}).get("pagination") or {}
+            if page >= pagination.get("lastPage", page):
+                break
+            page += 1
+            self.checkpoint.cursor["page"] = page
+            self.checkpoint.processed.clear()  # ids of completed pages are not needed
+            self.checkpoint.save()
+
+        summary["completed"] = True
+        logger.info("paginated job finished %s", summary)
+        if not self.checkpoint.failed:
+            self.checkpoint.clear()
+        return summary
@@ -0,0 +1,153 @@
+"""module containing a persistent storage of login sessions.
+
+Short running scripts can reuse the session cookie and CSRF token
+of a previous execution instead of logging in again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from time import time
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class LoginStore:
+    """JSON file which keeps login sessions per domain and credentials for ttl.
+
+    Credentials themselves are never stored - only a hash is used as key.
+    The file contains session cookies and should be protected like credentials,
+    it is therefore created readable for the current user only.
+    """
+
+    def __init__(self, filename: str | Path, ttl: float = 3600) -> None:
+        """Init of a store using filename.
+
+        Args:
+            filename: path of the json file - created on first save
+            ttl: seconds a stored login is reused. Defaults to 3600
+        """
+        self.filename = Path(filename)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(domain: str, ct_token: str | None, ct_user: str | None) -> str:
+        """Identifier of a login which does not reveal the credentials.
+
+        Args:
+            domain: ChurchTools domain
+            ct_token: login token if used
+            ct_user: username if used
+
+        Returns:
+            hash of domain and credentials
+        """
+        return hashlib.sha256(f"{domain}|{ct_token}|{ct_user}".encode()).hexdigest()
+
+    def _read(self) -> dict:
+        """Helper which reads all stored logins.
+
+        Returns:
+            dict of key and login state - empty if not readable
+        """
+        try:
+            return json.loads(self.filename.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, logins: dict) -> None:
+        """Helper which replaces all stored logins.
+
+        Args:
+            logins: dict of key and login state
+        """
+        temp_file = self.filename.with_suffix(".tmp")
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        with os.fdopen(
+            os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600),
+            "w",
+            encoding="utf-8",
+        ) as file:
+            json.dump(logins, file)
+        temp_file.replace(self.filename)
+
+    def load(self, key: str) -> dict | None:
+        """Retrieve a stored login if not expired.
+
+        Args:
+            key: identifier created by get_key
+
+        Returns:
+            dict with person_id, csrf_token and cookies or None if not available
+        """
+        with self._lock:
+            state = self._read().get(key)
+        if state is None or state["expires"] < time():
+            return None
+        return state
+
+    def save(self, key: str, session: requests.Session, person_id: int) -> None:
+        """Stores the login of a session.
+
+        Expired logins of other keys are removed on the way.
+
+        Args:
+            key: identifier created by get_key
+            session: logged in session
+            person_id: id of the logged in person
+        """
+        state = {
+            "expires": time() + self.ttl,
+            "person_id": person_id,
+            "csrf_token": session.headers.get("CSRF-Token"),
+            "cookies": [
+                {
+                    "name": cookie.name,
+                    "value": cookie.value,
+                    "domain": cookie.domain,
+                    "path": cookie.path,
+                    "secure": cookie.secure,
+                    "expires": cookie.expires,
+                }
+                for cookie in session.cookies
+            ],
+        }
+        with self._lock:
+            logins = {
+                stored_key: stored
+                for stored_key, stored in self._read().items()
+                if stored["expires"] >= time()
+            }
+            logins[key] = state
+            self._write(logins)
+        logger.debug("stored login of person %s", person_id)
+
+    def delete(self, key: str) -> None:
+        """Removes a stored login e.g. because it is no longer valid.
+
+        Args:
+            key: identifier created by get_key
+        """
+        with self._lock:
+            logins = self._read()
+            if logins.pop(key, None) is not None:
+                self._write(logins)
+
+    @staticmethod
+    def apply(state: dict, session: requests.Session) -> None:
+        """Restores a stored login into a session.
+
+        Args:
+            state: stored login as returned by load
+            session: session which should be logged in
+        """
+        for cookie in state["cookies"]:
+            session.cookies.set(**cookie)
+        if state["csrf_token"]:
+            session.headers["CSRF-Token"] = state["csrf_token"]
@@ -0,0 +1,252 @@
+"""module containing collectors for request metrics of a RateLimitedSession.
+
+A collector is passed to the session e.g. using
+    ChurchToolsApi(domain, session_options={"metrics": InMemoryMetrics()})
+and receives one RequestMetric per http request (including repeated ones)
+and the time spent waiting because of rate limits.
+"""
+
+import logging
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_NUMERIC_PATH_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+def normalize_endpoint(url: str) -> str:
+    """Converts a request url into an endpoint name used for grouping.
+
+    Domain and params are removed, numeric ids are replaced by {id}
+    e.g. https://xyz.church.tools/api/persons/12/tags?x=1 -> /api/persons/{id}/tags
+
+    Args:
+        url: complete url of the request
+
+    Returns:
+        endpoint name
+    """
+    return _NUMERIC_PATH_SEGMENT.sub("{id}", urlsplit(url).path)
+
+
+@dataclass(frozen=True)
+class RequestMetric:
+    """Measurement of one http request."""
+
+    method: str
+    endpoint: str
+    status_code: int
+    latency: float
+    bytes_received: int
+
+
+class MetricsCollector:
+    """Base of all collectors - ignores all measurements.
+
+    Subclasses must be thread safe because sessions are shared by threads.
+    """
+
+    def record_request(self, metric: RequestMetric) -> None:
+        """Called after each http request.
+
+        Args:
+            metric: measurement of the request
+        """
+
+    def record_sleep(self, seconds: float) -> None:
+        """Called after waiting because of the rate limit.
+
+        Args:
+            seconds: time spent waiting
+        """
+
+
+class InMemoryMetrics(MetricsCollector):
+    """Collector which aggregates all measurements per method and endpoint."""
+
+    def __init__(self) -> None:
+        """Init without any measurements."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Removes all measurements."""
+        with self._lock:
+            self._endpoints: dict[tuple[str, str], dict] = {}
+            self._sleep_seconds = 0.0
+
+    def record_request(self, metric: RequestMetric) -> None:
+        """See MetricsCollector.record_request."""
+        key = (metric.method, metric.endpoint)
+        with self._lock:
+            if key not in self._endpoints:
+                self._endpoints[key] = {
+                    "count": 0,
+                    "rate_limited": 0,
+                    "bytes_received": 0,
+                    "latency_sum": 0.0,
+                    "latency_max": 0.0,
+                    "latency_buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+                    "status_codes": {},
+                }
+            stats = self._endpoints[key]
+            stats["count"] += 1
+            stats["bytes_received"] += metric.bytes_received
+            stats["latency_sum"] += metric.latency
+            stats["latency_max"] = max(stats["latency_max"], metric.latency)
+            stats["latency_buckets"][bisect_left(LATENCY_BUCKETS, metric.latency)] += 1
+            stats["status_codes"][metric.status_code] = (
+                stats["status_codes"].get(metric.status_code, 0) + 1
+            )
+            if metric.status_code == 429:  # noqa: PLR2004
+                stats["rate_limited"] += 1
+
+    def record_sleep(self, seconds: float) -> None:
+        """See MetricsCollector.record_sleep."""
+        with self._lock:
+            self._sleep_seconds += seconds
+
+    def snapshot(self) -> dict:
+        """Current state of all measurements.
+
+        Returns:
+            dict with total values and "endpoints" keyed by "METHOD /endpoint"
+                latency_buckets contains the number of requests
+                which are not slower than each of LATENCY_BUCKETS (and +Inf)
+        """
+        with self._lock:
+            endpoints = {}
+            for (method, endpoint), stats in sorted(self._endpoints.items()):
+                cumulative, buckets = 0, {}
+                for bound, count in zip(
+                    (*LATENCY_BUCKETS, float("inf")),
+                    stats["latency_buckets"],
+                    strict=True,
+                ):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                endpoints[f"{method} {endpoint}"] = {
+                    **stats,
+                    "latency_buckets": buckets,
+                    "status_codes": dict(stats["status_codes"]),
+                    "latency_mean": stats["latency_sum"] / stats["count"],
+                }
+            return {
+                "requests": sum(item["count"] for item in endpoints.values()),
+                "rate_limited": sum(
+                    item["rate_limited"] for item in endpoints.values()
+                ),
+                "bytes_received": sum(
+                    item["bytes_received"] for item in endpoints.values()
+                ),
+                "sleep_seconds": self._sleep_seconds,
+                "endpoints": endpoints,
+            }
+
+
+class PrometheusMetrics(InMemoryMetrics):
+    """Collector which can be rendered in the Prometheus text exposition format."""
+
+    def __init__(self, prefix: str = "churchtools_api") -> None:
+        """Init without any measurements.
+
+        Args:
+            prefix: used for all metric names. Defaults to churchtools_api
+        """
+        super().__init__()
+        self.prefix = prefix
+
+    def exposition(self) -> str:
+        """Renders all measurements e.g. to be served on /metrics.
+
+        Returns:
+            text in Prometheus exposition format version 0.0.4
+        """
+        snapshot = self.snapshot()
+        prefix = self.prefix
+        endpoints = [
+            ('method="{}",endpoint="{}"'.format(*name.split(" ", 1)), stats)
+            for name, stats in snapshot["endpoints"].items()
+        ]
+
+        lines = [f"# TYPE {prefix}_requests_total counter"]
+        for labels, stats in endpoints:
+            lines.extend(
+                f'{prefix}_requests_total{{{labels},status="{status}"}} {count}'
+                for status, count in sorted(stats["status_codes"].items())
+            )
+        for name, key in (
+            ("rate_limited_total", "rate_limited"),
+            ("received_bytes_total", "bytes_received"),
+        ):
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            lines.extend(
+                f"{prefix}_{name}{{{labels}}} {stats[key]}"
+                for labels, stats in endpoints
+            )
+
+        histogram = f"{prefix}_request_duration_seconds"
+        lines.append(f"# TYPE {histogram} histogram")
+        for labels, stats in endpoints:
+            lines.extend(
+                f'{histogram}_bucket{{{labels},le="{_format_bound(bound)}"}} {count}'
+                for bound, count in stats["latency_buckets"].items()
+            )
+            lines.append(f"{histogram}_sum{{{labels}}} {stats['latency_sum']}")
+            lines.append(f"{histogram}_count{{{labels}}} {stats['count']}")
+
+        lines.append(f"# TYPE {prefix}_sleep_seconds_total counter")
+        lines.append(f"{prefix}_sleep_seconds_total {snapshot['sleep_seconds']}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_bound(bound: float) -> str:
+    """Helper which formats a histogram bucket bound for Prometheus.
+
+    Args:
+        bound: upper bound in seconds
+
+    Returns:
+        text representation with +Inf for the last bucket
+    """
+    return "+Inf" if bound == float("inf") else str(bound)
+
+
+class CallbackMetrics(MetricsCollector):
+    """Collector which forwards each measurement to callbacks.
+
+    Can be used to feed other monitoring systems like statsd.
+    Callbacks are executed in the requesting thread and should return quickly.
+    """
+
+    def __init__(
+        self,
+        on_request: Callable[[RequestMetric], None] | None = None,
+        on_sleep: Callable[[float], None] | None = None,
+    ) -> None:
+        """Init with the functions to call.
+
+        Args:
+            on_request: called with each RequestMetric. Defaults to None
+            on_sleep: called with the seconds waited. Defaults to None
+        """
+        self.on_request = on_request
+        self.on_sleep = on_sleep
+
+    def record_request(self, metric: RequestMetric) -> None:
+        """See MetricsCollector.record_request."""
+        if self.on_request:
+            self.on_request(metric)
+
+    def record_sleep(self, seconds: float) -> None:
+        """See MetricsCollector.record_sleep."""
+        if self.on_sleep:
+            self.on_sleep(seconds)
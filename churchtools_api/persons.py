@@ -1,11 +1,13 @@
 """module containing parts used for person handling."""
 
-import json
 import logging
+from collections.abc import Iterator
 
 import requests
 
+from churchtools_api.cache import cached
 from churchtools_api.churchtools_api_abstract import ChurchToolsApiAbstract
+from churchtools_api.records import PersonRecord
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,9 @@ class ChurchToolsApiPersons(ChurchToolsApiAbstract):
         Kwargs:
             ids: list: of a ids filter
             returnAsDict: bool: true if should return a dict instead of list
+            as_records: bool: return compact PersonRecord instead of dicts
+            fields: list[str]: only keep these keys of each person e.g. email,
+                nested keys separated by dots - id is always kept
 
         Permissions:
             some fields e.g. sexId require "security level person" with at least
@@ -43,46 +48,73 @@ class ChurchToolsApiPersons(ChurchToolsApiAbstract):
         if "ids" in kwargs:
             params["ids[]"] = kwargs["ids"]
 
+        convert = PersonRecord.from_dict if kwargs.get("as_records") else None
+        if fields := kwargs.get("fields"):
+            convert = self._create_projection(["id", *fields], convert=convert)
+
         headers = {"accept": "application/json"}
-        response = self.session.get(url=url, headers=headers, params=params)
+        response_data = self._get_chunked_data(
+            url,
+            "ids[]",
+            headers=headers,
+            params=params,
+            get_id=lambda person: person["id"],
+            convert=convert,
+        )
+        if response_data is None:
+            logger.info("Persons requested failed")
+            return None
+
+        if len(response_data) == 0:
+            logger.warning(
+                "Requesting ct_users %s returned an empty response - "
+                "make sure the user has correct permissions",
+                params,
+            )
 
-        if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+        if kwargs.get("returnAsDict") and "serviceId" not in kwargs:
+            response_data = {item["id"]: item for item in response_data}
 
-            logger.debug(
-                "len of first response of GET Persons successful len=%s",
-                len(response_content),
-            )
+        logger.debug("Persons load successful len=%s", len(response_data))
+        return response_data
 
-            if len(response_data) == 0:
-                logger.warning(
-                    "Requesting ct_users %s returned an empty response - "
-                    "make sure the user has correct permissions",
-                    params,
-                )
-
-            response_data = self.combine_paginated_response_data(
-                response_content,
-                url=url,
-                headers=headers,
-                params=params,
-            )
-            response_data = (
-                [response_data] if isinstance(response_data, dict) else response_data
-            )
+    def iter_persons(self, **kwargs: dict) -> Iterator[dict]:
+        """Generator variant of get_persons which yields persons page by page.
 
-            if kwargs.get("returnAsDict") and "serviceId" not in kwargs:
-                result = {}
-                for item in response_data:
-                    result[item["id"]] = item
-                response_data = result
+        With max_workers greater than 1 the next pages are requested while
+        the persons of the current page are processed.
+        The complete list is never held in memory.
 
-            logger.debug("Persons load successful len=%s", len(response_data))
-            return response_data
-        logger.info("Persons requested failed: %s", response.status_code)
-        return None
+        Arguments:
+            kwargs: optional keywords as listed
+
+        Kwargs:
+            ids: list: of a ids filter
+
+        Yields:
+            user dicts
+        """
+        url = self.domain + "/api/persons"
+        params = {"limit": 50}  # increases default pagination size
+        if "ids" in kwargs:
+            params["ids[]"] = kwargs["ids"]
+
+        headers = {"accept": "application/json"}
+        response = self.session.get(url=url, headers=headers, params=params)
+
+        if response.status_code != requests.codes.ok:
+            logger.info("Persons requested failed: %s", response.status_code)
+            return
+
+        response_content = self._decode_response(response)
+        yield from self.iterate_paginated_response_data(
+            response_content,
+            url=url,
+            headers=headers,
+            params=params,
+        )
 
+    @cached
     def get_persons_masterdata(
         self,
         *,
@@ -106,8 +138,8 @@ class ChurchToolsApiPersons(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
 
             if resultClass:
                 response_data = response_data[resultClass]
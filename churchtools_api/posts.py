@@ -1,12 +1,10 @@
 """module containing parts used for posts handling."""
 
-import json
 import logging
 from datetime import datetime
 from enum import Enum
 
 import requests
-from tzlocal import get_localzone
 
 from churchtools_api.churchtools_api_abstract import ChurchToolsApiAbstract
 
@@ -122,8 +120,8 @@ class ChurchToolsApiPosts(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers, params=params)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
 
             logger.debug(
                 "len of first response of GET posts successful len=%s",
@@ -141,6 +139,8 @@ class ChurchToolsApiPosts(ChurchToolsApiAbstract):
             total_entries = response_content.get("meta", {}).get("pagination")["total"]
             page_entries = response_content.get("meta", {}).get("pagination")["limit"]
             if total_entries > page_entries and not limit:
+                from tzlocal import get_localzone  # imported on first use only
+
                 last_date = response_content["data"][-1]["publishedDate"]
                 logger.info(
                     "pagination based on before date /api/posts"
@@ -198,8 +198,8 @@ class ChurchToolsApiPosts(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers, params=params)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
-            response_data = response_content["data"].copy()
+            response_content = self._decode_response(response)
+            response_data = response_content["data"]
 
             logger.debug(
                 "len of first response of GET Persons successful len=%s",
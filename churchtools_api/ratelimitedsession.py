@@ -2,42 +2,497 @@
 
 ChurchTools API usually responds code 429 on excessive use
  - repeating request after timeout will suceed
+ - a client side token bucket can be used to avoid running into the limit at all
 """
+import copy
 import logging
-from time import sleep
+import random
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic, sleep
 from typing import override
+from urllib.parse import urlsplit
 
 import requests
 
+from churchtools_api.metrics import MetricsCollector, RequestMetric, normalize_endpoint
+from churchtools_api.responsecache import ResponseCache
+
 logger = logging.getLogger(__name__)
 
+# requests used to login which must update the cookies of each session on its own
+LOGIN_PATHS = ("/api/whoami", "/api/csrftoken", "/api/login")
+# requests which have the same effect if repeated
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RateLimiter:
+    """Adaptive token bucket which is shared by all requests of a session.
+
+    Tokens are refilled with requests_per_second up to burst.
+    Each request consumes one token and waits if none is available.
+    Once the server responds with a rate limit the rate is halved and slowly
+    increased again with each successful request (AIMD).
+
+    Without requests_per_second no proactive limit is applied and the
+    limiter is only used to pause all threads after a rate limited response.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float | None = None,
+        burst: int = 10,
+        *,
+        min_requests_per_second: float = 0.5,
+    ) -> None:
+        """Init of a token bucket.
+
+        Args:
+            requests_per_second: maximum sustained rate. Defaults to None (unlimited)
+            burst: number of requests which can be sent at once. Defaults to 10
+            min_requests_per_second: lower limit used when adapting to rate limits
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.min_requests_per_second = min_requests_per_second
+
+        self._lock = threading.Lock()
+        self._rate = requests_per_second
+        self._tokens = float(burst)
+        self._last_refill = monotonic()
+        self._paused_until = 0.0
+
+    @property
+    def rate(self) -> float | None:
+        """Currently applied requests per second after adaption."""
+        return self._rate
+
+    def acquire(self) -> float:
+        """Blocks until the next request is allowed to be sent.
+
+        Returns:
+            seconds waited
+        """
+        with self._lock:
+            now = monotonic()
+            wait = max(0.0, self._paused_until - now)
+            if self._rate:
+                self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._last_refill) * self._rate,
+                )
+                self._last_refill = now
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self._rate)
+        if wait > 0:
+            sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Pauses all requests for the given number of seconds.
+
+        Args:
+            seconds: duration of the pause starting now
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, monotonic() + seconds)
+
+    def on_success(self) -> None:
+        """Slowly increases the rate again after it was reduced."""
+        if not self.requests_per_second:
+            return
+        with self._lock:
+            self._rate = min(
+                self.requests_per_second,
+                self._rate + self.requests_per_second * 0.05,
+            )
+
+    def on_rate_limited(self) -> None:
+        """Halves the rate because the server responded with a rate limit."""
+        if not self.requests_per_second:
+            return
+        with self._lock:
+            self._rate = max(self.min_requests_per_second, self._rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            logger.debug("reduced request rate to %s per second", self._rate)
+
+
+class SingleFlight:
+    """Executes identical concurrent calls only once.
+
+    Threads calling run with a key which is already in progress wait for
+    the running call and share its result instead of executing it again.
+    """
+
+    def __init__(self) -> None:
+        """Init without calls in progress."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, tuple[Future, int]] = {}
+
+    def run(self, key: Hashable, function: Callable) -> tuple[object, bool]:
+        """Executes function unless a call with the same key is in progress.
+
+        Nested calls with the same key by the executing thread itself
+        (e.g. a repeated login) are executed directly in order to avoid deadlocks.
+
+        Args:
+            key: identifier of identical calls
+            function: executed without arguments
+
+        Returns:
+            result of the function and if it was shared from another thread
+        """
+        thread_id = threading.get_ident()
+        with self._lock:
+            if key in self._calls:
+                future, owner = self._calls[key]
+                if owner == thread_id:
+                    future = None
+                leader = False
+            else:
+                future, leader = Future(), True
+                self._calls[key] = (future, thread_id)
+
+        if not leader:
+            if future is None:
+                return function(), False
+            return future.result(), True
+
+        try:
+            result = function()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return result, False
+
 
 class RateLimitedSession(requests.Session):
     """This class wraps request.Sessions most important methods.
 
     with rate limits and retry
+
+    The session may be shared by multiple threads (e.g. concurrent pagination).
+    All of them share one RateLimiter so that a rate limited response pauses
+    every thread instead of each of them running into the rate limit on its own.
     """
 
-    def __init__(self) -> None:
-        """Inits session with additional params."""
+    def __init__(  # noqa: PLR0913
+        self,
+        requests_per_second: float | None = None,
+        burst: int = 10,
+        *,
+        max_retries: int | None = None,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        rate_limiter: RateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+        metrics: MetricsCollector | None = None,
+        on_unauthorized: Callable[[], bool] | None = None,
+        single_flight: SingleFlight | bool = True,
+    ) -> None:
+        """Inits session with additional params.
+
+        Args:
+            requests_per_second: client side limit. Defaults to None (unlimited)
+            burst: number of requests which can be sent at once. Defaults to 10
+            max_retries: number of repetitions of a rate limited request.
+                Defaults to None which repeats until successful
+            backoff_base: first waiting time in seconds if no Retry-After is sent
+            backoff_max: upper limit of the waiting time in seconds
+            rate_limiter: shared limiter e.g. from another session.
+                Overrides requests_per_second and burst if specified
+            response_cache: storage used for conditional GET requests.
+                Defaults to None which disables conditional requests
+            metrics: collector of latency, bytes and rate limits per endpoint
+                e.g. InMemoryMetrics. Defaults to None
+            on_unauthorized: called once if a request is rejected with 401
+                in order to login again - returns if successful.
+                The request is repeated after a successful login
+            single_flight: identical concurrent GET requests are only sent once
+                and all callers receive a copy of the response.
+                Defaults to True, False disables it, an instance can be shared.
+                Only requests of sessions with the same login are coalesced
+        """
         logger.debug("init rate limited session")
         super().__init__()
+        self.rate_limiter = rate_limiter or RateLimiter(
+            requests_per_second=requests_per_second, burst=burst
+        )
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.response_cache = response_cache
+        self.metrics = metrics
+        self.on_unauthorized = on_unauthorized
+        if isinstance(single_flight, SingleFlight):
+            self.single_flight: SingleFlight | None = single_flight
+        else:
+            self.single_flight = SingleFlight() if single_flight else None
+        self._login_lock = threading.Lock()
+        self._login_generation = 0
+        self._local = threading.local()
+
+    def _get_retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Calculates how long to wait before repeating a rate limited request.
+
+        Uses Retry-After if sent by the server,
+        otherwise exponential backoff with jitter
+
+        Args:
+            response: the rate limited response
+            attempt: number of the repetition starting with 0
+
+        Returns:
+            seconds to wait
+        """
+        if retry_after := response.headers.get("Retry-After"):
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    retry_date = parsedate_to_datetime(retry_after)
+                except (TypeError, ValueError):
+                    logger.debug("unable to parse Retry-After %s", retry_after)
+                else:
+                    return max(
+                        0.0,
+                        (retry_date - datetime.now(tz=timezone.utc)).total_seconds(),
+                    )
+
+        delay = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return delay / 2 + random.uniform(0, delay / 2)  # noqa: S311
 
     def _rate_limited_request(self, method, url, **kwargs) -> requests.Response:  # noqa: ANN001, ANN003
         """Rate limiting execution of original request method."""
-        result = super().request(method, url, **kwargs)
+        attempt = 0
+        login_repeated = False
+        while True:
+            login_generation = self._login_generation
+            waited = self.rate_limiter.acquire()
+            start = monotonic()
+            result = super().request(method, url, **kwargs)
+            if self.metrics:
+                self._record_metrics(
+                    response=result, latency=monotonic() - start, waited=waited
+                )
+
+            if (
+                result.status_code == requests.codes.unauthorized
+                and not login_repeated
+                and self._repeat_login(login_generation)
+            ):
+                login_repeated = True
+                continue
+
+            if result.status_code != requests.codes.too_many_requests:
+                self.rate_limiter.on_success()
+                return result
+
+            self.rate_limiter.on_rate_limited()
+            if self.max_retries is not None and attempt >= self.max_retries:
+                logger.warning(
+                    "rate limit reached - giving up after %s retries", attempt
+                )
+                return result
+
+            delay = self._get_retry_delay(response=result, attempt=attempt)
+            logger.info(
+                "rate limit reached - waiting %.1f sec before repeating request",
+                delay,
+            )
+            self.rate_limiter.pause(delay)
+            attempt += 1
+
+    def _repeat_login(self, login_generation: int) -> bool:
+        """Logs in again using on_unauthorized after a 401 response.
+
+        Only one thread logs in at a time - others wait and reuse its result.
+        Requests sent by on_unauthorized itself never trigger another login.
+
+        Args:
+            login_generation: number of logins before the rejected request was sent
+
+        Returns:
+            if the rejected request should be repeated
+        """
+        if self.on_unauthorized is None or getattr(self._local, "login", False):
+            return False
+        with self._login_lock:
+            if login_generation != self._login_generation:
+                return True  # another thread logged in meanwhile
+            logger.info("request unauthorized - trying to login again")
+            self._local.login = True
+            try:
+                successful = self.on_unauthorized()
+            finally:
+                self._local.login = False
+            if successful:
+                self._login_generation += 1
+            return bool(successful)
+
+    def _record_metrics(
+        self, response: requests.Response, latency: float, waited: float
+    ) -> None:
+        """Passes the measurements of one request to the metrics collector.
+
+        Args:
+            response: response of the request
+            latency: seconds from sending the request until the body was received
+            waited: seconds waited before sending because of the rate limit
+        """
+        if waited:
+            self.metrics.record_sleep(waited)
+        if response.raw is not None and not response._content_consumed:  # noqa: SLF001
+            # streamed body is not read in order to keep it streaming
+            bytes_received = int(response.headers.get("Content-Length", 0))
+        else:
+            bytes_received = len(response.content or b"")
+        self.metrics.record_request(
+            RequestMetric(
+                method=response.request.method,
+                endpoint=normalize_endpoint(response.request.url),
+                status_code=response.status_code,
+                latency=latency,
+                bytes_received=bytes_received,
+            )
+        )
 
-        while result.status_code == requests.codes.too_many_requests:
-            logger.info("rate limit reached - waiting 15 sec before repeating request")
-            sleep(15.0)
-            result = self._rate_limited_request(method=method, url=url, **kwargs)
+    @property
+    def response_count(self) -> int:
+        """Number of responses received by the current thread."""
+        return getattr(self._local, "response_count", 0)
 
-        return result
+    @property
+    def non_idempotent_count(self) -> int:
+        """Number of non idempotent requests e.g. POST sent by the current thread."""
+        return getattr(self._local, "non_idempotent_count", 0)
+
+    @property
+    def last_status_code(self) -> int | None:
+        """Status code of the latest response received by the current thread.
+
+        Used to detect the reason of failed requests of methods
+        which only return None or False.
+        """
+        return getattr(self._local, "status_code", None)
 
     @override
     def request(self, method, url, **kwargs) -> requests.Response:  # noqa: ANN001, ANN003
         """See sessions.requests for more details.
 
-        Only adds rate_limit
+        Only adds rate_limit, coalescing of identical concurrent GET requests
+        and conditional requests if a response_cache is used.
+        Requests used to login are never coalesced because the cookies
+        of their response are only stored by the session sending them.
+        """
+        if method.upper() not in IDEMPOTENT_METHODS:
+            self._local.non_idempotent_count = self.non_idempotent_count + 1
+        response = self._request(method, url, **kwargs)
+        self._local.response_count = self.response_count + 1
+        self._local.status_code = response.status_code
+        return response
+
+    def _request(self, method, url, **kwargs) -> requests.Response:  # noqa: ANN001, ANN003
+        """Helper which sends a request - coalesced if identical GET requests."""
+        is_plain_get = method.upper() == "GET" and not any(
+            kwargs.get(key) for key in ("stream", "data", "json", "files")
+        )
+        if not is_plain_get:
+            return self._rate_limited_request(method, url, **kwargs)
+        if self.single_flight is None or self._is_login_request(url, **kwargs):
+            return self._get_request(method, url, **kwargs)
+
+        key = self._get_request_key(method, url, **kwargs)
+        response, shared = self.single_flight.run(
+            key, lambda: self._get_request(method, url, **kwargs)
+        )
+        if not shared:
+            return response
+        logger.debug("sharing response of concurrent request %s", response.url)
+        response = copy.copy(response)
+        response.headers = response.headers.copy()
+        return response
+
+    def _is_login_request(self, url, **kwargs) -> bool:  # noqa: ANN001, ANN003
+        """Checks if a request is used to login or sent by on_unauthorized."""
+        authorization = (kwargs.get("headers") or {}).get("Authorization", "")
+        return (
+            getattr(self._local, "login", False)
+            or authorization.startswith("Login ")
+            or urlsplit(url).path.endswith(LOGIN_PATHS)
+        )
+
+    def _get_request(self, method, url, **kwargs) -> requests.Response:  # noqa: ANN001, ANN003
+        """GET request - conditional if a response_cache is used."""
+        if self.response_cache is None:
+            return self._rate_limited_request(method, url, **kwargs)
+        return self._conditional_request(method, url, **kwargs)
+
+    def _get_request_key(self, method, url, **kwargs) -> tuple:  # noqa: ANN001, ANN003
+        """Identifier of a request used to detect identical requests.
+
+        Returns:
+            login, method, url including params, headers and all other options
+        """
+        full_url = requests.Request(
+            method=method, url=url, params=kwargs.pop("params", None)
+        ).prepare().url
+        headers = sorted((kwargs.pop("headers", None) or {}).items())
+        return (
+            self._get_login_key(),
+            method.upper(),
+            full_url,
+            repr(headers),
+            repr(sorted(kwargs.items())),
+        )
+
+    def _get_login_key(self) -> tuple:
+        """Helper which identifies the login used by requests of this session.
+
+        Sessions sharing a login e.g. clones of a SessionPool
+        have the same cookies and session headers.
+
+        Returns:
+            cookies and session headers
         """
-        return self._rate_limited_request(method, url, **kwargs)
+        # cookies may be updated by responses of other threads meanwhile
+        with self.cookies._cookies_lock:  # noqa: SLF001
+            cookies = sorted(
+                (cookie.domain, cookie.path, cookie.name, cookie.value)
+                for cookie in self.cookies
+            )
+        return tuple(cookies), tuple(sorted(self.headers.items()))
+
+    def _conditional_request(self, method, url, **kwargs) -> requests.Response:  # noqa: ANN001, ANN003
+        """Request which reuses a stored response if not modified on the server."""
+        full_url = requests.Request(
+            method=method, url=url, params=kwargs.get("params")
+        ).prepare().url
+        cached = self.response_cache.get(method=method, url=full_url)
+
+        if cached:
+            meta, body = cached
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                **ResponseCache.get_conditional_headers(meta),
+            }
+
+        response = self._rate_limited_request(method, url, **kwargs)
+
+        if cached and response.status_code == requests.codes.not_modified:
+            logger.debug("reusing cached response for %s", full_url)
+            return ResponseCache.build_response(
+                meta=meta, body=body, not_modified=response
+            )
+        if response.status_code == requests.codes.ok:
+            self.response_cache.store(method=method, url=full_url, response=response)
+        return response
@@ -0,0 +1,181 @@
+"""module containing compact record types for large result sets.
+
+A record keeps the frequently used fields of a ChurchTools object as slotted
+attributes. All other fields including nested objects are kept as encoded json
+which is only decoded when accessed. Records can be used like the original dicts
+e.g. person["id"] or person["meta"]["modifiedDate"].
+
+Usage:
+    persons = api.get_persons(as_records=True)
+    print(persons[0].last_name, persons[0].meta)
+"""
+
+import json
+from dataclasses import dataclass, field, fields
+from functools import cache
+
+try:
+    import orjson
+except ImportError:  # optional dependency - pip install churchtools-api[orjson]
+    orjson = None
+
+
+def _dumps(data: dict) -> bytes:
+    """Helper which encodes the remaining fields of a record as compact json.
+
+    orjson is not used because its results keep an over-allocated buffer.
+    """
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+_loads = orjson.loads if orjson else json.loads
+
+_NO_KEYS: frozenset[str] = frozenset()  # shared by all records with all keys
+
+
+def _to_camel_case(name: str) -> str:
+    """Helper which converts an attribute name into the ChurchTools key.
+
+    e.g. group_type_role_id -> groupTypeRoleId
+    """
+    first, *others = name.split("_")
+    return first + "".join(part.capitalize() for part in others)
+
+
+@dataclass(slots=True)
+class Record:
+    """Base of all record types.
+
+    Subclasses define their attributes as dataclass fields in snake_case
+    which are filled from the respective camelCase key of ChurchTools.
+    Attributes which are missing in ChurchTools are None
+    but their keys are not available like in the original dict.
+    """
+
+    _raw: bytes = field(default=b"", repr=False)
+    _missing: frozenset[str] = field(default=_NO_KEYS, repr=False)
+
+    @classmethod
+    @cache
+    def _get_keys(cls) -> dict[str, str]:
+        """Helper which maps ChurchTools keys to attribute names."""
+        return {
+            _to_camel_case(record_field.name): record_field.name
+            for record_field in fields(cls)
+            if not record_field.name.startswith("_")
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Record":
+        """Creates a record from an object returned by ChurchTools.
+
+        Args:
+            data: decoded json object
+
+        Returns:
+            record of the respective type
+        """
+        keys = cls._get_keys()
+        remaining = {key: value for key, value in data.items() if key not in keys}
+        missing = frozenset(key for key in keys if key not in data)
+        return cls(
+            _raw=_dumps(remaining) if remaining else b"",
+            _missing=missing or _NO_KEYS,
+            **{attribute: data.get(key) for key, attribute in keys.items()},
+        )
+
+    def _get_remaining(self) -> dict:
+        """Helper which decodes the fields which are not attributes."""
+        return _loads(self._raw) if self._raw else {}
+
+    def __getattr__(self, name: str) -> object:
+        """Access to other fields by their ChurchTools key e.g. person.meta."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._get_remaining()[name]
+        except KeyError:
+            msg = f"{type(self).__name__} has no attribute {name}"
+            raise AttributeError(msg) from None
+
+    def __getitem__(self, key: str) -> object:
+        """Access to any field by its ChurchTools key like the original dict."""
+        if key in self._missing:
+            raise KeyError(key)
+        if attribute := self._get_keys().get(key):
+            return getattr(self, attribute)
+        return self._get_remaining()[key]
+
+    def __contains__(self, key: str) -> bool:
+        """Checks if a ChurchTools key is available."""
+        if key in self._get_keys():
+            return key not in self._missing
+        return key in self._get_remaining()
+
+    def get(self, key: str, default: object = None) -> object:
+        """Access to any field by its ChurchTools key with a default.
+
+        Args:
+            key: ChurchTools key e.g. firstName
+            default: returned if key is not available. Defaults to None
+
+        Returns:
+            value of the field
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> dict:
+        """Converts the record into the original dict of ChurchTools.
+
+        Returns:
+            dict including all decoded nested objects
+        """
+        return {
+            **{
+                key: getattr(self, attribute)
+                for key, attribute in self._get_keys().items()
+                if key not in self._missing
+            },
+            **self._get_remaining(),
+        }
+
+
+@dataclass(slots=True)
+class PersonRecord(Record):
+    """Person as returned by /api/persons."""
+
+    id: int | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    email: str | None = None
+    status_id: int | None = None
+    campus_id: int | None = None
+
+
+@dataclass(slots=True)
+class GroupMemberRecord(Record):
+    """Group membership as returned by /api/groups/members."""
+
+    person_id: int | None = None
+    group_id: int | None = None
+    group_type_role_id: int | None = None
+    group_member_status: str | None = None
+
+
+@dataclass(slots=True)
+class SongRecord(Record):
+    """Song as returned by /api/songs - arrangements are decoded on access."""
+
+    id: int | None = None
+    name: str | None = None
+    author: str | None = None
+
+
+@dataclass(slots=True)
+class BookingRecord(Record):
+    """Booking as returned by /api/bookings - base is decoded on access."""
+
+    id: int | None = None
@@ -0,0 +1,271 @@
+"""module containing a local SQLite copy of ChurchTools persons.
+
+Usage:
+    with PersonsReplica(api, "persons.sqlite") as replica:
+        replica.refresh(max_age=3600)
+        person = replica.find(email="max@example.com")
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from time import time
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+import requests
+
+if TYPE_CHECKING:
+    from churchtools_api.churchtools_api import ChurchToolsApi
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS persons (
+    id INTEGER PRIMARY KEY,
+    email TEXT COLLATE NOCASE,
+    first_name TEXT COLLATE NOCASE,
+    last_name TEXT COLLATE NOCASE,
+    status_id INTEGER,
+    modified TEXT,
+    hash TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS persons_email ON persons (email);
+CREATE INDEX IF NOT EXISTS persons_name ON persons (last_name, first_name);
+CREATE INDEX IF NOT EXISTS persons_status ON persons (status_id);
+CREATE TABLE IF NOT EXISTS replica_meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class PersonsReplica:
+    """Local copy of /api/persons stored in a SQLite file.
+
+    refresh requests all persons but only writes changed ones.
+    Changes are detected using meta.modifiedDate if available,
+    otherwise by a hash of the complete person.
+    Queries are answered from the indexed local copy without any request.
+    """
+
+    def __init__(self, api: "ChurchToolsApi", filename: str | Path) -> None:
+        """Init of a replica - the file is created if missing.
+
+        Args:
+            api: logged in ChurchToolsApi used for refresh
+            filename: path of the SQLite file or ":memory:"
+        """
+        self.api = api
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(str(filename), check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self._lock, self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "PersonsReplica":
+        """Returns the replica."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Closes the database."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database."""
+        self.connection.close()
+
+    @property
+    def last_refresh(self) -> float | None:
+        """Timestamp of the last completed refresh."""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT value FROM replica_meta WHERE key = 'last_refresh'"
+            ).fetchone()
+        return float(row["value"]) if row else None
+
+    def refresh(self, max_age: float | None = None) -> dict | None:
+        """Updates the local copy with all persons from ChurchTools.
+
+        Persons which no longer exist are removed.
+        Nothing is changed unless all persons were requested successfully.
+
+        Args:
+            max_age: skip the refresh if the last one is not older than
+                max_age seconds. Defaults to None which always refreshes
+
+        Returns:
+            dict with number of inserted, updated, unchanged and deleted persons
+            or None if requesting the persons failed
+        """
+        summary = {"inserted": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+        last_refresh = self.last_refresh
+        if max_age is not None and last_refresh and time() - last_refresh <= max_age:
+            logger.debug("skipping refresh of persons replica")
+            return summary
+
+        with self._lock:
+            known = {
+                row["id"]: (row["modified"], row["hash"])
+                for row in self.connection.execute(
+                    "SELECT id, modified, hash FROM persons"
+                )
+            }
+
+        seen = set()
+        changed_rows = []
+        try:
+            for person in self._iter_persons():
+                seen.add(person["id"])
+                modified = person.get("meta", {}).get("modifiedDate")
+                if person["id"] in known:
+                    known_modified, known_hash = known[person["id"]]
+                    if modified and modified == known_modified:
+                        summary["unchanged"] += 1
+                        continue
+                    row = self._to_row(person, modified)
+                    if row["hash"] == known_hash:
+                        summary["unchanged"] += 1
+                        continue
+                    summary["updated"] += 1
+                else:
+                    row = self._to_row(person, modified)
+                    summary["inserted"] += 1
+                changed_rows.append(row)
+        except requests.HTTPError as error:
+            logger.warning("refresh of persons replica failed: %s", error)
+            return None
+
+        deleted = [(person_id,) for person_id in known.keys() - seen]
+        summary["deleted"] = len(deleted)
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO persons "
+                "(id, email, first_name, last_name, status_id, modified, hash, data) "
+                "VALUES (:id, :email, :first_name, :last_name, :status_id, "
+                ":modified, :hash, :data)",
+                changed_rows,
+            )
+            self.connection.executemany("DELETE FROM persons WHERE id = ?", deleted)
+            self.connection.execute(
+                "INSERT OR REPLACE INTO replica_meta VALUES ('last_refresh', ?)",
+                (str(time()),),
+            )
+        logger.info("refreshed persons replica %s", summary)
+        return summary
+
+    def _iter_persons(self) -> Iterator[dict]:
+        """Helper which yields all persons and raises HTTPError if any request fails.
+
+        iter_persons is not used because it silently stops on a failed request
+        which would remove all persons from the local copy.
+
+        Yields:
+            person dicts
+        """
+        url = self.api.domain + "/api/persons"
+        headers = {"accept": "application/json"}
+        params = {"limit": 50}
+        response = self.api.session.get(url=url, headers=headers, params=params)
+        response.raise_for_status()
+        yield from self.api.iterate_paginated_response_data(
+            self.api.json_loads(response.content),
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+    @staticmethod
+    def _to_row(person: dict, modified: str | None) -> dict:
+        """Helper which converts a person into the columns of the table.
+
+        Args:
+            person: person as returned by ChurchTools
+            modified: meta.modifiedDate of the person if available
+
+        Returns:
+            dict of column values
+        """
+        data = json.dumps(person, sort_keys=True)
+        return {
+            "id": person["id"],
+            "email": person.get("email") or None,
+            "first_name": person.get("firstName"),
+            "last_name": person.get("lastName"),
+            "status_id": person.get("statusId"),
+            "modified": modified,
+            "hash": hashlib.sha256(data.encode()).hexdigest(),
+            "data": data,
+        }
+
+    def get(self, person_id: int) -> dict | None:
+        """Retrieve a single person by id.
+
+        Args:
+            person_id: id of the person
+
+        Returns:
+            person dict or None if not available
+        """
+        result = self._query("id = ?", (person_id,))
+        return result[0] if result else None
+
+    def find(
+        self,
+        *,
+        email: str | None = None,
+        first_name: str | None = None,
+        last_name: str | None = None,
+        status_id: int | None = None,
+    ) -> list[dict]:
+        """Retrieve persons matching all given criteria.
+
+        Text comparisons are case insensitive.
+
+        Args:
+            email: exact email. Defaults to None
+            first_name: exact first name. Defaults to None
+            last_name: exact last name. Defaults to None
+            status_id: status of the person. Defaults to None
+
+        Returns:
+            list of person dicts ordered by id
+        """
+        criteria = {
+            "email": email,
+            "first_name": first_name,
+            "last_name": last_name,
+            "status_id": status_id,
+        }
+        criteria = {key: value for key, value in criteria.items() if value is not None}
+        where = " AND ".join(f"{key} = ?" for key in criteria) or "1 = 1"
+        return self._query(where, tuple(criteria.values()))
+
+    def _query(self, where: str, params: tuple) -> list[dict]:
+        """Helper which returns the persons matching a where clause.
+
+        Args:
+            where: SQL condition using ? placeholders - never user input
+            params: values of the placeholders
+
+        Returns:
+            list of person dicts ordered by id
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT data FROM persons WHERE {where} ORDER BY id",  # noqa: S608
+                params,
+            ).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def __len__(self) -> int:
+        """Number of persons in the local copy."""
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM persons").fetchone()[0]
@@ -1,11 +1,13 @@
 """module containing parts used for resource handling."""
 
-import json
 import logging
+from collections.abc import Iterator
 
 import requests
 
+from churchtools_api.cache import cached
 from churchtools_api.churchtools_api_abstract import ChurchToolsApiAbstract
+from churchtools_api.records import BookingRecord
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,7 @@ class ChurchToolsApiResources(ChurchToolsApiAbstract):
         """Inherited initialization."""
         super()
 
+    @cached
     def get_resource_masterdata(
         self, *, resultClass: str | None = None, returnAsDict: bool = False
     ) -> dict:
@@ -46,7 +49,7 @@ class ChurchToolsApiResources(ChurchToolsApiAbstract):
         response = self.session.get(url=url, headers=headers)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
 
             response_data = self.combine_paginated_response_data(
                 response_content,
@@ -81,6 +84,7 @@ class ChurchToolsApiResources(ChurchToolsApiAbstract):
                 might have a bug in API - Support Ticket 130123)
             appointment_id: int: get resources for one specific calendar_appointment
                 only (use together with to_ and from_ for performance reasons)
+            as_records: bool: return compact BookingRecord instead of dicts
         """
         url = self.domain + "/api/bookings"
         headers = {"accept": "application/json"}
@@ -100,22 +104,16 @@ class ChurchToolsApiResources(ChurchToolsApiAbstract):
         elif kwargs.get("resource_ids"):
             params = self._get_bookings_params(params=params, **kwargs)
 
-        response = self.session.get(url=url, headers=headers, params=params)
-
-        if response.status_code != requests.codes.ok:
-            logger.error(response.content)
-            return None
-        response_content = json.loads(response.content)
-
-        response_data = self.combine_paginated_response_data(
-            response_content,
-            url=url,
+        result_list = self._get_chunked_data(
+            url,
+            "resource_ids[]",
             headers=headers,
             params=params,
+            get_id=lambda booking: booking["id"],
+            convert=BookingRecord.from_dict if kwargs.get("as_records") else None,
         )
-        result_list = (
-            [response_data] if isinstance(response_data, dict) else response_data
-        )
+        if result_list is None:
+            return None
 
         if appointment_id := kwargs.get("appointment_id"):
             return [
@@ -123,6 +121,50 @@ class ChurchToolsApiResources(ChurchToolsApiAbstract):
             ]
         return result_list
 
+    def iter_bookings(self, **kwargs: dict) -> Iterator[dict]:
+        """Generator variant of get_bookings which yields bookings page by page.
+
+        Arguments:
+            kwargs: see get_bookings - same combination limits do apply
+
+        Yields:
+            booking dicts
+        """
+        url = self.domain + "/api/bookings"
+        headers = {"accept": "application/json"}
+        params = {"limit": 50}  # increases default pagination size
+
+        required_kwargs = ["booking_id", "resource_ids"]
+        if not any(kwarg in kwargs for kwarg in required_kwargs):
+            logger.error(
+                "invalid argument combination in iter_bookings"
+                " - please check docstring for requirements",
+            )
+            return
+
+        if booking_id := kwargs.get("booking_id"):
+            url = url + f"/{booking_id}"
+        elif kwargs.get("resource_ids"):
+            params = self._get_bookings_params(params=params, **kwargs)
+
+        response = self.session.get(url=url, headers=headers, params=params)
+
+        if response.status_code != requests.codes.ok:
+            logger.error(response.content)
+            return
+        response_content = self._decode_response(response)
+
+        appointment_id = kwargs.get("appointment_id")
+        for booking in self.iterate_paginated_response_data(
+            response_content,
+            url=url,
+            headers=headers,
+            params=params,
+        ):
+            if appointment_id and booking["base"]["appointmentId"] != appointment_id:
+                continue
+            yield booking
+
     def _get_bookings_params(self, params: dict, **kwargs: dict) -> dict:
         """Helper function for get bookings that prepares params.
 
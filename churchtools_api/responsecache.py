@@ -0,0 +1,176 @@
+"""This code is used to store responses for conditional requests.
+
+Responses with ETag or Last-Modified headers are kept on disk.
+Repeated requests send If-None-Match / If-Modified-Since and reuse the stored
+body if the server responds 304 Not Modified.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# headers describing the transfer instead of the stored (decoded) body
+HOP_HEADERS = {
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "connection",
+}
+
+
+class ResponseCache:
+    """Size bounded on-disk storage of responses by method and url.
+
+    The url has to include all params.
+    Responses are stored per directory - use one directory per user
+    because responses depend on the permissions of the user.
+    """
+
+    def __init__(
+        self, directory: str | Path, max_bytes: int = 100 * 1024 * 1024
+    ) -> None:
+        """Init of a response cache.
+
+        Args:
+            directory: folder used for storage - created if missing
+            max_bytes: maximum size of all stored bodies. Defaults to 100 MB
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _get_paths(self, method: str, url: str) -> tuple[Path, Path]:
+        """Helper which returns the filenames used for one request.
+
+        Args:
+            method: http method
+            url: complete url including params
+
+        Returns:
+            path of meta information and path of body
+        """
+        key = hashlib.sha256(f"{method.upper()} {url}".encode()).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def get(self, method: str, url: str) -> tuple[dict, bytes] | None:
+        """Retrieve a stored response.
+
+        Args:
+            method: http method
+            url: complete url including params
+
+        Returns:
+            meta information (etag, last_modified, headers) and body if available
+        """
+        meta_path, body_path = self._get_paths(method=method, url=url)
+        with self._lock:
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                body = body_path.read_bytes()
+            except (OSError, ValueError):
+                return None
+            os.utime(body_path)  # last use used for eviction
+        return meta, body
+
+    def store(self, method: str, url: str, response: requests.Response) -> bool:
+        """Stores a response if it can be validated by the server later on.
+
+        Args:
+            method: http method
+            url: complete url including params
+            response: successful response
+
+        Returns:
+            if the response was stored
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {
+                key: value
+                for key, value in response.headers.items()
+                if key.lower() not in HOP_HEADERS
+            },
+        }
+        meta_path, body_path = self._get_paths(method=method, url=url)
+        with self._lock:
+            body_path.write_bytes(response.content)
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+            self._evict()
+        return True
+
+    def clear(self) -> None:
+        """Removes all stored responses."""
+        with self._lock:
+            for path in self.directory.glob("*.body"):
+                path.unlink(missing_ok=True)
+                path.with_suffix(".json").unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Removes least recently used responses until max_bytes is reached."""
+        bodies = [(path, path.stat()) for path in self.directory.glob("*.body")]
+        total_bytes = sum(stat.st_size for _path, stat in bodies)
+        for path, stat in sorted(bodies, key=lambda item: item[1].st_mtime):
+            if total_bytes <= self.max_bytes:
+                break
+            logger.debug("evicting cached response %s", path.name)
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+            total_bytes -= stat.st_size
+
+    @staticmethod
+    def get_conditional_headers(meta: dict) -> dict:
+        """Headers which ask the server to only send changed content.
+
+        Args:
+            meta: meta information of the stored response
+
+        Returns:
+            dict with If-None-Match and/or If-Modified-Since
+        """
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    @staticmethod
+    def build_response(
+        meta: dict, body: bytes, not_modified: requests.Response
+    ) -> requests.Response:
+        """Creates a complete response from storage for a 304 response.
+
+        Args:
+            meta: meta information of the stored response
+            body: stored content
+            not_modified: the 304 response received from the server
+
+        Returns:
+            response with status 200 and the stored content
+        """
+        response = requests.Response()
+        response.status_code = requests.codes.ok
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response._content = body  # noqa: SLF001
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.encoding = not_modified.encoding
+        response.elapsed = not_modified.elapsed
+        response.from_cache = True
+        return response
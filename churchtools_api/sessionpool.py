@@ -0,0 +1,184 @@
+"""This code is used to share one login with multiple threads.
+
+requests.Session is not guaranteed to be thread safe.
+A SessionPool clones an authenticated RateLimitedSession once per thread
+while all clones share the rate limit, metrics and response cache.
+Sessions of finished threads are reused by new threads.
+"""
+
+import logging
+import threading
+import weakref
+from functools import partial
+
+from requests.adapters import HTTPAdapter
+
+from churchtools_api.ratelimitedsession import RateLimitedSession
+
+logger = logging.getLogger(__name__)
+
+
+class _Lease:
+    """Session of one thread - released once the thread ends."""
+
+    __slots__ = ("__weakref__", "session")
+
+    def __init__(self, session: RateLimitedSession) -> None:
+        self.session = session
+
+
+class SessionPool:
+    """Provides one RateLimitedSession per thread cloned from a logged in session.
+
+    Can be used like a session - all attributes and methods (get, post, headers,
+    ...) are forwarded to the session of the current thread.
+    Changes to headers or cookies only apply to the session of the current thread.
+
+    The number of sessions is limited by the number of concurrent threads
+    because the session of a finished thread is reused by the next new thread.
+    Once a session is rejected as unauthorized the template logs in again
+    and its login is copied to each session as soon as it is rejected.
+    """
+
+    def __init__(
+        self,
+        session: RateLimitedSession,
+        *,
+        pool_connections: int = 1,
+        pool_maxsize: int = 1,
+    ) -> None:
+        """Init of a pool based on an authenticated session.
+
+        Args:
+            session: logged in session used as template for all threads
+            pool_connections: number of hosts to keep connections for per thread.
+                Defaults to 1
+            pool_maxsize: number of connections kept open per host and thread.
+                Defaults to 1 because each thread sends one request at a time
+        """
+        self.template = session
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._local = threading.local()
+        # reentrant because releasing a session may be triggered by the
+        # garbage collector while the lock is held
+        self._lock = threading.RLock()
+        # all sessions with the number of the login copied from the template
+        self._sessions: dict[RateLimitedSession, int] = {}
+        self._idle: list[RateLimitedSession] = []
+        self._login_generation = 0
+
+    @property
+    def session(self) -> RateLimitedSession:
+        """The session of the current thread - assigned on first use.
+
+        While the current thread logs in again this is the template.
+        """
+        if getattr(self._local, "login", False):
+            return self.template
+        lease = getattr(self._local, "lease", None)
+        if lease is None:
+            lease = self._lease()
+        return lease.session
+
+    def _lease(self) -> _Lease:
+        """Assigns an idle or new session to the current thread.
+
+        Returns:
+            lease which releases the session once the thread ends
+        """
+        with self._lock:
+            if self._idle:
+                session = self._idle.pop()
+            else:
+                session = self._clone()
+                self._sessions[session] = self._login_generation
+        lease = _Lease(session)
+        # thread local data is deleted once the thread ends
+        weakref.finalize(lease, self._release, session)
+        self._local.lease = lease
+        return lease
+
+    def _release(self, session: RateLimitedSession) -> None:
+        """Helper which keeps the session of a finished thread for reuse."""
+        with self._lock:
+            if session in self._sessions:
+                self._idle.append(session)
+
+    def _repeat_login(self, session: RateLimitedSession) -> bool:
+        """Helper used by all sessions to login again after a 401 response.
+
+        The template only logs in if the session already used its latest login -
+        otherwise another thread logged in meanwhile and its login is copied.
+
+        Args:
+            session: the session whose request was rejected
+
+        Returns:
+            if successful
+        """
+        template = self.template
+        with self._lock:
+            if self._sessions.get(session) == self._login_generation:
+                self._local.login = True
+                try:
+                    successful = template._repeat_login(template._login_generation)  # noqa: SLF001
+                finally:
+                    self._local.login = False
+                if not successful:
+                    return False
+                self._login_generation += 1
+
+            session.headers = template.headers.copy()
+            session.cookies = template.cookies.copy()
+            self._sessions[session] = self._login_generation
+            return True
+
+    def _clone(self) -> RateLimitedSession:
+        """Creates a new session with the authentication of the template.
+
+        Returns:
+            session sharing rate limiter, metrics, response cache
+                and coalescing of requests with the template
+        """
+        template = self.template
+        session = RateLimitedSession(
+            max_retries=template.max_retries,
+            backoff_base=template.backoff_base,
+            backoff_max=template.backoff_max,
+            rate_limiter=template.rate_limiter,
+            response_cache=template.response_cache,
+            metrics=template.metrics,
+            single_flight=template.single_flight or False,
+        )
+        session.on_unauthorized = partial(self._repeat_login, session)
+        session.headers = template.headers.copy()
+        session.cookies = template.cookies.copy()
+        session.auth = template.auth
+        session.proxies = template.proxies.copy()
+        session.verify = template.verify
+        session.cert = template.cert
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        logger.debug("created session for thread %s", threading.current_thread().name)
+        return session
+
+    def __getattr__(self, name: str) -> object:
+        """Forwards everything else to the session of the current thread."""
+        return getattr(self.session, name)
+
+    def close(self) -> None:
+        """Closes the sessions of all threads and the template."""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions), {}
+            self._idle = []
+        for session in sessions:
+            session.close()
+        self.template.close()
+        self._local = threading.local()
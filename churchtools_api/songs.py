@@ -1,11 +1,13 @@
 """module containing parts used for song handling."""
 
-import json
 import logging
+from collections.abc import Iterator
 
 import requests
 
 # from churchtools_api.churchtools_api_abstract import ChurchToolsApiAbstract  # noqa: ERA001 E501
+from churchtools_api.cache import cached
+from churchtools_api.records import SongRecord
 from churchtools_api.tags import (
     ChurchToolsApiTags,  # which implements ChurchToolsApiAbstract
 )
@@ -22,13 +24,15 @@ class ChurchToolsApiSongs(ChurchToolsApiTags):
 
     def __init__(self) -> None:
         """Inherited initialization."""
-        super()
+        super().__init__()
 
     def get_songs(self, **kwargs: dict) -> list[dict]:
         """Gets list of all songs from the server.
 
         Kwargs:
             song_id: int: optional filter by song id
+            include_tags: bool: request tags of each song as part of the song
+            as_records: bool: return compact SongRecord instead of dicts
 
         Returns: list of songs
         """
@@ -43,17 +47,20 @@ class ChurchToolsApiSongs(ChurchToolsApiTags):
             url = url + "/{}".format(kwargs["song_id"])
         headers = {"accept": "application/json"}
         params = {"limit": 50}  # increases default pagination size
+        if kwargs.get("include_tags"):
+            params["include[]"] = "tags"
         response = self.session.get(url=url, headers=headers, params=params)
 
         if response.status_code == requests.codes.ok:
-            response_content = json.loads(response.content)
+            response_content = self._decode_response(response)
             response_data = self.combine_paginated_response_data(
                 response_content,
                 url=url,
+                convert=SongRecord.from_dict if kwargs.get("as_records") else None,
                 headers=headers,
                 params=params,
             )
-            return [response_data] if isinstance(response_data, dict) else response_data
+            return response_data if isinstance(response_data, list) else [response_data]
 
         if "song_id" in kwargs:
             logger.info(
@@ -69,6 +76,39 @@ class ChurchToolsApiSongs(ChurchToolsApiTags):
         )
         return None
 
+    def iter_songs(self, **kwargs: dict) -> Iterator[dict]:
+        """Generator variant of get_songs which yields songs page by page.
+
+        Kwargs:
+            song_id: int: optional filter by song id
+
+        Yields:
+            song dicts
+        """
+        url = self.domain + "/api/songs"
+        if "song_id" in kwargs:
+            url = url + "/{}".format(kwargs["song_id"])
+        headers = {"accept": "application/json"}
+        params = {"limit": 50}  # increases default pagination size
+        response = self.session.get(url=url, headers=headers, params=params)
+
+        if response.status_code != requests.codes.ok:
+            logger.warning(
+                "%s Something went wrong fetching songs: %s",
+                response.status_code,
+                response.content,
+            )
+            return
+
+        response_content = self._decode_response(response)
+        yield from self.iterate_paginated_response_data(
+            response_content,
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+    @cached
     def get_song_category_map(self) -> dict:
         """Helpfer function creating requesting CT metadata for mapping of categories.
 
@@ -78,7 +118,7 @@ class ChurchToolsApiSongs(ChurchToolsApiTags):
         url = self.domain + "/api/event/masterdata"
         headers = {"accept": "application/json"}
         response = self.session.get(url=url, headers=headers)
-        response_content = json.loads(response.content)
+        response_content = self._decode_response(response)
         song_categories = response_content["data"]["songCategories"]
         song_category_dict = {}
         for item in song_categories:
@@ -108,6 +148,7 @@ class ChurchToolsApiSongs(ChurchToolsApiTags):
 
         return result
 
+    @cached
     def get_song_source_map(self) -> dict:
         """Requesting CT metadata for mapping of song sources.
 
@@ -213,7 +254,7 @@ class ChurchToolsApiSongs(ChurchToolsApiTags):
             )
             return None
 
-        response_content = json.loads(response.content)
+        response_content = self._decode_response(response)
         new_id = int(response_content["data"]["id"])
         logger.debug("Song created successful with ID=%s", new_id)
         return new_id
@@ -279,7 +320,7 @@ class ChurchToolsApiSongs(ChurchToolsApiTags):
             )
             return None
 
-        return json.loads(response.content)["data"]
+        return self._decode_response(response)["data"]
 
     def delete_song(self, song_id: int) -> bool:
         """Method to DELETE a song using REST API.
@@ -304,16 +345,24 @@ class ChurchToolsApiSongs(ChurchToolsApiTags):
 
         return True
 
-    def contains_song_tag(self, song_id: int, song_tag_name: str) -> bool:
+    def contains_song_tag(
+        self, song_id: int, song_tag_name: str, *, max_age: float | None = None
+    ) -> bool:
         """Helper which checks if a specific song_tag_id is present on a song.
 
         Arguments:
             song_id: ChurchTools site specific song_id which should checked
             song_tag_name: name of the tag which should be checked
+            max_age: use the song tag index reused for max_age seconds
+                instead of requesting the tags of the song.
+                Defaults to None which always requests the tags of the song
 
         Returns:
             bool if present
         """
+        if max_age is not None:
+            tag_index = self.get_song_tag_index(max_age=max_age)
+            return int(song_id) in tag_index.get(song_tag_name, set())
         tags = self.get_tag(domain_type="song", domain_id=song_id, rtype="name_dict")
         return song_tag_name in tags
 
@@ -327,20 +376,59 @@ class ChurchToolsApiSongs(ChurchToolsApiTags):
         Returns:
             list of songs
         """
-        songs = self.get_songs()
-        songs_dict = {song["id"]: song for song in songs}
+        songs = self.get_songs(include_tags=True)
+        song_ids = self.get_song_tag_index(songs=songs).get(song_tag_name, set())
 
-        logger.info(
-            "get_songs_by_tag will need to send a request per song "
-            "method will make a short break after a couple of requests"
-        )
-        filtered_song_ids = [
-            song_id
-            for song_id in songs_dict
-            if self.contains_song_tag(song_id=song_id, song_tag_name=song_tag_name)
-        ]
+        return [song for song in songs if song["id"] in song_ids]
+
+    def get_song_tag_index(
+        self,
+        *,
+        max_age: float | None = None,
+        songs: list[dict] | None = None,
+    ) -> dict[str, set[int]]:
+        """Retrieves which songs are assigned to which tag.
+
+        Tags are requested together with the songs if supported by the server.
+        Otherwise tags are requested individually for each song.
+        The result is stored and kept up to date by add_tag and remove_tag
+        but changes by others are only noticed once it is rebuilt.
+
+        Arguments:
+            max_age: reuse a stored index which is not older than max_age seconds.
+                Defaults to None which always rebuilds the index
+            songs: songs requested with include_tags if already available.
+                The index is always built from these songs
+
+        Returns:
+            dict of tag name to set of song ids with this tag
+        """
+        if (
+            songs is None
+            and max_age is not None
+            and (tag_index := self._get_cached_tag_index("song", max_age)) is not None
+        ):
+            return tag_index
+
+        if songs is None:
+            songs = self.get_songs(include_tags=True)
+
+        if all("tags" in song for song in songs):
+            tag_index = {}
+            for song in songs:
+                for tag in song["tags"]:
+                    tag_index.setdefault(tag["name"], set()).add(song["id"])
+        else:
+            logger.info(
+                "songs do not include tags - "
+                "song tag index will need to send a request per song"
+            )
+            tag_index = self.get_tag_index(
+                domain_type="song", domain_ids=[song["id"] for song in songs]
+            )
 
-        return [songs_dict[song_id] for song_id in filtered_song_ids]
+        self._store_tag_index("song", tag_index)
+        return tag_index
 
     def get_song_arrangement(
         self, song_id: int, arrangement_id: int | None = None
@@ -397,7 +485,7 @@ class ChurchToolsApiSongs(ChurchToolsApiTags):
             )
             return None
 
-        return json.loads(response.content)["data"]["id"]
+        return self._decode_response(response)["data"]["id"]
 
     def edit_song_arrangement(
         self,
@@ -467,7 +555,7 @@ class ChurchToolsApiSongs(ChurchToolsApiTags):
         }
         response = self.session.put(url=url, json=data)
         if response.status_code != requests.codes.ok:
-            logger.error(json.loads(response.content)["errors"])
+            logger.error(self._decode_response(response)["errors"])
             return False
 
         return True
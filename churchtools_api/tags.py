@@ -1,10 +1,12 @@
 """module containing parts used for song handling."""
 
-import json
 import logging
+from functools import partial
+from time import monotonic
 
 import requests
 
+from churchtools_api.cache import cached
 from churchtools_api.churchtools_api_abstract import ChurchToolsApiAbstract
 
 logger = logging.getLogger(__name__)
@@ -19,8 +21,9 @@ class ChurchToolsApiTags(ChurchToolsApiAbstract):
 
     def __init__(self) -> None:
         """Inherited initialization."""
-        super()
+        super().__init__()
 
+    @cached
     def get_tags(self, domain_type: str, *, rtype: str = "original") -> list[dict]:
         """Retrieve a list of all available tags.
 
@@ -38,7 +41,7 @@ class ChurchToolsApiTags(ChurchToolsApiAbstract):
         headers = {"accept": "application/json"}
         response = self.session.get(url=url, headers=headers)
 
-        response_content = json.loads(response.content)
+        response_content = self._decode_response(response)
 
         if response.status_code != requests.codes.ok:
             logger.warning(response.content)
@@ -79,11 +82,14 @@ class ChurchToolsApiTags(ChurchToolsApiAbstract):
 
         response = self.session.post(url=url, headers=headers, json=params)
 
-        response_content = json.loads(response.content)
+        response_content = self._decode_response(response)
         if response.status_code != requests.codes.created:
             logger.warning(response_content["translatedMessage"])
             return False
 
+        self.invalidate_cache("get_tags")
+        if (tag_index := self._get_cached_tag_index(domain_type)) is not None:
+            tag_index.setdefault(tag_name, set()).add(int(domain_id))
         return True
 
     def remove_tag(self, domain_type: str, domain_id: str, tag_name: str) -> bool:
@@ -99,12 +105,136 @@ class ChurchToolsApiTags(ChurchToolsApiAbstract):
         Returns:
             if successful
         """
-        tag_name_to_id = self.get_tags(domain_type=domain_type, rtype="name_dict")
+        tag_id = self._lookup_tag_id(domain_type=domain_type, tag_name=tag_name)
+        if tag_id is None:
+            logger.warning("Tag %s does not exist for %s", tag_name, domain_type)
+            return False
+
+        return self._remove_tag_by_id(
+            domain_type=domain_type,
+            domain_id=domain_id,
+            tag_id=tag_id,
+            tag_name=tag_name,
+        )
+
+    def add_tags_bulk(
+        self,
+        domain_type: str,
+        domain_ids: list[int],
+        tag_name: str,
+        *,
+        max_workers: int | None = None,
+    ) -> dict[int, bool]:
+        """Adds link to a tag to many objects.
+
+        The first object is processed on its own because it might create the tag.
+        All others are processed using max_workers concurrent requests.
+
+        Args:
+            domain_type: 'song', 'person' or 'group'
+            domain_ids: identifiers used by the objects which should be modified
+            tag_name: human readable name of the tag to be written
+            max_workers: number of concurrent requests. Defaults to self.max_workers
+
+        Returns:
+            dict of domain_id and if successful
+        """
+        if not domain_ids:
+            return {}
+
+        add_tag = partial(self.add_tag, domain_type, tag_name=tag_name)
+        results = [add_tag(domain_ids[0])]
+        results.extend(
+            self._map_concurrently(add_tag, domain_ids[1:], max_workers=max_workers)
+        )
+
+        logger.debug(
+            "added tag %s to %s of %s %s",
+            tag_name,
+            sum(results),
+            len(domain_ids),
+            domain_type,
+        )
+        return dict(zip(domain_ids, results, strict=True))
+
+    def remove_tags_bulk(
+        self,
+        domain_type: str,
+        domain_ids: list[int],
+        tag_name: str,
+        *,
+        max_workers: int | None = None,
+    ) -> dict[int, bool]:
+        """Removes tag from many objects.
 
-        url = (
-            f"{self.domain}/api/tags/"
-            f"{domain_type}/{domain_id}/{tag_name_to_id[tag_name]}"
+        The tag name is resolved once for all objects
+        which are processed using max_workers concurrent requests.
+
+        Args:
+            domain_type: 'song', 'person' or 'group'
+            domain_ids: identifiers used by the objects which should be modified
+            tag_name: human readable name of the tag to be removed
+            max_workers: number of concurrent requests. Defaults to self.max_workers
+
+        Returns:
+            dict of domain_id and if successful
+        """
+        tag_id = self._lookup_tag_id(domain_type=domain_type, tag_name=tag_name)
+        if tag_id is None:
+            logger.warning("Tag %s does not exist for %s", tag_name, domain_type)
+            return dict.fromkeys(domain_ids, False)
+
+        results = self._map_concurrently(
+            partial(
+                self._remove_tag_by_id,
+                domain_type,
+                tag_id=tag_id,
+                tag_name=tag_name,
+            ),
+            domain_ids,
+            max_workers=max_workers,
+        )
+
+        logger.debug(
+            "removed tag %s from %s of %s %s",
+            tag_name,
+            sum(results),
+            len(domain_ids),
+            domain_type,
         )
+        return dict(zip(domain_ids, results, strict=True))
+
+    def _lookup_tag_id(self, domain_type: str, tag_name: str) -> int | None:
+        """Helper which converts a tag name into the tag id.
+
+        Args:
+            domain_type: 'song', 'person' or 'group'
+            tag_name: human readable name of the tag
+
+        Returns:
+            id of the tag or None if it does not exist
+        """
+        tag_name_to_id = self.get_tags(domain_type=domain_type, rtype="name_dict")
+        if tag_name not in tag_name_to_id:
+            self.invalidate_cache("get_tags")
+            tag_name_to_id = self.get_tags(domain_type=domain_type, rtype="name_dict")
+        return tag_name_to_id.get(tag_name)
+
+    def _remove_tag_by_id(
+        self, domain_type: str, domain_id: int, tag_id: int, tag_name: str
+    ) -> bool:
+        """Helper which removes a tag from a single object by tag id.
+
+        Args:
+            domain_type: 'song', 'person' or 'group'
+            domain_id: identifier used by the object which should be modified
+            tag_id: id of the tag to be removed
+            tag_name: human readable name of the tag used to update the tag index
+
+        Returns:
+            if successful
+        """
+        url = f"{self.domain}/api/tags/{domain_type}/{domain_id}/{tag_id}"
 
         response = self.session.delete(url=url)
 
@@ -112,6 +242,8 @@ class ChurchToolsApiTags(ChurchToolsApiAbstract):
             logger.warning(response.content)
             return False
 
+        if (tag_index := self._get_cached_tag_index(domain_type)) is not None:
+            tag_index.get(tag_name, set()).discard(int(domain_id))
         return True
 
     def get_tag(
@@ -138,7 +270,7 @@ class ChurchToolsApiTags(ChurchToolsApiAbstract):
 
         response = self.session.get(url=url)
 
-        response_content = json.loads(response.content)
+        response_content = self._decode_response(response)
         if response.status_code != requests.codes.ok:
             logger.warning(response_content["translatedMessage"])
             return None
@@ -151,3 +283,72 @@ class ChurchToolsApiTags(ChurchToolsApiAbstract):
                 return {tag["name"]: tag for tag in response_data}
             case _:
                 return response_data
+
+    def get_tag_index(
+        self, domain_type: str, domain_ids: list[int]
+    ) -> dict[str, set[int]]:
+        """Retrieves which of the objects are assigned to which tag.
+
+        Tags are requested individually for each object -
+        using max_workers concurrent requests.
+        Prefer bulk lookups like get_song_tag_index where available.
+
+        Args:
+            domain_type: 'song', 'person' or 'group'
+            domain_ids: identifiers of all objects which should be considered
+
+        Returns:
+            dict of tag name to set of domain_ids with this tag
+        """
+        tags_by_domain_id = self._map_concurrently(
+            partial(self.get_tag, domain_type),
+            domain_ids,
+        )
+
+        tag_index = {}
+        for domain_id, tags in zip(domain_ids, tags_by_domain_id, strict=True):
+            for tag in tags or []:
+                tag_index.setdefault(tag["name"], set()).add(int(domain_id))
+        return tag_index
+
+    def invalidate_tag_index(self, domain_type: str | None = None) -> None:
+        """Removes cached tag indexes so that they are rebuilt on next use.
+
+        Args:
+            domain_type: 'song', 'person' or 'group'. Defaults to all
+        """
+        if domain_type:
+            self._tag_indexes.pop(domain_type, None)
+        else:
+            self._tag_indexes.clear()
+
+    def _get_cached_tag_index(
+        self, domain_type: str, max_age: float | None = None
+    ) -> dict[str, set[int]] | None:
+        """Helper which returns a previously stored tag index if not outdated.
+
+        Args:
+            domain_type: 'song', 'person' or 'group'
+            max_age: seconds after which a stored tag index is outdated.
+                Defaults to None which never considers it outdated
+
+        Returns:
+            tag index or None if not available
+        """
+        if domain_type not in self._tag_indexes:
+            return None
+        created, tag_index = self._tag_indexes[domain_type]
+        if max_age is not None and monotonic() - created > max_age:
+            return None
+        return tag_index
+
+    def _store_tag_index(
+        self, domain_type: str, tag_index: dict[str, set[int]]
+    ) -> None:
+        """Helper which stores a tag index for reuse.
+
+        Args:
+            domain_type: 'song', 'person' or 'group'
+            tag_index: dict of tag name to set of domain_ids with this tag
+        """
+        self._tag_indexes[domain_type] = (monotonic(), tag_index)
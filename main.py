@@ -11,8 +11,11 @@ def assign_specific_tag_to_all_songs(api):
     """
     songs = api.get_songs()
     all_song_ids = [value['id'] for value in songs]
-    for id in all_song_ids:
-        api.add_song_tag(id, 51)
+    api.add_tags_bulk(
+        domain_type="song",
+        domain_ids=all_song_ids,
+        tag_name="in ChurchTools vor Skript Import",
+    )
 
 
 if __name__ == '__main__':
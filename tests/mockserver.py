@@ -0,0 +1,611 @@
+"""module containing an offline stand-in for a ChurchTools server.
+
+Used for tests and benchmarks which should not depend on a live instance.
+Only a small subset of the REST API is implemented with generated fixtures.
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from math import ceil
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_LIMIT = 10
+MAX_PAGE_LIMIT = 500
+MAX_URL_LENGTH = 8192  # longer request urls are rejected like by common proxies
+MOCK_TOKEN = "mock-login-token"  # noqa: S105 - any token is accepted
+SESSION_COOKIE = "ChurchTools_mock"
+NOT_FOUND = {"message": "Not Found", "translatedMessage": "Not Found"}
+STATIC_RESPONSES = {
+    "whoami": {"data": {"id": 1, "email": "admin@example.com"}},
+    "csrftoken": {"data": "mock-csrf-token"},
+}
+
+
+def generate_persons(count: int) -> list[dict]:
+    """Generates person fixtures similar to /api/persons.
+
+    Args:
+        count: number of persons
+
+    Returns:
+        list of person dicts with ids starting at 1
+    """
+    return [
+        {
+            "id": person_id,
+            "firstName": f"First{person_id}",
+            "lastName": f"Last{person_id}",
+            "email": f"person{person_id}@example.com",
+            "statusId": person_id % 3,
+            "campusId": 0,
+            "sexId": person_id % 2 + 1,
+            "birthday": "1990-01-01",
+            "meta": {"modifiedDate": "2024-01-01T00:00:00Z"},
+        }
+        for person_id in range(1, count + 1)
+    ]
+
+
+def generate_songs(count: int) -> list[dict]:
+    """Generates song fixtures similar to /api/songs including tags.
+
+    Args:
+        count: number of songs
+
+    Returns:
+        list of song dicts with ids starting at 1
+    """
+    return [
+        {
+            "id": song_id,
+            "name": f"Song {song_id}",
+            "category": {"id": song_id % 5, "name": f"Category {song_id % 5}"},
+            "author": "Sample Author",
+            "ccli": str(100000 + song_id),
+            "arrangements": [
+                {"id": song_id * 10, "name": "Standard", "isDefault": True}
+            ],
+            "tags": [{"id": 1, "name": "sample"}] if song_id % 2 else [],
+        }
+        for song_id in range(1, count + 1)
+    ]
+
+
+def generate_events(count: int) -> list[dict]:
+    """Generates event fixtures similar to /api/events.
+
+    Args:
+        count: number of events
+
+    Returns:
+        list of event dicts with ids starting at 1
+    """
+    return [
+        {
+            "id": event_id,
+            "name": f"Event {event_id}",
+            "startDate": "2024-01-07T09:00:00Z",
+            "endDate": "2024-01-07T10:00:00Z",
+            "appointmentId": 1000 + event_id,
+            "calendar": {"domainIdentifier": "2", "title": "Gottesdienste"},
+            "eventServices": [],
+        }
+        for event_id in range(1, count + 1)
+    ]
+
+
+def generate_group_members(count: int, groups: int = 10) -> list[dict]:
+    """Generates group member fixtures similar to /api/groups/members.
+
+    Args:
+        count: number of group memberships
+        groups: number of groups the memberships are distributed on
+
+    Returns:
+        list of group member dicts
+    """
+    return [
+        {
+            "personId": member_id,
+            "groupId": member_id % groups + 1,
+            "groupTypeRoleId": 8 if member_id % 4 else 9,
+            "groupMemberStatus": "active",
+            "fields": [{"id": 1, "value": f"value {member_id}"}],
+        }
+        for member_id in range(1, count + 1)
+    ]
+
+
+def generate_group_hierarchies(groups: int = 10) -> list[dict]:
+    """Generates group hierarchy fixtures similar to /api/groups/hierarchies.
+
+    Groups form a binary tree - the parent of group n is group n // 2.
+
+    Args:
+        groups: number of groups
+
+    Returns:
+        list of hierarchy dicts
+    """
+    return [
+        {
+            "groupId": group_id,
+            "parents": [group_id // 2] if group_id > 1 else [],
+            "children": [
+                child_id
+                for child_id in (2 * group_id, 2 * group_id + 1)
+                if child_id <= groups
+            ],
+        }
+        for group_id in range(1, groups + 1)
+    ]
+
+
+class MockChurchToolsServer:
+    """Local http server answering a subset of the ChurchTools REST API.
+
+    Implements /api/whoami, /api/csrftoken, /api/persons, /api/songs,
+    /api/events, /api/groups/hierarchies and group members
+    including pagination meta information.
+    Latency and 429 responses can be injected to simulate a loaded instance.
+    With require_login requests need the token or a session cookie issued
+    on a token request - otherwise 401 is returned.
+
+    Usage:
+        with MockChurchToolsServer(persons=100) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN)
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        persons: int = 100,
+        songs: int = 100,
+        events: int = 100,
+        group_members: int = 100,
+        latency: float = 0,
+        require_login: bool = False,
+    ) -> None:
+        """Init of a server with generated fixtures - not started yet.
+
+        Args:
+            persons: number of persons. Defaults to 100
+            songs: number of songs. Defaults to 100
+            events: number of events. Defaults to 100
+            group_members: number of group memberships. Defaults to 100
+            latency: seconds each response is delayed. Defaults to 0
+            require_login: if requests without valid login are rejected.
+                Defaults to False
+        """
+        self.fixtures = {
+            "persons": generate_persons(persons),
+            "songs": generate_songs(songs),
+            "events": generate_events(events),
+        }
+        self.group_members = generate_group_members(group_members)
+        self.group_hierarchies = generate_group_hierarchies()
+        self.latency = latency
+        self.require_login = require_login
+        self.request_count = 0
+        self.login_count = 0
+        self.max_concurrent_requests = 0
+        self._active_requests = 0
+        self.paths: list[str] = []
+        self._sessions: set[str] = set()
+        self._rate_limited_requests = 0
+        self._retry_after = 0
+        self._failed_requests = 0
+        self._failure_status = 500
+        self._requests_before_failure = 0
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Domain of the running server which can be used for ChurchToolsApi."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockChurchToolsServer":
+        """Starts serving on a free port of localhost in a background thread."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _create_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="ct_mockserver", daemon=True
+        )
+        self._thread.start()
+        logger.debug("mock server started on %s", self.url)
+        return self
+
+    def stop(self) -> None:
+        """Stops the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> "MockChurchToolsServer":
+        """Starts the server."""
+        return self.start()
+
+    def __exit__(self, *_args: object) -> None:
+        """Stops the server."""
+        self.stop()
+
+    def inject_rate_limit(self, count: int = 1, retry_after: float = 0) -> None:
+        """Answers the next requests with 429 Too Many Requests.
+
+        Args:
+            count: number of requests to reject. Defaults to 1
+            retry_after: value of the Retry-After header in seconds. Defaults to 0
+        """
+        with self._lock:
+            self._rate_limited_requests = count
+            self._retry_after = retry_after
+
+    def inject_errors(self, count: int = 1, status: int = 500, after: int = 0) -> None:
+        """Answers the next requests with a server error.
+
+        Args:
+            count: number of requests to reject. Defaults to 1
+            status: http status code of the error. Defaults to 500
+            after: number of requests answered normally before. Defaults to 0
+        """
+        with self._lock:
+            self._failed_requests = count
+            self._failure_status = status
+            self._requests_before_failure = after
+
+    def expire_sessions(self) -> None:
+        """Invalidates all session cookies issued so far."""
+        with self._lock:
+            self._sessions.clear()
+
+    @contextmanager
+    def active_request(self) -> Iterator[None]:
+        """Counts a request as in flight - tracks max_concurrent_requests."""
+        with self._lock:
+            self._active_requests += 1
+            self.max_concurrent_requests = max(
+                self.max_concurrent_requests, self._active_requests
+            )
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active_requests -= 1
+
+    def handle(
+        self,
+        path: str,
+        params: dict[str, list[str]],
+        headers: dict | None = None,
+        *,
+        method: str = "GET",
+        body: dict | None = None,
+    ) -> tuple[int, dict | None, dict]:
+        """Creates the response for a request.
+
+        Args:
+            path: path of the url e.g. /api/persons
+            params: parsed query string
+            headers: request headers used for login. Defaults to None
+            method: http method - only group members can be changed.
+                Defaults to GET
+            body: decoded json body of the request. Defaults to None
+
+        Returns:
+            http status code, json content and additional response headers
+        """
+        with self._lock:
+            self.request_count += 1
+            self.paths.append(path)
+            if self._rate_limited_requests > 0:
+                self._rate_limited_requests -= 1
+                return (
+                    429,
+                    {"message": "Too Many Requests"},
+                    {"Retry-After": str(self._retry_after)},
+                )
+            if self._failed_requests > 0 and self._requests_before_failure > 0:
+                self._requests_before_failure -= 1
+            elif self._failed_requests > 0:
+                self._failed_requests -= 1
+                return self._failure_status, {"message": "Server Error"}, {}
+
+        response_headers = {}
+        if self.require_login:
+            authorized, response_headers = self._authenticate(headers or {})
+            if not authorized:
+                return 401, {"message": "Unauthorized"}, {}
+
+        if method != "GET":
+            status, content = self._change_group_member(method, path, body or {})
+            return status, content, response_headers
+
+        content = self._get_content(path, params)
+        if content is None:
+            return 404, NOT_FOUND, {}
+        return 200, content, response_headers
+
+    def _change_group_member(
+        self, method: str, path: str, body: dict
+    ) -> tuple[int, dict | None]:
+        """Helper which adds, updates or removes a group member.
+
+        Args:
+            method: PUT, PATCH or DELETE
+            path: path of the url e.g. /api/groups/1/members/2
+            body: decoded json body of the request
+
+        Returns:
+            http status code and json content
+        """
+        match path.strip("/").split("/"):
+            case ["api", "groups", group_id, "members", person_id]:
+                key = (int(group_id), int(person_id))
+            case _:
+                return 404, NOT_FOUND
+
+        with self._lock:
+            member = next(
+                (
+                    member
+                    for member in self.group_members
+                    if (member["groupId"], member["personId"]) == key
+                ),
+                None,
+            )
+            if method == "PUT":
+                if member is None:
+                    member = {
+                        "personId": key[1],
+                        "groupId": key[0],
+                        "groupTypeRoleId": 8,
+                        "groupMemberStatus": "active",
+                        "fields": [],
+                    }
+                    self.group_members.append(member)
+                self._update_group_member(member, body)
+                return 200, {"data": [member]}
+            if member is None:
+                return 404, NOT_FOUND
+            if method == "DELETE":
+                self.group_members.remove(member)
+                return 204, None
+            self._update_group_member(member, body)
+            return 200, {"data": member}
+
+    @staticmethod
+    def _update_group_member(member: dict, body: dict) -> None:
+        """Helper which applies role, status and fields of a request body.
+
+        Args:
+            member: group member which is changed in place
+            body: decoded json body of the request
+        """
+        for key in ("groupTypeRoleId", "groupMemberStatus"):
+            if key in body:
+                member[key] = body[key]
+        fields = {str(field["id"]): field for field in member["fields"]}
+        for field_id, value in body.get("fields", {}).items():
+            if str(field_id) in fields:
+                fields[str(field_id)]["value"] = value
+            else:
+                member["fields"].append({"id": int(field_id), "value": value})
+
+    def _get_content(self, path: str, params: dict[str, list[str]]) -> dict | None:
+        """Helper which returns the json content of an endpoint.
+
+        Args:
+            path: path of the url e.g. /api/persons
+            params: parsed query string
+
+        Returns:
+            json content or None if the endpoint is not known
+        """
+        content = None
+        match path.strip("/").split("/"):
+            case ["api", name] if name in STATIC_RESPONSES:
+                content = STATIC_RESPONSES[name]
+            case ["api", "groups", "members"]:
+                content = self._get_groups_members(params)
+            case ["api", "groups", "hierarchies"]:
+                content = {"data": self.group_hierarchies}
+            case ["api", "groups", group_id, "members"]:
+                content = self._paginate(
+                    [
+                        member
+                        for member in self.group_members
+                        if str(member["groupId"]) == group_id
+                    ],
+                    params,
+                )
+            case ["api", resource] if resource in self.fixtures:
+                content = self._get_list(self.fixtures[resource], "id", params)
+            case ["api", resource, item_id] if resource in self.fixtures:
+                content = next(
+                    (
+                        {"data": item}
+                        for item in self.fixtures[resource]
+                        if str(item["id"]) == item_id
+                    ),
+                    None,
+                )
+        return content
+
+    def _get_groups_members(self, params: dict[str, list[str]]) -> dict:
+        """Helper which filters group members by group, person and role.
+
+        Args:
+            params: parsed query string
+
+        Returns:
+            json content of the page
+        """
+        members = self.group_members
+        for param, key in (
+            ("person_ids[]", "personId"),
+            ("grouptype_role_ids[]", "groupTypeRoleId"),
+        ):
+            if values := params.get(param):
+                members = [member for member in members if str(member[key]) in values]
+        return self._get_list(members, "groupId", params)
+
+    def _authenticate(self, headers: dict) -> tuple[bool, dict]:
+        """Helper which checks the token or session cookie of a request.
+
+        A new session cookie is issued for each request authorized by token.
+
+        Args:
+            headers: request headers
+
+        Returns:
+            if the request is authorized and additional response headers
+        """
+        cookie = SimpleCookie(headers.get("Cookie", ""))
+        with self._lock:
+            if SESSION_COOKIE in cookie and cookie[SESSION_COOKIE].value in (
+                self._sessions
+            ):
+                return True, {}
+            if headers.get("Authorization") == f"Login {MOCK_TOKEN}":
+                session_id = uuid.uuid4().hex
+                self._sessions.add(session_id)
+                self.login_count += 1
+                return True, {"Set-Cookie": f"{SESSION_COOKIE}={session_id}; Path=/"}
+        return False, {}
+
+    def _get_list(
+        self, items: list[dict], id_key: str, params: dict[str, list[str]]
+    ) -> dict:
+        """Helper which filters items by ids[] and returns the requested page.
+
+        Args:
+            items: all items of the endpoint
+            id_key: key of the item matched with ids[] e.g. id or groupId
+            params: parsed query string
+
+        Returns:
+            json content of the page
+        """
+        if ids := params.get("ids[]"):
+            ids = {int(item_id) for item_id in ids}
+            items = [item for item in items if item[id_key] in ids]
+        return self._paginate(items, params)
+
+    @staticmethod
+    def _paginate(items: list[dict], params: dict[str, list[str]]) -> dict:
+        """Helper which returns one page of items with pagination meta information.
+
+        Args:
+            items: all items matching the request
+            params: parsed query string which might contain limit and page
+
+        Returns:
+            json content of the page
+        """
+        limit = min(int(params.get("limit", [DEFAULT_PAGE_LIMIT])[0]), MAX_PAGE_LIMIT)
+        page = int(params.get("page", [1])[0])
+        start = (page - 1) * limit
+        return {
+            "data": items[start : start + limit],
+            "meta": {
+                "count": len(items[start : start + limit]),
+                "pagination": {
+                    "total": len(items),
+                    "limit": limit,
+                    "current": page,
+                    "lastPage": max(ceil(len(items) / limit), 1),
+                },
+            },
+        }
+
+
+def _read_json_body(handler: BaseHTTPRequestHandler) -> dict | None:
+    """Helper which reads the json object sent with a request.
+
+    Args:
+        handler: handler of the current request
+
+    Returns:
+        decoded json object or None if the request has no json object
+    """
+    length = int(handler.headers.get("Content-Length") or 0)
+    if not length:
+        return None
+    body = json.loads(handler.rfile.read(length))
+    return body if isinstance(body, dict) else None
+
+
+def _create_handler(server: MockChurchToolsServer) -> type[BaseHTTPRequestHandler]:
+    """Creates a request handler class bound to the mock server.
+
+    Args:
+        server: the server providing fixtures and injected failures
+
+    Returns:
+        handler class used by ThreadingHTTPServer
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep alive like a real instance
+        disable_nagle_algorithm = True  # headers and body are written separately
+
+        def do_GET(self) -> None:
+            """Answers GET requests using the fixtures of the server."""
+            self._respond("GET")
+
+        def do_PUT(self) -> None:
+            """Answers PUT requests e.g. adding a group member."""
+            self._respond("PUT")
+
+        def do_PATCH(self) -> None:
+            """Answers PATCH requests e.g. updating a group member."""
+            self._respond("PATCH")
+
+        def do_DELETE(self) -> None:
+            """Answers DELETE requests e.g. removing a group member."""
+            self._respond("DELETE")
+
+        def _respond(self, method: str) -> None:
+            """Helper which answers requests using the fixtures of the server."""
+            with server.active_request():
+                if server.latency:
+                    time.sleep(server.latency)
+                url = urlsplit(self.path)
+                if len(self.path) > MAX_URL_LENGTH:
+                    status, content, headers = 414, {"message": "URI Too Long"}, {}
+                else:
+                    status, content, headers = server.handle(
+                        url.path,
+                        parse_qs(url.query),
+                        dict(self.headers),
+                        method=method,
+                        body=_read_json_body(self),
+                    )
+            body = b"" if content is None else json.dumps(content).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            """Redirects access logs to logging instead of stderr."""
+            logger.debug(format, *args)
+
+    return Handler
@@ -0,0 +1,110 @@
+"""module test batch execution of ChurchToolsApi calls."""
+
+import json
+import logging
+import logging.config
+from pathlib import Path
+
+import pytest
+import requests
+
+from churchtools_api.churchtools_api import ChurchToolsApi
+from tests.mockserver import MOCK_TOKEN, MockChurchToolsServer
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+
+class TestBatch:
+    """Test for batches - does not require a ChurchTools connection."""
+
+    def test_batch(self) -> None:
+        """Checks that all queued operations are executed with results."""
+        with MockChurchToolsServer(persons=20) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN, max_workers=4)
+            with api.batch() as batch:
+                for person_id in range(1, 11):
+                    batch.get_persons(ids=[person_id])
+                batch.add("get_songs", song_id=999)
+
+        EXPECTED_OPERATIONS = 11
+        assert len(batch.results) == EXPECTED_OPERATIONS
+        assert [result.result[0]["id"] for result in batch.results[:10]] == list(
+            range(1, 11)
+        )
+        assert all(result.attempts == 1 for result in batch.results)
+        assert [result.index for result in batch.failed] == [10]
+
+        with pytest.raises(RuntimeError):
+            batch.get_persons()
+        with pytest.raises(AttributeError):
+            api.batch().not_existing()
+
+    def test_batch_retry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Checks that network errors are repeated and other errors are recorded."""
+        api = ChurchToolsApi(domain="https://example.invalid")
+        calls = []
+
+        def add_tag(domain_type: str, domain_id: int, tag_name: str) -> bool:
+            calls.append(domain_id)
+            if domain_id == 1 and calls.count(1) == 1:
+                raise requests.exceptions.ConnectionError
+            if domain_id == 2:  # noqa: PLR2004
+                raise requests.exceptions.ConnectionError
+            if domain_id == 3:  # noqa: PLR2004
+                raise KeyError(tag_name)
+            return domain_type == "song"
+
+        monkeypatch.setattr(api, "add_tag", add_tag)
+        batch = api.batch(max_attempts=2)
+        batch.backoff_base = 0
+        for song_id in range(1, 5):
+            batch.add_tag("song", song_id, "sample")
+        results = batch.execute()
+
+        assert [result.ok for result in results] == [True, False, False, True]
+        assert [result.attempts for result in results] == [2, 2, 1, 1]
+        assert isinstance(results[1].error, requests.exceptions.ConnectionError)
+        assert isinstance(results[2].error, KeyError)
+
+    def test_batch_retry_server_error(self) -> None:
+        """Checks that operations failing with 503 are repeated."""
+        with MockChurchToolsServer(persons=20) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN, max_workers=1)
+            batch = api.batch()
+            batch.backoff_base = 0
+            batch.get_persons(ids=[1])
+            batch.get_songs(song_id=999)
+
+            server.inject_errors(count=1, status=503)
+            results = batch.execute()
+
+        assert [result.ok for result in results] == [True, False]
+        assert [result.attempts for result in results] == [2, 1]
+        assert results[0].result[0]["id"] == 1
+
+    def test_batch_no_retry_non_idempotent(self) -> None:
+        """Checks that operations sending PATCH are only repeated if requested."""
+        with MockChurchToolsServer(group_members=10) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN, max_workers=1)
+            member = server.group_members[0]
+            data = {"comment": "changed"}
+
+            batch = api.batch()
+            batch.backoff_base = 0
+            batch.update_group_member(member["groupId"], member["personId"], data)
+            batch.update_group_member(
+                member["groupId"], member["personId"], data, retry=True
+            )
+            server.inject_errors(count=2, status=503)
+            results = batch.execute()
+
+        assert [result.ok for result in results] == [False, True]
+        assert [result.attempts for result in results] == [1, 2]
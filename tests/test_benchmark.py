@@ -0,0 +1,215 @@
+"""module benchmarks of ChurchToolsApi using the offline mock server.
+
+Requires pytest-benchmark - skipped unless run explicitly with
+    pytest tests/test_benchmark.py --benchmark-only --benchmark-columns=min,mean,max
+Throughput and memory figures are reported in the extra_info of each benchmark.
+"""
+
+import json
+import logging
+import logging.config
+import subprocess
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from churchtools_api.churchtools_api import ChurchToolsApi
+from churchtools_api.churchtools_api_abstract import orjson
+from tests.mockserver import MOCK_TOKEN, MockChurchToolsServer
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+RECORDS = 10_000
+LATENCY = 0.002  # seconds per response simulating network round trips
+
+GETTERS = {
+    "get_persons": lambda api: api.get_persons(),
+    "get_persons_fields": lambda api: api.get_persons(fields=["lastName", "email"]),
+    "get_songs": lambda api: api.get_songs(),
+    "get_events": lambda api: api.get_events(),
+    "get_groups_members": lambda api: api.get_groups_members(),
+}
+
+JSON_DECODERS = {"json": json.loads}
+if orjson:
+    JSON_DECODERS["orjson"] = orjson.loads
+
+
+@pytest.fixture(autouse=True)
+def _require_benchmark_only(request: pytest.FixtureRequest) -> None:
+    """Skips benchmarks of a plain test run e.g. pytest tests/."""
+    if not request.config.getoption("benchmark_only"):
+        pytest.skip("benchmarks only run with --benchmark-only")
+
+
+@pytest.fixture(scope="module")
+def server() -> MockChurchToolsServer:
+    """Mock server with 10k records of each type."""
+    with MockChurchToolsServer(
+        persons=RECORDS,
+        songs=RECORDS,
+        events=RECORDS,
+        group_members=RECORDS,
+        latency=LATENCY,
+    ) as server:
+        yield server
+
+
+class TestBenchmark:
+    """Benchmarks which do not require a ChurchTools connection."""
+
+    def test_requests_per_second(
+        self, server: MockChurchToolsServer, benchmark: Callable
+    ) -> None:
+        """Measures throughput of single requests."""
+        api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN)
+        request_count = 100
+
+        def request_persons() -> None:
+            for person_id in range(1, request_count + 1):
+                api.get_persons(ids=[person_id])
+
+        benchmark.pedantic(request_persons, rounds=3)
+        if benchmark.stats is not None:  # None with --benchmark-disable
+            benchmark.extra_info["requests_per_second"] = round(
+                request_count / benchmark.stats.stats.mean
+            )
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    @pytest.mark.parametrize("getter", GETTERS)
+    def test_pagination_wall_time(
+        self,
+        server: MockChurchToolsServer,
+        benchmark: Callable,
+        getter: str,
+        max_workers: int,
+    ) -> None:
+        """Measures the wall time of requesting 10k paginated records."""
+        api = ChurchToolsApi(
+            domain=server.url, ct_token=MOCK_TOKEN, max_workers=max_workers
+        )
+
+        result = benchmark.pedantic(GETTERS[getter], args=(api,), rounds=1)
+
+        assert len(result) == RECORDS
+
+    @pytest.mark.parametrize("getter", GETTERS)
+    def test_memory_per_10k_records(
+        self, server: MockChurchToolsServer, benchmark: Callable, getter: str
+    ) -> None:
+        """Measures the peak memory used while requesting 10k records."""
+        api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN, max_workers=4)
+
+        def measure() -> int:
+            tracemalloc.start()
+            try:
+                result = GETTERS[getter](api)
+                _current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert len(result) == RECORDS
+            return peak
+
+        peak = benchmark.pedantic(measure, rounds=1)
+        benchmark.extra_info["peak_bytes_per_10k_records"] = peak
+        logger.info("%s peak memory per 10k records %s bytes", getter, peak)
+
+    @pytest.mark.parametrize("as_records", [False, True])
+    @pytest.mark.parametrize(
+        "getter", ["get_persons", "get_songs", "get_groups_members"]
+    )
+    def test_memory_records(
+        self,
+        server: MockChurchToolsServer,
+        benchmark: Callable,
+        getter: str,
+        as_records: bool,
+    ) -> None:
+        """Compares the memory retained by 10k dicts and 10k compact records."""
+        api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN, max_workers=4)
+
+        def measure() -> tuple[int, int]:
+            tracemalloc.start()
+            try:
+                result = getattr(api, getter)(as_records=as_records)
+                current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert len(result) == RECORDS
+            return current, peak
+
+        current, peak = benchmark.pedantic(measure, rounds=1)
+        benchmark.extra_info["retained_bytes_per_10k_records"] = current
+        benchmark.extra_info["peak_bytes_per_10k_records"] = peak
+        logger.info(
+            "%s as_records=%s retains %s bytes per 10k records",
+            getter,
+            as_records,
+            current,
+        )
+
+    @pytest.mark.parametrize("decoder", JSON_DECODERS)
+    def test_json_decoder(
+        self, server: MockChurchToolsServer, benchmark: Callable, decoder: str
+    ) -> None:
+        """Measures wall time and peak memory of 10k persons per json decoder.
+
+        Compare with the same getter in test_memory_per_10k_records
+        before responses were decoded without copies.
+        """
+        api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN, max_workers=4)
+        api.json_loads = JSON_DECODERS[decoder]
+
+        def measure() -> int:
+            tracemalloc.start()
+            try:
+                result = api.get_persons()
+                _current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert len(result) == RECORDS
+            return peak
+
+        peak = benchmark.pedantic(measure, rounds=3)
+        benchmark.extra_info["peak_bytes_per_10k_records"] = peak
+        logger.info("%s peak memory per 10k persons %s bytes", decoder, peak)
+
+    @pytest.mark.parametrize("decoder", JSON_DECODERS)
+    def test_decode_page(self, benchmark: Callable, decoder: str) -> None:
+        """Measures decoding of one page of 500 persons without network."""
+        content = json.dumps(
+            {"data": MockChurchToolsServer(persons=500).fixtures["persons"]}
+        ).encode()
+        result = benchmark(JSON_DECODERS[decoder], content)
+        assert len(result["data"]) == 500  # noqa: PLR2004
+
+    def test_import_time(self, benchmark: Callable) -> None:
+        """Measures the time to import ChurchToolsApi in a new interpreter.
+
+        Slow optional dependencies like docx and tzlocal must not be imported
+        until they are used.
+        """
+        code = (
+            "import sys; import churchtools_api.churchtools_api; "
+            "assert 'docx' not in sys.modules; assert 'tzlocal' not in sys.modules"
+        )
+
+        def import_api() -> None:
+            subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+        benchmark.pedantic(import_api, rounds=5)
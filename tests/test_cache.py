@@ -0,0 +1,91 @@
+"""module test caches."""
+
+import json
+import logging
+import logging.config
+from pathlib import Path
+from time import sleep
+
+from churchtools_api.cache import DiskTTLCache, TTLCache, cached
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+
+class SampleApi:
+    """Minimal object using the cached decorator like ChurchToolsApi does."""
+
+    def __init__(self, cache: TTLCache | None) -> None:
+        """Init with cache and counter of executed requests."""
+        self.cache = cache
+        self.domain = "https://sample.church.tools"
+        self.number_of_requests = 0
+
+    @cached
+    def get_masterdata(self, **kwargs: dict) -> dict:
+        """Sample method simulating a request."""
+        self.number_of_requests += 1
+        return {"kwargs": kwargs}
+
+
+class TestCache:
+    """Test for caches - does not require a ChurchTools connection."""
+
+    def test_ttl_cache_expiry_and_lru(self) -> None:
+        """Checks that entries expire and least recently used ones are evicted."""
+        cache = TTLCache(maxsize=2, ttl=0.2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+        sleep(0.3)
+        assert cache.get("a") is None
+
+    def test_cached_decorator(self) -> None:
+        """Checks that results are reused per arguments and can be invalidated."""
+        api = SampleApi(cache=TTLCache())
+
+        first = api.get_masterdata(resultClass="sexes")
+        first["modified"] = True
+        assert api.get_masterdata(resultClass="sexes") == {
+            "kwargs": {"resultClass": "sexes"}
+        }
+        assert api.number_of_requests == 1
+
+        api.get_masterdata(resultClass="other")
+        EXPECTED_REQUESTS = 2
+        assert api.number_of_requests == EXPECTED_REQUESTS
+
+        api.cache.invalidate(prefix="get_masterdata:")
+        api.get_masterdata(resultClass="sexes")
+        EXPECTED_REQUESTS = 3
+        assert api.number_of_requests == EXPECTED_REQUESTS
+
+    def test_cached_decorator_disabled(self) -> None:
+        """Checks that no caching happens without cache."""
+        api = SampleApi(cache=None)
+        api.get_masterdata()
+        api.get_masterdata()
+        EXPECTED_REQUESTS = 2
+        assert api.number_of_requests == EXPECTED_REQUESTS
+
+    def test_disk_ttl_cache(self, tmp_path: Path) -> None:
+        """Checks that entries are available for a new cache with same file."""
+        filename = tmp_path / "cache"
+        DiskTTLCache(filename=filename).set("a", {"id": 1})
+
+        assert DiskTTLCache(filename=filename).get("a") == {"id": 1}
+
+        DiskTTLCache(filename=filename).invalidate()
+        assert DiskTTLCache(filename=filename).get("a") is None
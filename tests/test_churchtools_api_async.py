@@ -0,0 +1,64 @@
+"""module test async api."""
+
+import asyncio
+import json
+import logging
+import logging.config
+from pathlib import Path
+
+from churchtools_api.churchtools_api_async import AsyncChurchToolsApi
+from tests.test_churchtools_api_abstract import TestsChurchToolsApiAbstract
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+
+class TestChurchtoolsApiAsync(TestsChurchToolsApiAbstract):
+    """Test for AsyncChurchToolsApi."""
+
+    def test_async_get_persons(self) -> None:
+        """Checks that multiple coroutines can be awaited at once.
+
+        IMPORTANT - This test method and the parameters used depend on target system!
+        the hard coded sample exists on ELKW1610.KRZ.TOOLS
+        On any elkw.KRZ.TOOLS personId 1 'firstName' starts with 'Ben'
+        """
+        SAMPLE_PERSON_ID = 1
+
+        async def run() -> tuple[list[dict], list[dict]]:
+            async with AsyncChurchToolsApi(
+                domain=self.ct_domain, ct_token=self.ct_token
+            ) as api:
+                return await asyncio.gather(
+                    api.get_persons(ids=[SAMPLE_PERSON_ID]),
+                    api.get_groups(),
+                )
+
+        persons, groups = asyncio.run(run())
+        assert persons[0]["firstName"][0:3] == "Ben"
+        assert isinstance(groups, list)
+
+    def test_async_iter_persons(self) -> None:
+        """Checks that iter_persons is available as async generator.
+
+        IMPORTANT - This test method and the parameters used depend on target system!
+        requires more than 50 persons to be visible for the test user
+        """
+
+        async def run() -> list[dict]:
+            async with AsyncChurchToolsApi(
+                domain=self.ct_domain, ct_token=self.ct_token
+            ) as api:
+                return [person async for person in api.iter_persons()]
+
+        persons = asyncio.run(run())
+        assert [person["id"] for person in persons] == [
+            person["id"] for person in self.api.get_persons()
+        ]
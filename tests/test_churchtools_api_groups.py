@@ -264,6 +264,38 @@ class TestChurchtoolsApiGroups(TestsChurchToolsApiAbstract):
         )
         assert members[0]["comment"] is None
 
+    def test_sync_group_member_fields(self) -> None:
+        """Checks that members are only updated if mapped field values differ.
+
+        Syncing a group with itself must not update any member.
+        The field change detection is checked with sample members.
+
+        IMPORTANT - This test method and the parameters used depend on target system!
+        the hard coded sample exists on ELKW1610.KRZ.TOOLS
+        """
+        SAMPLE_GROUP_ID = 103
+
+        memberfields = self.api.get_group_memberfields(group_id=SAMPLE_GROUP_ID)
+        field_mapping = {
+            memberfield["field"]["id"]: memberfield["field"]["id"]
+            for memberfield in memberfields
+        }
+        result = self.api.sync_group_member_fields(
+            source_group_id=SAMPLE_GROUP_ID,
+            target_group_id=SAMPLE_GROUP_ID,
+            field_mapping=field_mapping,
+        )
+        assert result == {}
+
+        source_member = {"fields": [{"id": 1, "value": "a"}, {"id": 2, "value": "b"}]}
+        target_member = {"fields": [{"id": 11, "value": "a"}, {"id": 12, "value": "c"}]}
+        changes = self.api._get_group_member_field_changes(  # noqa: SLF001
+            source_member=source_member,
+            target_member=target_member,
+            field_mapping={1: 11, 2: "12"},
+        )
+        assert changes == {"12": "b"}
+
     def test_get_group_members(self) -> None:
         """Checks if group members can be retrieved.
 
@@ -370,6 +402,19 @@ class TestChurchtoolsApiGroups(TestsChurchToolsApiAbstract):
         )
         assert len(result) == 1
 
+    def test_iter_groups_members(self) -> None:
+        """Check that iter_groups_members matches get_groups_members.
+
+        IMPORTANT - This test method and the parameters used depend on target system!
+        the hard coded sample exists on ELKW1610.KRZ.TOOLS
+        """
+        SAMPLE_PERSON_IDS = [513]
+        EXPECTED_GROUP_ID = 103  # a services test group
+
+        result = list(self.api.iter_groups_members(person_ids=SAMPLE_PERSON_IDS))
+        assert EXPECTED_GROUP_ID in [member["groupId"] for member in result]
+        assert result == self.api.get_groups_members(person_ids=SAMPLE_PERSON_IDS)
+
     def test_add_and_remove_group_members(self) -> None:
         """Checks add_and_remove_group_members.
 
@@ -118,3 +118,33 @@ class TestChurchtoolsApiPersons(TestsChurchToolsApiAbstract):
         result = gender_map[person[0]["sexId"]]
 
         assert result == EXPECTED_RESULT
+
+    def test_get_persons_concurrent_pagination(self) -> None:
+        """Checks that concurrent pagination returns the same persons in same order.
+
+        IMPORTANT - This test method and the parameters used depend on target system!
+        requires more than 50 persons to be visible for the test user
+        """
+        sequential_result = self.api.get_persons()
+
+        self.api.max_workers = 4
+        try:
+            concurrent_result = self.api.get_persons()
+        finally:
+            self.api.max_workers = 1
+
+        assert [person["id"] for person in concurrent_result] == [
+            person["id"] for person in sequential_result
+        ]
+
+    def test_iter_persons(self) -> None:
+        """Checks that iter_persons yields the same persons as get_persons.
+
+        IMPORTANT - This test method and the parameters used depend on target system!
+        requires more than 50 persons to be visible for the test user
+        """
+        result = self.api.iter_persons()
+        assert isinstance(next(result), dict)
+
+        expected_ids = [person["id"] for person in self.api.get_persons()]
+        assert [person["id"] for person in self.api.iter_persons()] == expected_ids
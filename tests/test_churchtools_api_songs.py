@@ -44,6 +44,21 @@ class TestChurchtoolsApiSongs(TestsChurchToolsApiAbstract):
         assert song["id"] == SAMPLE_SONG["id"]
         assert song["name"] == SAMPLE_SONG["name"]
 
+    def test_iter_songs(self) -> None:
+        """Check that iter_songs yields the same songs as get_songs.
+
+        IMPORTANT - This test method and the parameters used
+            depend on the target system!
+        the hard coded sample exists on ELKW1610.KRZ.TOOLS
+        """
+        SAMPLE_SONG = {"id": 2034, "name": "sample"}
+
+        song_ids = [song["id"] for song in self.api.iter_songs()]
+        assert song_ids == [song["id"] for song in self.api.get_songs()]
+
+        song = next(self.api.iter_songs(song_id=SAMPLE_SONG["id"]))
+        assert song["name"] == SAMPLE_SONG["name"]
+
     def test_get_song_category_map(self) -> None:
         """Checks that a dict with respective known values.
 
@@ -216,6 +231,33 @@ class TestChurchtoolsApiSongs(TestsChurchToolsApiAbstract):
         result_ids = [song["id"] for song in result]
         assert SAMPLE_SONG_ID in result_ids
 
+    def test_get_song_tag_index(self) -> None:
+        """Checks the song tag index and that it is reused and kept up to date.
+
+        IMPORTANT - This test method and the parameters used depend on target system!
+        the hard coded sample exists on ELKW1610.KRZ.TOOLS
+        song ID 408 is tagged with 163 "Test"
+        """
+        SAMPLE_TAG_NAME = "Test"
+        SAMPLE_SONG_ID = 408
+
+        MAX_AGE = 300
+        tag_index = self.api.get_song_tag_index()
+        assert SAMPLE_SONG_ID in tag_index[SAMPLE_TAG_NAME]
+        assert self.api.get_song_tag_index(max_age=MAX_AGE) is tag_index
+
+        self.api.remove_tag(
+            domain_type="song", domain_id=SAMPLE_SONG_ID, tag_name=SAMPLE_TAG_NAME
+        )
+        tag_index = self.api.get_song_tag_index(max_age=MAX_AGE)
+        assert SAMPLE_SONG_ID not in tag_index[SAMPLE_TAG_NAME]
+
+        self.api.add_tag(
+            domain_type="song", domain_id=SAMPLE_SONG_ID, tag_name=SAMPLE_TAG_NAME
+        )
+        tag_index = self.api.get_song_tag_index(max_age=MAX_AGE)
+        assert SAMPLE_SONG_ID in tag_index[SAMPLE_TAG_NAME]
+
     def test_get_song_source_map(self) -> None:
         """Checks respective method returns some data.
 
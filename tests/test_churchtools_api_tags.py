@@ -124,6 +124,45 @@ class TestChurchtoolsApiTags(TestsChurchToolsApiAbstract):
         )
         assert not is_assigned
 
+    def test_add_remove_tags_bulk(self) -> None:
+        """Checks bulk assignment and removal of tags using "song" as sample.
+
+        IMPORTANT - This test method and the parameters used depend on target system!
+        the hard coded sample exists on ELKW1610.KRZ.TOOLS.
+
+        On ELKW1610.KRZ.TOOLS song IDs 408 and 2034 are used for testing
+        """
+        SAMPLE_SONG_IDS = [408, 2034]
+        SAMPLE_TAG_NAME = "test_add_remove_tags_bulk"
+
+        result = self.api.add_tags_bulk(
+            domain_type="song",
+            domain_ids=SAMPLE_SONG_IDS,
+            tag_name=SAMPLE_TAG_NAME,
+            max_workers=2,
+        )
+        assert result == dict.fromkeys(SAMPLE_SONG_IDS, True)
+
+        for song_id in SAMPLE_SONG_IDS:
+            tags = self.api.get_tag(
+                domain_type="song", domain_id=song_id, rtype="name_dict"
+            )
+            assert SAMPLE_TAG_NAME in tags
+
+        result = self.api.remove_tags_bulk(
+            domain_type="song",
+            domain_ids=SAMPLE_SONG_IDS,
+            tag_name=SAMPLE_TAG_NAME,
+            max_workers=2,
+        )
+        assert result == dict.fromkeys(SAMPLE_SONG_IDS, True)
+
+        for song_id in SAMPLE_SONG_IDS:
+            tags = self.api.get_tag(
+                domain_type="song", domain_id=song_id, rtype="name_dict"
+            )
+            assert SAMPLE_TAG_NAME not in tags
+
     def test_get_song_tag_original(self) -> None:
         """Cchek song tag can be retrieved and returned as original.
 
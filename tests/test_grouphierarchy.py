@@ -0,0 +1,68 @@
+"""module test group hierarchy graph using the offline mock server."""
+
+import json
+import logging
+import logging.config
+from pathlib import Path
+
+from churchtools_api.cache import TTLCache
+from churchtools_api.churchtools_api import ChurchToolsApi
+from churchtools_api.grouphierarchy import GroupHierarchy
+from tests.mockserver import MOCK_TOKEN, MockChurchToolsServer
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+
+class TestGroupHierarchy:
+    """Test for GroupHierarchy - does not require a ChurchTools connection."""
+
+    def test_closures(self) -> None:
+        """Checks ancestors, descendants and order including a diamond and a cycle."""
+        hierarchies = {
+            1: {"groupId": 1, "parents": [], "children": [2, 3]},
+            2: {"groupId": 2, "parents": [1], "children": [4]},
+            3: {"groupId": 3, "parents": [1], "children": [4]},
+            4: {"groupId": 4, "parents": [2, 3], "children": []},
+            5: {"groupId": 5, "parents": [6], "children": [6]},
+            6: {"groupId": 6, "parents": [5], "children": [5, 7]},
+        }
+        hierarchy = GroupHierarchy(hierarchies)
+
+        assert len(hierarchy) == 7  # noqa: PLR2004 - child 7 is only referenced
+        assert hierarchy.roots == [1]
+        assert hierarchy.topological_order == (1, 2, 3, 4, 5, 6, 7)
+        assert hierarchy.descendants(1) == {2, 3, 4}
+        assert hierarchy.ancestors(4) == {1, 2, 3}
+        assert hierarchy.children(2) == {4}
+        assert hierarchy.parents(4) == {2, 3}
+        assert hierarchy.descendants(5) == {5, 6, 7}
+        assert hierarchy.ancestors(7) == {5, 6}
+        assert hierarchy.descendants(99) == frozenset()
+
+    def test_get_transitive_members(self) -> None:
+        """Checks that members of all sub groups are requested at once."""
+        with MockChurchToolsServer(group_members=90) as server:
+            api = ChurchToolsApi(
+                domain=server.url,
+                ct_token=MOCK_TOKEN,
+                max_workers=2,
+                cache=TTLCache(),
+            )
+
+            members = api.get_transitive_members(2)
+            assert {member["groupId"] for member in members} == {2, 4, 5, 8, 9, 10}
+            assert len(members) == 54  # noqa: PLR2004
+
+            members = api.get_transitive_members(2, include_group=False)
+            assert {member["groupId"] for member in members} == {4, 5, 8, 9, 10}
+
+            assert api.get_group_hierarchy() is api.get_group_hierarchy()
+            assert server.paths.count("/api/groups/hierarchies") == 1
@@ -0,0 +1,80 @@
+"""module test resumable jobs using the offline mock server."""
+
+import json
+import logging
+import logging.config
+from pathlib import Path
+
+import pytest
+
+from churchtools_api.churchtools_api import ChurchToolsApi
+from churchtools_api.jobs import CheckpointedJob
+from tests.mockserver import MOCK_TOKEN, MockChurchToolsServer
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+
+class TestJobs:
+    """Test for jobs - does not require a ChurchTools connection."""
+
+    def test_run_paginated_resume(self, tmp_path: Path) -> None:
+        """Checks that an interrupted job continues where it stopped."""
+        checkpoint_file = tmp_path / "songs.json"
+        processed = []
+
+        def interrupted(song: dict) -> bool:
+            if song["id"] == 25:  # noqa: PLR2004
+                raise ConnectionError
+            processed.append(song["id"])
+            return True
+
+        with MockChurchToolsServer(songs=95) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN)
+
+            job = CheckpointedJob(api, checkpoint_file, chunk_size=4)
+            with pytest.raises(ConnectionError):
+                job.run_paginated("/api/songs", interrupted, limit=10)
+            checkpoint = json.loads(checkpoint_file.read_text())
+            assert checkpoint["cursor"] == {"page": 3}
+            assert checkpoint["processed"] == [21, 22, 23, 24, 26, 27, 28]
+
+            server.paths.clear()
+            job = CheckpointedJob(api, checkpoint_file, chunk_size=4)
+            summary = job.run_paginated(
+                "/api/songs",
+                lambda song: processed.append(song["id"]) or True,
+                limit=10,
+            )
+
+        assert summary == {
+            "processed": 95 - 27,
+            "skipped": 7,
+            "failed": [],
+            "completed": True,
+        }
+        assert sorted(processed) == list(range(1, 96))
+        assert server.paths == ["/api/songs"] * 8
+        assert not checkpoint_file.exists()
+
+    def test_run_failed_items(self, tmp_path: Path) -> None:
+        """Checks that failed items are kept and repeated by the next run."""
+        checkpoint_file = tmp_path / "ids.json"
+        api = ChurchToolsApi(domain="https://example.invalid", max_workers=3)
+        items = [{"id": item_id} for item_id in range(10)]
+
+        job = CheckpointedJob(api, checkpoint_file)
+        summary = job.run(items, lambda item: item["id"] % 4 != 0)
+        assert summary == {"processed": 7, "skipped": 0, "failed": [0, 4, 8]}
+        assert json.loads(checkpoint_file.read_text())["failed"] == [0, 4, 8]
+
+        summary = CheckpointedJob(api, checkpoint_file).run(items, lambda _item: True)
+        assert summary == {"processed": 3, "skipped": 7, "failed": []}
+        assert not checkpoint_file.exists()
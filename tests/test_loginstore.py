@@ -0,0 +1,78 @@
+"""module test reuse of logins using the offline mock server."""
+
+import json
+import logging
+import logging.config
+from pathlib import Path
+
+from churchtools_api.churchtools_api import ChurchToolsApi
+from churchtools_api.loginstore import LoginStore
+from tests.mockserver import MOCK_TOKEN, MockChurchToolsServer
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+
+class TestLoginStore:
+    """Test for login reuse - does not require a ChurchTools connection."""
+
+    def test_lazy_login(self) -> None:
+        """Checks that the first request of a lazy login is a useful one."""
+        with MockChurchToolsServer(require_login=True) as server:
+            api = ChurchToolsApi(
+                domain=server.url, ct_token=MOCK_TOKEN, lazy_login=True
+            )
+            assert server.request_count == 0
+
+            persons = api.get_persons(ids=[1])
+
+            assert persons[0]["id"] == 1
+            assert server.paths == ["/api/persons"]
+
+            invalid_api = ChurchToolsApi(
+                domain=server.url, ct_token="invalid", lazy_login=True  # noqa: S106
+            )
+            assert invalid_api.get_persons(ids=[1]) is None
+
+    def test_login_store(self, tmp_path: Path) -> None:
+        """Checks that a stored login is reused and renewed once outdated."""
+        login_store = LoginStore(tmp_path / "logins.json")
+        with MockChurchToolsServer(require_login=True) as server:
+            api = ChurchToolsApi(
+                domain=server.url, ct_token=MOCK_TOKEN, login_store=login_store
+            )
+            assert server.paths == ["/api/whoami", "/api/csrftoken"]
+            assert (tmp_path / "logins.json").stat().st_mode & 0o777 == 0o600  # noqa: PLR2004
+
+            api = ChurchToolsApi(
+                domain=server.url, ct_token=MOCK_TOKEN, login_store=login_store
+            )
+            server.paths.clear()
+            assert api.get_persons(ids=[1])[0]["id"] == 1
+            assert server.paths == ["/api/persons"]
+            assert api.session.headers["CSRF-Token"] == "mock-csrf-token"
+            assert server.login_count == 1
+
+            server.expire_sessions()
+            server.paths.clear()
+            assert api.get_persons(ids=[2])[0]["id"] == 2  # noqa: PLR2004
+            assert server.paths == [
+                "/api/persons",
+                "/api/whoami",
+                "/api/csrftoken",
+                "/api/persons",
+            ]
+            assert server.login_count == 2  # noqa: PLR2004
+
+        key = LoginStore.get_key(domain=api.domain, ct_token=MOCK_TOKEN, ct_user=None)
+        assert MOCK_TOKEN not in (tmp_path / "logins.json").read_text()
+        assert login_store.load(key)["person_id"] == 1
+        login_store.delete(key)
+        assert login_store.load(key) is None
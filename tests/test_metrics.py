@@ -0,0 +1,116 @@
+"""module test request metrics using the offline mock server."""
+
+import json
+import logging
+import logging.config
+from pathlib import Path
+
+import pytest
+
+from churchtools_api.churchtools_api import ChurchToolsApi
+from churchtools_api.metrics import (
+    CallbackMetrics,
+    InMemoryMetrics,
+    PrometheusMetrics,
+    RequestMetric,
+    normalize_endpoint,
+)
+from tests.mockserver import MOCK_TOKEN, MockChurchToolsServer
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+
+@pytest.fixture(scope="module")
+def server() -> MockChurchToolsServer:
+    """Mock server shared by all tests of this module."""
+    with MockChurchToolsServer(persons=120) as server:
+        yield server
+
+
+class TestMetrics:
+    """Test for metrics - does not require a ChurchTools connection."""
+
+    def test_normalize_endpoint(self) -> None:
+        """Checks that numeric ids and params are removed from endpoints."""
+        assert (
+            normalize_endpoint("https://xyz.church.tools/api/persons/12/tags?ids[]=1")
+            == "/api/persons/{id}/tags"
+        )
+        assert normalize_endpoint("https://xyz.church.tools/api/v2") == "/api/v2"
+
+    def test_in_memory_metrics(self, server: MockChurchToolsServer) -> None:
+        """Checks counts, bytes and rate limits per endpoint."""
+        metrics = InMemoryMetrics()
+        api = ChurchToolsApi(
+            domain=server.url,
+            ct_token=MOCK_TOKEN,
+            session_options={"metrics": metrics},
+        )
+        metrics.reset()
+
+        server.inject_rate_limit(count=1, retry_after=0.1)
+        api.get_persons()
+        api.get_songs(song_id=1)
+
+        snapshot = metrics.snapshot()
+        persons = snapshot["endpoints"]["GET /api/persons"]
+        EXPECTED_PAGES = 3
+        assert persons["count"] == EXPECTED_PAGES + 1
+        assert persons["rate_limited"] == 1
+        assert persons["status_codes"] == {200: EXPECTED_PAGES, 429: 1}
+        assert persons["latency_buckets"][float("inf")] == persons["count"]
+        assert persons["bytes_received"] > 0
+        assert snapshot["endpoints"]["GET /api/songs/{id}"]["count"] == 1
+        assert snapshot["requests"] == EXPECTED_PAGES + 2
+        assert snapshot["sleep_seconds"] > 0
+
+    def test_prometheus_metrics(self) -> None:
+        """Checks the text exposition format."""
+        metrics = PrometheusMetrics()
+        metrics.record_request(
+            RequestMetric(
+                method="GET",
+                endpoint="/api/persons",
+                status_code=200,
+                latency=0.2,
+                bytes_received=100,
+            )
+        )
+        metrics.record_sleep(1.5)
+
+        lines = metrics.exposition().splitlines()
+        labels = 'method="GET",endpoint="/api/persons"'
+        assert f'churchtools_api_requests_total{{{labels},status="200"}} 1' in lines
+        assert f"churchtools_api_received_bytes_total{{{labels}}} 100" in lines
+        assert (
+            f'churchtools_api_request_duration_seconds_bucket{{{labels},le="0.1"}} 0'
+            in lines
+        )
+        assert (
+            f'churchtools_api_request_duration_seconds_bucket{{{labels},le="0.25"}} 1'
+            in lines
+        )
+        assert "churchtools_api_sleep_seconds_total 1.5" in lines
+
+    def test_callback_metrics(self, server: MockChurchToolsServer) -> None:
+        """Checks that each request is passed to the callback."""
+        received = []
+        api = ChurchToolsApi(
+            domain=server.url,
+            ct_token=MOCK_TOKEN,
+            session_options={"metrics": CallbackMetrics(on_request=received.append)},
+        )
+        received.clear()
+
+        api.get_persons(ids=[1])
+
+        assert [metric.endpoint for metric in received] == ["/api/persons"]
+        assert received[0].status_code == 200  # noqa: PLR2004
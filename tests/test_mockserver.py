@@ -0,0 +1,204 @@
+"""module test ChurchToolsApi against the offline mock server."""
+
+import json
+import logging
+import logging.config
+from pathlib import Path
+
+import pytest
+
+from churchtools_api.churchtools_api import ChurchToolsApi
+from tests.mockserver import MOCK_TOKEN, MockChurchToolsServer
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+
+@pytest.fixture(scope="module")
+def server() -> MockChurchToolsServer:
+    """Mock server shared by all tests of this module."""
+    with MockChurchToolsServer(
+        persons=120, songs=75, events=60, group_members=90
+    ) as server:
+        yield server
+
+
+class TestMockServer:
+    """Test which do not require a ChurchTools connection."""
+
+    def test_login(self, server: MockChurchToolsServer) -> None:
+        """Checks that a token login works including the CSRF token."""
+        api = ChurchToolsApi(domain=server.url)
+        assert api.login_ct_rest_api(ct_token=MOCK_TOKEN) == 1
+        assert api.session.headers["CSRF-Token"] == "mock-csrf-token"
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_pagination(self, server: MockChurchToolsServer, max_workers: int) -> None:
+        """Checks that all pages are combined in order."""
+        api = ChurchToolsApi(
+            domain=server.url, ct_token=MOCK_TOKEN, max_workers=max_workers
+        )
+
+        persons = api.get_persons()
+        assert [person["id"] for person in persons] == list(range(1, 121))
+        assert len(api.get_songs()) == 75  # noqa: PLR2004
+        assert len(api.get_events()) == 60  # noqa: PLR2004
+        assert [person["id"] for person in api.iter_persons()] == list(range(1, 121))
+
+        members = api.get_groups_members(group_ids=[1, 2])
+        assert len(members) == 18  # noqa: PLR2004
+        assert {member["groupId"] for member in members} == {1, 2}
+
+    def test_rate_limit(self, server: MockChurchToolsServer) -> None:
+        """Checks that injected 429 responses are repeated transparently."""
+        api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN)
+        request_count = server.request_count
+
+        server.inject_rate_limit(count=2)
+        persons = api.get_persons(ids=[1, 2])
+
+        assert [person["id"] for person in persons] == [1, 2]
+        assert server.request_count - request_count == 3  # noqa: PLR2004
+
+    def test_request_coalescing(self, server: MockChurchToolsServer) -> None:
+        """Checks that identical concurrent requests are only sent once."""
+        CONCURRENT_REQUESTS = 8
+        api = ChurchToolsApi(
+            domain=server.url, ct_token=MOCK_TOKEN, max_workers=CONCURRENT_REQUESTS
+        )
+        request_count = server.request_count
+        server.latency = 0.2
+        try:
+            songs = api._map_concurrently(  # noqa: SLF001
+                lambda _i: api.get_songs(song_id=1), range(CONCURRENT_REQUESTS)
+            )
+        finally:
+            server.latency = 0
+
+        assert server.request_count - request_count == 1
+        assert all(song == songs[0] for song in songs)
+        assert len({id(song) for song in songs}) == CONCURRENT_REQUESTS
+
+        api.session.single_flight = None
+        request_count = server.request_count
+        api._map_concurrently(  # noqa: SLF001
+            lambda _i: api.get_songs(song_id=1), range(CONCURRENT_REQUESTS)
+        )
+        assert server.request_count - request_count == CONCURRENT_REQUESTS
+
+    def test_chunked_id_filter(self, server: MockChurchToolsServer) -> None:
+        """Checks that long ids[] filters are split into several requests."""
+        api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN, max_workers=4)
+        person_ids = [*range(2000, 0, -1), 1, 2, 3]  # more ids than persons
+
+        api.id_chunk_size = len(person_ids)
+        assert api.get_persons(ids=person_ids) is None  # 414 URI Too Long
+
+        api.id_chunk_size = 100
+        request_count = server.request_count
+        persons = api.get_persons(ids=person_ids)
+        assert sorted(person["id"] for person in persons) == list(range(1, 121))
+        assert server.request_count - request_count == 21  # noqa: PLR2004
+
+        persons = api.get_persons(ids=person_ids, returnAsDict=True)
+        assert sorted(persons) == list(range(1, 121))
+
+        members = api.get_groups_members(group_ids=[*range(1000, 0, -1)])
+        assert len(members) == 90  # noqa: PLR2004
+
+    def test_iterate_sequentially(self) -> None:
+        """Checks that generators only request pages concurrently if configured."""
+        with MockChurchToolsServer(persons=200, latency=0.02) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN)
+            assert len(list(api.iter_persons())) == 200  # noqa: PLR2004
+        assert server.max_concurrent_requests == 1
+
+    def test_chunked_concurrency(self) -> None:
+        """Checks that pages of chunks do not exceed max_workers requests in flight."""
+        MAX_WORKERS = 4
+        EXPECTED_PERSONS = 800
+        with MockChurchToolsServer(persons=EXPECTED_PERSONS, latency=0.02) as server:
+            api = ChurchToolsApi(
+                domain=server.url, ct_token=MOCK_TOKEN, max_workers=MAX_WORKERS
+            )
+            api.id_chunk_size = 200  # 4 pages per chunk
+            persons = api.get_persons(ids=list(range(1, EXPECTED_PERSONS + 1)))
+
+        assert len(persons) == EXPECTED_PERSONS
+        assert server.max_concurrent_requests <= MAX_WORKERS
+
+    def test_fields_projection(self, server: MockChurchToolsServer) -> None:
+        """Checks that only requested fields are kept on every page."""
+        api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN, max_workers=4)
+
+        persons = api.get_persons(fields=["lastName", "meta.modifiedDate", "missing"])
+        assert len(persons) == 120  # noqa: PLR2004
+        assert persons[-1] == {
+            "id": 120,
+            "lastName": "Last120",
+            "meta": {"modifiedDate": "2024-01-01T00:00:00Z"},
+        }
+
+        persons = api.get_persons(fields=["email"], as_records=True)
+        assert persons[0].email == "person1@example.com"
+        assert persons[0].last_name is None
+
+        members = api.get_group_members(group_id=2, fields=["personId"])
+        assert members == [{"personId": person_id} for person_id in range(1, 91, 10)]
+
+    def test_song_tag_index(self, server: MockChurchToolsServer) -> None:
+        """Checks that the song tag index is only reused if requested."""
+        api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN)
+        MAX_AGE = 300
+
+        tag_index = api.get_song_tag_index()
+        assert 1 in tag_index["sample"]
+        assert 2 not in tag_index["sample"]  # noqa: PLR2004
+
+        request_count = server.request_count
+        assert api.get_song_tag_index() is not tag_index
+        assert server.request_count > request_count
+
+        tag_index = api.get_song_tag_index()
+        request_count = server.request_count
+        assert api.get_song_tag_index(max_age=MAX_AGE) is tag_index
+        assert api.contains_song_tag(1, "sample", max_age=MAX_AGE)
+        assert server.request_count == request_count
+
+    def test_groups_members_filter_pushdown(
+        self, server: MockChurchToolsServer
+    ) -> None:
+        """Checks that person and role filters are passed to ChurchTools."""
+        api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN)
+
+        request_count = server.request_count
+        members = api.get_groups_members(person_ids=[5, 6], grouptype_role_ids=[8])
+        assert [member["personId"] for member in members] == [5, 6]
+        assert server.request_count - request_count == 1
+
+        request_count = server.request_count
+        members = api.get_groups_members(
+            group_ids=[1, 2], person_ids=list(range(1000, 0, -1))
+        )
+        assert len(members) == 18  # noqa: PLR2004
+        # 10 chunks of person ids - the one containing all members has 2 pages
+        assert server.request_count - request_count == 11  # noqa: PLR2004
+
+        members = list(api.iter_groups_members(person_ids=[7]))
+        assert [member["personId"] for member in members] == [7]
+
+        params, _chunked_param = api._get_groups_members_params(  # noqa: SLF001
+            [1], with_deleted=False
+        )
+        assert params == {"ids[]": [1]}
+        params, _chunked_param = api._get_groups_members_params(  # noqa: SLF001
+            [1], with_deleted=True
+        )
+        assert params == {"ids[]": [1], "with_deleted": "true"}
@@ -4,9 +4,12 @@ import json
 import logging
 import logging.config
 from pathlib import Path
+from time import monotonic
 
 import pytest
+import requests
 
+from churchtools_api.ratelimitedsession import RateLimitedSession, RateLimiter
 from tests.test_churchtools_api_abstract import TestsChurchToolsApiAbstract
 
 logger = logging.getLogger(__name__)
@@ -39,8 +42,55 @@ class TestsRateLimitedSession(TestsChurchToolsApiAbstract):
         with caplog.at_level(logging.INFO, logger="ratelimitedsession"):
             for _i in range(1000):
                 self.api.get_calendars()
-        EXPECTED_MESSAGES = [
-            "rate limit reached - waiting 15 sec before repeating request"
-        ]
+        EXPECTED_MESSAGE_START = "rate limit reached - waiting"
 
-        assert all(message in EXPECTED_MESSAGES for message in caplog.messages)
+        assert all(
+            message.startswith(EXPECTED_MESSAGE_START) for message in caplog.messages
+        )
+
+
+class TestRateLimiter:
+    """Test for rate limits - does not require a ChurchTools connection."""
+
+    def test_rate_limiter_token_bucket(self) -> None:
+        """Checks that the token bucket allows a burst and then limits the rate."""
+        REQUESTS_PER_SECOND = 20
+        BURST = 5
+        rate_limiter = RateLimiter(requests_per_second=REQUESTS_PER_SECOND, burst=BURST)
+
+        start = monotonic()
+        for _i in range(BURST):
+            rate_limiter.acquire()
+        assert monotonic() - start < 1 / REQUESTS_PER_SECOND
+
+        for _i in range(REQUESTS_PER_SECOND):
+            rate_limiter.acquire()
+        assert monotonic() - start >= (REQUESTS_PER_SECOND - 1) / REQUESTS_PER_SECOND
+
+    def test_rate_limiter_adaptive_rate(self) -> None:
+        """Checks that the rate is reduced on rate limit and increased again."""
+        REQUESTS_PER_SECOND = 10
+        rate_limiter = RateLimiter(requests_per_second=REQUESTS_PER_SECOND)
+
+        rate_limiter.on_rate_limited()
+        assert rate_limiter.rate == REQUESTS_PER_SECOND / 2
+
+        for _i in range(100):
+            rate_limiter.on_success()
+        assert rate_limiter.rate == REQUESTS_PER_SECOND
+
+    def test_retry_delay(self) -> None:
+        """Checks Retry-After is respected and backoff is used otherwise."""
+        RETRY_AFTER = 3
+        session = RateLimitedSession(backoff_base=2, backoff_max=10)
+
+        response = requests.Response()
+        response.status_code = requests.codes.too_many_requests
+        response.headers["Retry-After"] = str(RETRY_AFTER)
+        assert session._get_retry_delay(response=response, attempt=0) == RETRY_AFTER  # noqa: SLF001
+
+        response.headers.pop("Retry-After")
+        EXPECTED_RANGES = {0: (1, 2), 1: (2, 4), 5: (5, 10)}
+        for attempt, (minimum, maximum) in EXPECTED_RANGES.items():
+            delay = session._get_retry_delay(response=response, attempt=attempt)  # noqa: SLF001
+            assert minimum <= delay <= maximum
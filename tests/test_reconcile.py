@@ -0,0 +1,75 @@
+"""module test group member reconciliation using the offline mock server."""
+
+import json
+import logging
+import logging.config
+from pathlib import Path
+
+from churchtools_api.churchtools_api import ChurchToolsApi
+from tests.mockserver import MOCK_TOKEN, MockChurchToolsServer
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+SAMPLE_GROUP_ID = 2  # members 1, 11, ... 81 with role 8 and field 1
+
+
+class TestReconcileGroupMembers:
+    """Test for reconcile_group_members - does not require a ChurchTools connection."""
+
+    def test_reconcile_group_members(self) -> None:
+        """Checks that only the delta is applied and reported."""
+        desired = {
+            1: {},
+            11: {"grouptype_role_id": 9},
+            21: {"fields": {1: "changed"}},
+            31: {"grouptype_role_id": 8, "fields": {"1": "value 31"}},
+            500: {"grouptype_role_id": 9},
+        }
+        expected_summary = {
+            "added": [500],
+            "updated": [11, 21],
+            "removed": [41, 51, 61, 71, 81],
+            "unchanged": 2,
+            "failed": [],
+        }
+        with MockChurchToolsServer(group_members=90) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN, max_workers=4)
+
+            request_count = server.request_count
+            summary = api.reconcile_group_members(
+                SAMPLE_GROUP_ID, desired, dry_run=True
+            )
+            assert summary == expected_summary
+            assert server.request_count - request_count == 1
+
+            summary = api.reconcile_group_members(SAMPLE_GROUP_ID, desired)
+            assert summary == expected_summary
+
+            members = {
+                member["personId"]: member
+                for member in api.get_group_members(group_id=SAMPLE_GROUP_ID)
+            }
+            assert sorted(members) == sorted(desired)
+            assert members[11]["groupTypeRoleId"] == 9  # noqa: PLR2004
+            assert members[21]["fields"] == [{"id": 1, "value": "changed"}]
+            assert members[500]["groupTypeRoleId"] == 9  # noqa: PLR2004
+
+            summary = api.reconcile_group_members(SAMPLE_GROUP_ID, desired)
+            assert summary["unchanged"] == len(desired)
+
+            summary = api.reconcile_group_members(SAMPLE_GROUP_ID, [1, 2], remove=False)
+            assert summary == {
+                "added": [2],
+                "updated": [],
+                "removed": [],
+                "unchanged": 1,
+                "failed": [],
+            }
@@ -0,0 +1,77 @@
+"""module test compact record types using the offline mock server."""
+
+import json
+import logging
+import logging.config
+from pathlib import Path
+
+import pytest
+
+from churchtools_api.churchtools_api import ChurchToolsApi
+from churchtools_api.records import BookingRecord, PersonRecord
+from tests.mockserver import MOCK_TOKEN, MockChurchToolsServer
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+
+class TestRecords:
+    """Test for records - does not require a ChurchTools connection."""
+
+    def test_record(self) -> None:
+        """Checks attribute and dict style access of a record."""
+        booking = {
+            "id": 12,
+            "base": {"appointmentId": 3, "resource": {"id": 8}},
+            "calculated": {"startDate": "2024-01-01T10:00:00Z"},
+        }
+        record = BookingRecord.from_dict(booking)
+
+        assert record.id == booking["id"]
+        assert record["base"]["resource"]["id"] == booking["base"]["resource"]["id"]
+        assert record.calculated == booking["calculated"]
+        assert record.get("missing", "default") == "default"
+        assert "base" in record
+        assert record.to_dict() == booking
+        with pytest.raises(KeyError):
+            record["missing"]
+        with pytest.raises(AttributeError):
+            _ = record.missing
+
+        person = {"id": 1, "firstName": "Max", "email": None}
+        record = PersonRecord.from_dict(person)
+        assert record.first_name == record["firstName"] == "Max"
+        assert record.email is record.last_name is None
+        assert "email" in record
+        assert record.get("email", "default") is None
+        assert "lastName" not in record
+        assert record.get("lastName", "default") == "default"
+        with pytest.raises(KeyError):
+            record["lastName"]
+        assert record.to_dict() == person
+
+    def test_as_records(self) -> None:
+        """Checks that getters return records with the same content as dicts."""
+        with MockChurchToolsServer(persons=120, songs=60, group_members=90) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN, max_workers=2)
+
+            for getter in ("get_persons", "get_songs", "get_groups_members"):
+                dicts = getattr(api, getter)()
+                records = getattr(api, getter)(as_records=True)
+                assert [record.to_dict() for record in records] == dicts
+
+            persons = api.get_persons(ids=[3, 5], as_records=True, returnAsDict=True)
+            assert persons[5].last_name == "Last5"
+            assert persons[3]["meta"] == {"modifiedDate": "2024-01-01T00:00:00Z"}
+
+            members = api.get_groups_members(
+                group_ids=[1], grouptype_role_ids=[9], as_records=True
+            )
+            assert {member.group_type_role_id for member in members} == {9}
@@ -0,0 +1,104 @@
+"""module test local persons replica using the offline mock server."""
+
+import json
+import logging
+import logging.config
+from pathlib import Path
+
+from churchtools_api.churchtools_api import ChurchToolsApi
+from churchtools_api.replica import PersonsReplica
+from tests.mockserver import MOCK_TOKEN, MockChurchToolsServer
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+
+class TestPersonsReplica:
+    """Test for PersonsReplica - does not require a ChurchTools connection."""
+
+    def test_refresh(self, tmp_path: Path) -> None:
+        """Checks that only changed persons are written and removed ones deleted."""
+        expected_persons = 120
+        with MockChurchToolsServer(persons=expected_persons) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN)
+            with PersonsReplica(api, tmp_path / "persons.sqlite") as replica:
+                summary = replica.refresh()
+                assert summary == {
+                    "inserted": expected_persons,
+                    "updated": 0,
+                    "unchanged": 0,
+                    "deleted": 0,
+                }
+
+                persons = server.fixtures["persons"]
+                persons[0]["meta"]["modifiedDate"] = "2024-02-01T00:00:00Z"
+                persons[0]["lastName"] = "Changed"
+                del persons[1]["meta"]  # falls back to hash
+                persons[2]["email"] = "changed@example.com"
+                del persons[2]["meta"]
+                persons.pop()
+
+                summary = replica.refresh()
+                assert summary == {
+                    "inserted": 0,
+                    "updated": 3,
+                    "unchanged": expected_persons - 4,
+                    "deleted": 1,
+                }
+                assert replica.refresh(max_age=3600)["unchanged"] == 0
+
+                assert len(replica) == expected_persons - 1
+                assert replica.get(1)["lastName"] == "Changed"
+                assert replica.get(expected_persons) is None
+
+    def test_find(self) -> None:
+        """Checks local queries by id, email, name and status."""
+        with MockChurchToolsServer(persons=30) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN)
+            with PersonsReplica(api, ":memory:") as replica:
+                replica.refresh()
+                request_count = server.request_count
+
+                assert replica.get(5)["email"] == "person5@example.com"
+                assert [
+                    person["id"] for person in replica.find(email="PERSON7@example.com")
+                ] == [7]
+                assert [
+                    person["id"]
+                    for person in replica.find(first_name="first9", last_name="Last9")
+                ] == [9]
+                assert [person["id"] for person in replica.find(status_id=0)] == list(
+                    range(3, 31, 3)
+                )
+                assert len(replica.find()) == 30  # noqa: PLR2004
+
+                assert server.request_count == request_count
+
+    def test_refresh_failed(self) -> None:
+        """Checks that a failed request neither deletes persons nor stamps refresh."""
+        expected_persons = 120
+        with MockChurchToolsServer(persons=expected_persons) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN)
+            with PersonsReplica(api, ":memory:") as replica:
+                replica.refresh()
+                last_refresh = replica.last_refresh
+
+                server.inject_errors(count=1, status=500)
+                assert replica.refresh() is None
+                assert len(replica) == expected_persons
+                assert replica.last_refresh == last_refresh
+
+                server.inject_errors(count=1, status=500, after=1)  # second page
+                assert replica.refresh() is None
+                assert len(replica) == expected_persons
+                assert replica.last_refresh == last_refresh
+
+                server.fixtures["persons"].pop()
+                assert replica.refresh()["deleted"] == 1
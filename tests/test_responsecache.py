@@ -0,0 +1,96 @@
+"""module test conditional requests using the response cache."""
+
+import json
+import logging
+import logging.config
+from pathlib import Path
+
+import requests
+from requests.adapters import BaseAdapter
+
+from churchtools_api.ratelimitedsession import RateLimitedSession
+from churchtools_api.responsecache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+SAMPLE_BODY = b'{"data": {"id": 1, "name": "sample"}}'
+SAMPLE_ETAG = '"v1"'
+
+
+class EtagAdapter(BaseAdapter):
+    """Transport adapter simulating a server which supports ETags."""
+
+    def __init__(self) -> None:
+        """Init with empty list of received requests."""
+        super().__init__()
+        self.requests = []
+
+    def send(
+        self, request: requests.PreparedRequest, **_kwargs: dict
+    ) -> requests.Response:
+        """Responds 304 if the ETag matches otherwise the sample body."""
+        self.requests.append(request)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if request.headers.get("If-None-Match") == SAMPLE_ETAG:
+            response.status_code = requests.codes.not_modified
+            response._content = b""  # noqa: SLF001
+        else:
+            response.status_code = requests.codes.ok
+            response.headers["ETag"] = SAMPLE_ETAG
+            response.headers["Content-Type"] = "application/json"
+            response._content = SAMPLE_BODY  # noqa: SLF001
+        return response
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+
+class TestResponseCache:
+    """Test for conditional requests - does not require a ChurchTools connection."""
+
+    def test_conditional_request(self, tmp_path: Path) -> None:
+        """Checks that a 304 response is replaced by the stored response."""
+        adapter = EtagAdapter()
+        session = RateLimitedSession(response_cache=ResponseCache(tmp_path))
+        session.mount("https://", adapter)
+
+        url = "https://sample.church.tools/api/songs/1"
+        first = session.get(url=url, params={"limit": 50})
+        second = session.get(url=url, params={"limit": 50})
+
+        assert first.content == second.content == SAMPLE_BODY
+        assert second.status_code == requests.codes.ok
+        assert second.headers["Content-Type"] == "application/json"
+        assert "If-None-Match" not in adapter.requests[0].headers
+        assert adapter.requests[1].headers["If-None-Match"] == SAMPLE_ETAG
+
+        other = session.get(url=url, params={"limit": 10})
+        assert "If-None-Match" not in adapter.requests[2].headers
+        assert other.content == SAMPLE_BODY
+
+    def test_eviction(self, tmp_path: Path) -> None:
+        """Checks that least recently used responses are removed when full."""
+        adapter = EtagAdapter()
+        response_cache = ResponseCache(tmp_path, max_bytes=len(SAMPLE_BODY) * 2)
+        session = RateLimitedSession(response_cache=response_cache)
+        session.mount("https://", adapter)
+
+        for song_id in range(3):
+            session.get(url=f"https://sample.church.tools/api/songs/{song_id}")
+
+        EXPECTED_NUMBER_OF_STORED_RESPONSES = 2
+        assert (
+            len(list(tmp_path.glob("*.body"))) == EXPECTED_NUMBER_OF_STORED_RESPONSES
+        )
+        first_url = "https://sample.church.tools/api/songs/0"
+        assert response_cache.get(method="GET", url=first_url) is None
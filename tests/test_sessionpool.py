@@ -0,0 +1,107 @@
+"""module test sharing one login with multiple threads."""
+
+import json
+import logging
+import logging.config
+import threading
+from pathlib import Path
+
+from churchtools_api.churchtools_api import ChurchToolsApi
+from churchtools_api.sessionpool import SessionPool
+from tests.mockserver import MOCK_TOKEN, MockChurchToolsServer
+
+logger = logging.getLogger(__name__)
+
+config_file = Path("logging_config.json")
+with config_file.open(encoding="utf-8") as f_in:
+    logging_config = json.load(f_in)
+    log_directory = Path(logging_config["handlers"]["file"]["filename"]).parent
+    if not log_directory.exists():
+        log_directory.mkdir(parents=True)
+    logging.config.dictConfig(config=logging_config)
+
+
+class TestSessionPool:
+    """Test for session pools - does not require a ChurchTools connection."""
+
+    def test_session_per_thread(self) -> None:
+        """Checks that each thread uses its own session sharing the login."""
+        with MockChurchToolsServer(persons=50) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN, max_workers=4)
+            template = api.session
+            pool = api.enable_session_pool()
+            assert isinstance(api.session, SessionPool)
+            assert api.enable_session_pool() is pool
+            request_count = server.request_count
+
+            sessions = {}
+
+            def get_person(person_id: int) -> list[dict]:
+                sessions[threading.get_ident()] = pool.session
+                return api.get_persons(ids=[person_id])
+
+            EXPECTED_PERSONS = 20
+            result = api._map_concurrently(  # noqa: SLF001
+                get_person, range(1, EXPECTED_PERSONS + 1)
+            )
+
+        assert [persons[0]["id"] for persons in result] == list(
+            range(1, EXPECTED_PERSONS + 1)
+        )
+        assert server.request_count - request_count == EXPECTED_PERSONS
+        assert len(set(map(id, sessions.values()))) == len(sessions) > 1
+        for session in sessions.values():
+            assert session is not template
+            assert session.rate_limiter is template.rate_limiter
+            assert session.headers["CSRF-Token"] == "mock-csrf-token"
+        pool.close()
+
+    def test_expired_login(self) -> None:
+        """Checks that all threads continue after the login expired."""
+        with MockChurchToolsServer(persons=200, require_login=True) as server:
+            api = ChurchToolsApi(domain=server.url, ct_token=MOCK_TOKEN, max_workers=4)
+            pool = api.enable_session_pool()
+            server.expire_sessions()
+            login_count = server.login_count
+
+            EXPECTED_PERSONS = 200
+            result = api._map_concurrently(  # noqa: SLF001
+                lambda _i: api.get_persons(), range(8)
+            )
+
+        assert [len(persons) for persons in result] == [EXPECTED_PERSONS] * 8
+        assert server.login_count - login_count == 1
+        pool.close()
+
+    def test_sessions_reused(self) -> None:
+        """Checks that sessions of finished threads are reused by new threads."""
+        MAX_WORKERS = 4
+        with MockChurchToolsServer(persons=200) as server:
+            api = ChurchToolsApi(
+                domain=server.url, ct_token=MOCK_TOKEN, max_workers=MAX_WORKERS
+            )
+            pool = api.enable_session_pool()
+            for _ in range(20):
+                assert len(api.get_persons()) == 200  # noqa: PLR2004
+
+        # one session of the main thread and one per pagination thread
+        assert len(pool._sessions) <= MAX_WORKERS + 1  # noqa: SLF001
+        pool.close()
+
+    def test_request_coalescing(self) -> None:
+        """Checks that identical requests of different threads are only sent once."""
+        CONCURRENT_REQUESTS = 8
+        with MockChurchToolsServer(require_login=True) as server:
+            api = ChurchToolsApi(
+                domain=server.url, ct_token=MOCK_TOKEN, max_workers=CONCURRENT_REQUESTS
+            )
+            pool = api.enable_session_pool()
+            request_count = server.request_count
+            server.latency = 0.2
+            songs = api._map_concurrently(  # noqa: SLF001
+                lambda _i: api.get_songs(song_id=1), range(CONCURRENT_REQUESTS)
+            )
+
+        assert server.request_count - request_count == 1
+        assert all(song == songs[0] for song in songs)
+        pool.close()
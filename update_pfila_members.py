@@ -132,22 +132,11 @@ def get_auto_insert_member(api: ChurchToolsApi, group_id: int) -> list:
     return  [member["personId"] for member in members if member["comment"] == "Auto Insert"]
 
 
-def update_child_members(api: ChurchToolsApi, group_id: int, pfila_members: list[dict]) -> None:
-    for member in pfila_members:
-        logging.info("Updating Child Members: " + member["person"]["title"])
-        id_mapping = CHILD_FIELDS[group_id]
-        fields = {
-            id_mapping[PFILA_FIELDS[item["id"]]]: item["value"]
-            for item in member["fields"] if item["id"] in PFILA_FIELDS.keys()
-        }
-        api.update_group_member(
-            group_id=group_id,
-            member_id=member["personId"],
-            data={
-                "comment": "Updated over API",
-                "fields": fields,
-            },
-        )
+def get_field_mapping(group_id: int) -> dict:
+    return {
+        source_field_id: CHILD_FIELDS[group_id][field_name]
+        for source_field_id, field_name in PFILA_FIELDS.items()
+    }
 
 
 if __name__ == '__main__':
@@ -157,15 +146,20 @@ if __name__ == '__main__':
     # Create Session
     from secure.config import ct_token
     from secure.config import ct_domain
-    api = ChurchToolsApi(ct_domain, ct_token=ct_token)
+    api = ChurchToolsApi(ct_domain, ct_token=ct_token, max_workers=4)
     pfila_members = api.get_group_members(group_id=PFILA_ID)
     
     # for each child group
     for group_id in CHILD_FIELDS.keys():
         # check if there is a member with comment "Auto Insert" and get them
         member_ids = get_auto_insert_member(api=api, group_id=group_id)
-        # get pfila members where in member_ids
-        filtered_pfila_members = [member for member in pfila_members if member["personId"] in member_ids]
-        # update the values of the member in the child group
-        update_child_members(api=api, group_id=group_id,pfila_members=filtered_pfila_members)
+        # update the changed values of these members in the child group
+        api.sync_group_member_fields(
+            source_group_id=PFILA_ID,
+            target_group_id=group_id,
+            field_mapping=get_field_mapping(group_id=group_id),
+            person_ids=member_ids,
+            source_members=pfila_members,
+            data={"comment": "Updated over API"},
+        )
     logging.info("All Child Members are Updated Successfully")